@@ -1,6 +1,6 @@
 {
     'name': 'Sunrise Hotel Management System',
-    'version': '1.0',
+    'version': '1.1',
     'summary': '',
     'category': 'Hotel',
     'author': 'Almustafa',
@@ -16,15 +16,21 @@
         "contacts",   
         "product",    
         "mail",
+        "bus",
     ],
     'data': [
     "security/security.xml",
     "security/ir.model.access.csv",
     "data/sequences.xml",
+    "data/product_data.xml",
+    "data/hotel_room_night_cron.xml",
+    "data/hotel_room_cron.xml",
     "views/hotel_room_views.xml",
+    "views/hotel_rate_plan_views.xml",
     "views/hotel_reservation_views.xml",
     "views/hotel_reservation_calendar_view.xml",
     "views/hotel_availability_views.xml",
+    "views/hotel_reservation_import_views.xml",
     "views/hotel_housekeeping_views.xml",
     "data/hotel_housekeeping_cron.xml",
     "views/hotel_maintenance_views.xml",
@@ -34,8 +40,25 @@
     "views/hotel_event_booking_calendar_view.xml",
     "views/hotel_event_availability_views.xml",
     "views/res_partner_views.xml",
+    "views/res_company_views.xml",
+    "data/hotel_tracking_cron.xml",
+    "views/hotel_channel_views.xml",
+    "data/hotel_channel_cron.xml",
+    "views/hotel_room_inventory_views.xml",
+    "data/hotel_room_inventory_cron.xml",
+    "data/hotel_archive_cron.xml",
+    "views/hotel_dashboard_views.xml",
+    "views/hotel_room_board_views.xml",
+    "report/hotel_occupancy_report_views.xml",
+    "report/hotel_event_hall_utilization_report_views.xml",
     "views/menus.xml",
     ],
+    'assets': {
+        'web.assets_backend': [
+            'custom_hotel_management/static/src/dashboard/*',
+            'custom_hotel_management/static/src/room_board/*',
+        ],
+    },
     'demo': [
         "demo/demo_data.xml",
     ],
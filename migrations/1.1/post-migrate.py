@@ -0,0 +1,7 @@
+from odoo import api, SUPERUSER_ID
+
+
+def migrate(cr, version):
+    # statuses stored by 1.0 marked rooms with any future confirmed stay as occupied
+    env = api.Environment(cr, SUPERUSER_ID, {})
+    env['hotel.room']._rebuild_statuses()
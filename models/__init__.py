@@ -1,7 +1,22 @@
+from . import ir_sequence
+from . import hotel_invoicing
 from . import hotel_event
 from . import hotel_guests
 from . import hotel_housekeeping
 from . import hotel_reservation
 from . import hotel_room
 from . import hotel_maintenance
-from . import hotel_housekeeping_maintenance_bridge
\ No newline at end of file
+from . import hotel_housekeeping_maintenance_bridge
+from . import hotel_room_night
+
+from . import hotel_availability
+from . import hotel_room_assignment
+from . import hotel_room_inventory
+from . import hotel_rate_plan
+from . import hotel_event_hall_slot
+from . import hotel_dashboard
+from . import hotel_room_bus
+from . import hotel_reservation_import
+from . import hotel_channel_manager
+from . import hotel_archive
+from . import hotel_tracking
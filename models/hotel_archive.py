@@ -0,0 +1,122 @@
+import logging
+from datetime import timedelta
+
+from odoo import models, fields, api
+from odoo.tools import sql
+
+_logger = logging.getLogger(__name__)
+
+# Closed records older than this many days leave the working set (0 disables archiving).
+ARCHIVE_AFTER_DAYS_PARAM = 'custom_hotel_management.archive_after_days'
+ARCHIVE_AFTER_DAYS = 365
+
+
+class HotelArchiveMixin(models.AbstractModel):
+    """History archiving for high-volume hotel models.
+
+    Closed records older than the configured age get ``active = False``, so
+    default searches, list views and scans only touch the live working set,
+    served by partial indexes ``WHERE active``. Nothing is deleted or moved:
+    invoices, chatter and reports keep pointing at the same rows, and the
+    "Archived" filter brings them back.
+    """
+    _name = 'hotel.archive.mixin'
+    _description = 'Hotel History Archiving'
+
+    # SQL predicate (alias ``r``) selecting closed records older than %(cutoff)s
+    _hotel_archive_where = None
+    # (name, expressions) of the index of the working set, rebuilt partial on active
+    _hotel_active_index = None
+
+    active = fields.Boolean(default=True)
+
+    def _create_active_index(self):
+        name, expressions = self._hotel_active_index
+        if not sql.index_exists(self.env.cr, name):
+            sql.create_index(self.env.cr, name, self._table, expressions, where='active')
+
+    @api.model
+    def _archive_history(self, cutoff, batch_size, max_batches):
+        """Archive closed records older than ``cutoff``, ``batch_size`` rows per transaction."""
+        self.flush_model()
+        archived = 0
+        for _batch in range(max_batches):
+            self.env.cr.execute(f"""
+                UPDATE {self._table}
+                   SET active = false, write_date = now() AT TIME ZONE 'UTC', write_uid = %(uid)s
+                 WHERE id IN (
+                    SELECT r.id
+                      FROM {self._table} r
+                     WHERE r.active
+                       AND {self._hotel_archive_where}
+                     LIMIT %(limit)s
+                       FOR UPDATE SKIP LOCKED)
+            """, {'cutoff': cutoff, 'limit': batch_size, 'uid': self.env.uid})
+            count = self.env.cr.rowcount
+            archived += count
+            if not self.env.registry.in_test_mode():
+                self.env.cr.commit()
+            if count < batch_size:
+                break
+        self.invalidate_model(['active'])
+        return archived
+
+
+class HotelReservation(models.Model):
+    _inherit = ['hotel.reservation', 'hotel.archive.mixin']
+
+    # paid or cancelled stays only: unpaid ones stay in front of the desk
+    _hotel_archive_where = """
+        r.check_out < %(cutoff)s
+        AND (r.status = 'cancelled' OR (r.status = 'checked_out' AND r.payment_status = 'paid'))
+    """
+    _hotel_active_index = ('hotel_reservation_active_check_in_idx', ['check_in DESC', 'id DESC'])
+
+    def init(self):
+        super().init()
+        self._create_active_index()
+
+    @api.model
+    def cron_archive_history(self, batch_size=5000, max_batches=50):
+        """Archive old closed reservations, housekeeping and maintenance tasks.
+
+        The age comes from the ``custom_hotel_management.archive_after_days``
+        system parameter (365 days by default, 0 disables the job).
+        """
+        days = int(self.env['ir.config_parameter'].sudo().get_param(ARCHIVE_AFTER_DAYS_PARAM, ARCHIVE_AFTER_DAYS))
+        if days <= 0:
+            return 0
+        cutoff = fields.Datetime.now() - timedelta(days=days)
+        archived = 0
+        for model_name in ('hotel.reservation', 'hotel.housekeeping.task', 'hotel.maintenance.task'):
+            count = self.env[model_name].sudo()._archive_history(cutoff, batch_size, max_batches)
+            if count:
+                _logger.info("Archived %s %s record(s) closed before %s", count, model_name, cutoff)
+            archived += count
+        return archived
+
+
+class HotelHousekeepingTask(models.Model):
+    _inherit = ['hotel.housekeeping.task', 'hotel.archive.mixin']
+
+    _hotel_archive_where = "r.status = 'done' AND COALESCE(r.date_scheduled, r.write_date) < %(cutoff)s"
+    _hotel_active_index = ('hotel_housekeeping_task_active_scheduled_idx', ['date_scheduled', 'id'])
+
+    def init(self):
+        super().init()
+        self._create_active_index()
+
+
+class HotelMaintenanceTask(models.Model):
+    _inherit = ['hotel.maintenance.task', 'hotel.archive.mixin']
+
+    _hotel_archive_where = """
+        r.status IN ('done', 'cancelled')
+        AND COALESCE(r.date_scheduled, r.date_reported, r.write_date) < %(cutoff)s
+    """
+    _hotel_active_index = (
+        'hotel_maintenance_task_active_priority_idx', ['priority DESC', 'date_scheduled', 'id DESC'])
+
+    def init(self):
+        super().init()
+        self._create_active_index()
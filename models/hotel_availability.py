@@ -0,0 +1,203 @@
+import heapq
+from collections import Counter
+from datetime import timedelta
+
+from odoo import models, fields, api
+from odoo.exceptions import AccessError, UserError
+
+from .hotel_room_night import stay_nights_bounds
+
+
+class HotelRoom(models.Model):
+    _inherit = 'hotel.room'
+
+    @api.model
+    def get_availability_batch(self, queries):
+        """Answer many availability queries with a fixed number of SQL statements.
+
+        Each query is a dict with ``date_start`` and ``date_end`` (required) and
+        optional ``company_id``, ``room_type_id``, ``capacity_min``,
+        ``amenity_ids`` and ``max_price``, filtered exactly like the
+        availability wizard. Returns one dict per query, in order::
+
+            {'room_ids': [...], 'count': n,
+             'by_room_type': [{'room_type_id': id or False, 'count': n}, ...]}
+        """
+        self.check_access('read')
+        queries = [self._normalize_availability_query(q) for q in queries]
+        if not queries:
+            return []
+        company_ids = {q['company_id'] for q in queries}
+        self.flush_model(['company_id', 'room_type_id', 'price', 'amenities_ids', 'name'])
+        self.env['hotel.room.type'].flush_model(['capacity', 'default_price'])
+
+        # 1. every candidate room of the companies involved, with its filter attributes
+        self.env.cr.execute("""
+            SELECT r.id, r.company_id, r.room_type_id, r.price, t.capacity, t.default_price,
+                   COALESCE(array_agg(a.amenity_id) FILTER (WHERE a.amenity_id IS NOT NULL), '{}')
+              FROM hotel_room r
+              LEFT JOIN hotel_room_type t ON t.id = r.room_type_id
+              LEFT JOIN hotel_room_amenity_rel a ON a.room_id = r.id
+             WHERE r.company_id IN %s
+             GROUP BY r.id, t.id
+             ORDER BY r.name, r.id
+        """, [tuple(company_ids)])
+        rooms = self.env.cr.fetchall()
+
+        # 2. rooms with a booked night, per query window
+        self.env.cr.execute("""
+            SELECT q.idx, array_agg(DISTINCT n.room_id)
+              FROM unnest(%s::int[], %s::date[], %s::date[], %s::int[]) AS q(idx, first_night, stop_night, company_id)
+              JOIN hotel_room_night n
+                ON n.company_id = q.company_id
+               AND n.date >= q.first_night AND n.date < q.stop_night
+             GROUP BY q.idx
+        """, [
+            list(range(len(queries))),
+            [q['first_night'] for q in queries],
+            [q['stop_night'] for q in queries],
+            [q['company_id'] for q in queries],
+        ])
+        occupied = {idx: set(room_ids) for idx, room_ids in self.env.cr.fetchall()}
+
+        results = []
+        for idx, query in enumerate(queries):
+            busy = occupied.get(idx, set())
+            room_ids = []
+            by_type = Counter()
+            for room_id, company_id, type_id, price, capacity, default_price, amenity_ids in rooms:
+                if room_id in busy or not self._room_matches_query(
+                        query, company_id, type_id, price, capacity, default_price, amenity_ids):
+                    continue
+                room_ids.append(room_id)
+                by_type[type_id or False] += 1
+            results.append({
+                'room_ids': room_ids,
+                'count': len(room_ids),
+                'by_room_type': [{'room_type_id': t, 'count': c} for t, c in by_type.items()],
+            })
+        return results
+
+    @api.model
+    def _normalize_availability_query(self, query):
+        if not (query.get('date_start') and query.get('date_end')):
+            raise UserError("Each availability query needs a date_start and a date_end.")
+        company_id = query.get('company_id') or self.env.company.id
+        if company_id not in self.env.user.company_ids.ids:
+            raise AccessError("You cannot query availability for branch %s." % company_id)
+        first_night, stop_night = stay_nights_bounds(query['date_start'], query['date_end'])
+        return {
+            'company_id': company_id,
+            'first_night': first_night,
+            'stop_night': stop_night,
+            'room_type_id': query.get('room_type_id') or False,
+            'capacity_min': query.get('capacity_min') or 0,
+            'amenity_ids': set(query.get('amenity_ids') or ()),
+            'max_price': query.get('max_price') or 0.0,
+        }
+
+    @api.model
+    def _room_matches_query(self, query, company_id, type_id, price, capacity, default_price, amenity_ids):
+        """Same filtering rules as hotel.availability.wizard."""
+        if company_id != query['company_id']:
+            return False
+        if query['room_type_id'] and type_id != query['room_type_id']:
+            return False
+        if query['capacity_min'] and (capacity is None or capacity < query['capacity_min']):
+            return False
+        if query['max_price']:
+            max_price = query['max_price']
+            if not ((price is not None and price <= max_price)
+                    or (default_price is not None and default_price <= max_price)):
+                return False
+        if query['amenity_ids'] and not query['amenity_ids'].issubset(amenity_ids):
+            return False
+        return True
+
+
+def sweep_free_slots(busy, window_start, window_end, duration, setup, teardown, limit):
+    """Earliest opening of each gap of one hall, in a single pass.
+
+    ``busy`` are the (start, end) bookings of the hall sorted by start. An
+    event fits when its setup before and teardown after are free too. Yields
+    (start, end, gap_end) with ``gap_end`` the latest the event may end.
+    """
+    cursor = window_start
+    found = 0
+    for start, end in busy:
+        latest_end = min(start - teardown, window_end)
+        if cursor + duration <= latest_end:
+            yield cursor, cursor + duration, latest_end
+            found += 1
+            if found >= limit:
+                return
+        cursor = max(cursor, end + setup)
+        if cursor + duration > window_end:
+            return
+    if cursor + duration <= window_end:
+        yield cursor, cursor + duration, window_end
+
+
+class HotelEventHall(models.Model):
+    _inherit = 'hotel.event.hall'
+
+    @api.model
+    def find_free_slots(self, date_start, date_end, duration_hours, limit=10, setup_minutes=0, teardown_minutes=0,
+                        company_id=False, hall_type_id=False, capacity_min=0, domain=None):
+        """The next ``limit`` openings of ``duration_hours`` between ``date_start`` and ``date_end``.
+
+        Halls are filtered by branch (current one by default), hall type,
+        minimum capacity and an optional extra ``domain``. ``setup_minutes``
+        and ``teardown_minutes`` must be free before and after the event.
+        Only bookings intersecting the window are read, sorted per hall, and
+        each hall's gaps are swept once. Returns dicts sorted by start::
+
+            {'hall_id': id, 'start': datetime, 'end': datetime, 'gap_end': datetime}
+        """
+        # RPC callers pass strings
+        date_start = fields.Datetime.to_datetime(date_start)
+        date_end = fields.Datetime.to_datetime(date_end)
+        if not (date_start and date_end and duration_hours and duration_hours > 0):
+            raise UserError("A slot search needs a window and a positive duration.")
+        company_id = company_id or self.env.company.id
+        if company_id not in self.env.user.company_ids.ids:
+            raise AccessError("You cannot query availability for branch %s." % company_id)
+        duration = timedelta(hours=duration_hours)
+        setup = timedelta(minutes=setup_minutes or 0)
+        teardown = timedelta(minutes=teardown_minutes or 0)
+        if date_start + duration > date_end or limit <= 0:
+            return []
+
+        hall_domain = [('company_id', '=', company_id)]
+        if hall_type_id:
+            hall_domain.append(('hall_type_id', '=', hall_type_id))
+        if capacity_min:
+            hall_domain.append(('capacity', '>=', capacity_min))
+        hall_ids = self.search(hall_domain + list(domain or [])).ids
+        if not hall_ids:
+            return []
+
+        self.env['hotel.event.booking'].flush_model(['hall_id', 'event_date', 'event_end', 'status'])
+        # && on tsrange is served by the GiST hall range index
+        self.env.cr.execute("""
+            SELECT hall_id, event_date, event_end
+              FROM hotel_event_booking
+             WHERE hall_id IN %s
+               AND status <> 'cancelled'
+               AND tsrange(event_date, event_end) && tsrange(%s, %s)
+             ORDER BY hall_id, event_date
+        """, [tuple(hall_ids), date_start - setup, date_end + teardown])
+        busy = {hall_id: [] for hall_id in hall_ids}
+        for hall_id, start, end in self.env.cr.fetchall():
+            busy[hall_id].append((start, end))
+
+        slots = heapq.merge(*(
+            ((start, hall_id, end, gap_end)
+             for start, end, gap_end in sweep_free_slots(
+                 busy[hall_id], date_start, date_end, duration, setup, teardown, limit))
+            for hall_id in sorted(hall_ids)
+        ))
+        return [
+            {'hall_id': hall_id, 'start': start, 'end': end, 'gap_end': gap_end}
+            for start, hall_id, end, gap_end in heapq.nsmallest(limit, slots)
+        ]
@@ -0,0 +1,436 @@
+import logging
+from collections import defaultdict
+from datetime import timedelta
+
+from odoo import models, fields, api, tools
+from odoo.tools import sql
+
+from .hotel_room_night import stay_nights
+
+_logger = logging.getLogger(__name__)
+
+CHANNEL_PROVIDERS = [
+    ('fake', 'Local Simulator'),
+]
+CHANNEL_JOB_TYPES = [
+    ('push_availability', 'Push Availability & Rates'),
+    ('pull_bookings', 'Pull Bookings'),
+]
+MAX_JOB_ATTEMPTS = 8
+MAX_BACKOFF_MINUTES = 60
+
+# In-process stand-in for an OTA, per (dbname, connector_id): what it received and what it will hand out.
+_FAKE_OTA = defaultdict(lambda: {'availability': {}, 'bookings': []})
+
+
+class HotelChannelConnector(models.Model):
+    """Link to an OTA / channel manager.
+
+    Each provider implements ``_<provider>_push_availability(room_type, rows)``,
+    ``_<provider>_pull_bookings()`` (returns the bookings not acknowledged yet)
+    and ``_<provider>_ack_bookings(refs)``; the job worker dispatches on
+    ``provider``, so adding a channel only means adding a selection value and
+    those three methods. A booking is only acknowledged once its reservation
+    exists, so the channel hands it out again until then.
+    """
+    _name = 'hotel.channel.connector'
+    _description = 'Channel Manager Connector'
+    _order = 'name'
+    _check_company_auto = True
+
+    name = fields.Char(required=True)
+    active = fields.Boolean(default=True)
+    company_id = fields.Many2one(
+        'res.company', string="Branch", required=True, index=True,
+        default=lambda self: self.env.company, ondelete='cascade')
+    provider = fields.Selection(CHANNEL_PROVIDERS, string="Provider", required=True, default='fake')
+    push_days = fields.Integer(string="Days Pushed Ahead", default=365,
+                               help="Availability is never pushed beyond this horizon.")
+    last_pull = fields.Datetime(string="Last Booking Pull", readonly=True)
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        connectors = super().create(vals_list)
+        self.env.registry.clear_cache()
+        return connectors
+
+    def write(self, vals):
+        res = super().write(vals)
+        # last_pull is written on every cron run: only what _get_connector_ids reads drops the caches
+        if {'company_id', 'active'}.intersection(vals):
+            self.env.registry.clear_cache()
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        self.env.registry.clear_cache()
+        return res
+
+    @api.model
+    @tools.ormcache('company_id')
+    def _get_connector_ids(self, company_id):
+        return tuple(self.sudo().search([('company_id', '=', company_id)]).ids)
+
+    # ---------------------------------------------------------------------
+    # Provider dispatch
+    # ---------------------------------------------------------------------
+    def _push_availability(self, room_type, date_from, date_to):
+        self.ensure_one()
+        rows = self._availability_rows(room_type, date_from, date_to)
+        if rows:
+            getattr(self, '_%s_push_availability' % self.provider)(room_type, rows)
+
+    def _pull_bookings(self):
+        self.ensure_one()
+        bookings = getattr(self, '_%s_pull_bookings' % self.provider)()
+        self._ack_bookings(self._import_channel_bookings(bookings))
+        self.last_pull = fields.Datetime.now()
+
+    def _ack_bookings(self, refs):
+        self.ensure_one()
+        if refs:
+            getattr(self, '_%s_ack_bookings' % self.provider)(refs)
+
+    def _availability_rows(self, room_type, date_from, date_to):
+        """[{'date', 'available', 'price'}] for one room type, one row per night of the window."""
+        today = fields.Date.context_today(self)
+        date_from = max(date_from, today)
+        date_to = min(date_to, today + timedelta(days=self.push_days))
+        nights = stay_nights(date_from, date_to) if date_from < date_to else []
+        if not nights:
+            return []
+        total = self.env['hotel.room'].sudo().search_count(
+            [('company_id', '=', self.company_id.id), ('room_type_id', '=', room_type.id)])
+        self.env['hotel.room.night'].flush_model()
+        self.env.cr.execute("""
+            SELECT n.date, count(*)
+              FROM hotel_room_night n
+              JOIN hotel_room r ON r.id = n.room_id
+             WHERE r.company_id = %s AND r.room_type_id = %s
+               AND n.date >= %s AND n.date < %s
+             GROUP BY n.date
+        """, [self.company_id.id, room_type.id, date_from, date_to])
+        sold = dict(self.env.cr.fetchall())
+        prices = self.env['hotel.rate.plan']._resolve_nightly_prices(
+            room_type.id, 'standard', self.company_id.id, nights)
+        return [{
+            'date': fields.Date.to_string(night),
+            'available': max(total - sold.get(night, 0), 0),
+            'price': prices.get(night, room_type.default_price or 0.0),
+        } for night in nights]
+
+    def _import_channel_bookings(self, bookings):
+        """Create reservations for bookings pulled from the channel; returns the refs to acknowledge.
+
+        Each booking is a dict with ``ref``, ``room_type_id``, ``check_in``,
+        ``check_out``, ``guest_name`` and optional ``guest_email``. Known
+        bookings are acknowledged again; bookings that fail or find no room
+        are kept in the channel inbox for review and retried on every pull.
+        """
+        self.ensure_one()
+        if not bookings:
+            return []
+        Reservation = self.env['hotel.reservation'].sudo().with_company(self.company_id)._hotel_system_writer(self.company_id)
+        Inbox = self.env['hotel.channel.booking'].sudo()
+        known = set(Reservation.with_context(active_test=False).search([
+            ('channel_connector_id', '=', self.id),
+            ('channel_ref', 'in', [booking['ref'] for booking in bookings]),
+        ]).mapped('channel_ref'))
+        Room = self.env['hotel.room'].sudo()
+        acked = []
+        for booking in bookings:
+            if booking['ref'] in known:
+                acked.append(booking['ref'])
+                continue
+            check_in = fields.Datetime.to_datetime(booking['check_in'])
+            check_out = fields.Datetime.to_datetime(booking['check_out'])
+            candidates = Room.search([
+                ('company_id', '=', self.company_id.id), ('room_type_id', '=', booking['room_type_id'])])
+            occupied = self.env['hotel.room.night']._occupied_room_ids(candidates.ids, check_in, check_out)
+            room_id = Reservation._best_fit_room_id(
+                [room.id for room in candidates if room.id not in occupied], check_in, check_out)
+            if not room_id:
+                _logger.warning("Channel %s: no room left for booking %s", self.name, booking['ref'])
+                Inbox._record(self, booking, 'unplaced', "No room of this type is free for the stay.")
+                continue
+            try:
+                with self.env.cr.savepoint():
+                    reservation = Reservation.create({
+                        'guest_id': self._channel_guest(booking).id,
+                        'room_id': room_id,
+                        'check_in': check_in,
+                        'check_out': check_out,
+                        'status': 'confirmed',
+                        'booking_source': 'ota',
+                        'channel_connector_id': self.id,
+                        'channel_ref': booking['ref'],
+                    })
+            except Exception as e:
+                _logger.warning("Channel %s: booking %s not imported: %s", self.name, booking['ref'], e)
+                Inbox._record(self, booking, 'failed', str(e))
+            else:
+                Inbox._record(self, booking, 'imported', reservation=reservation)
+                acked.append(booking['ref'])
+        return acked
+
+    def _channel_guest(self, booking):
+        Partner = self.env['res.partner'].sudo()
+        guest = booking.get('guest_email') and Partner.search([('email', '=ilike', booking['guest_email'])], limit=1)
+        return guest or Partner.create({'name': booking['guest_name'], 'email': booking.get('guest_email')})
+
+    # ---------------------------------------------------------------------
+    # Local simulator
+    # ---------------------------------------------------------------------
+    def _fake_state(self):
+        return _FAKE_OTA[(self.env.cr.dbname, self.id)]
+
+    def _fake_push_availability(self, room_type, rows):
+        availability = self._fake_state()['availability']
+        for row in rows:
+            availability[(room_type.id, row['date'])] = row
+
+    def _fake_pull_bookings(self):
+        return list(self._fake_state()['bookings'])
+
+    def _fake_ack_bookings(self, refs):
+        state = self._fake_state()
+        refs = set(refs)
+        state['bookings'] = [booking for booking in state['bookings'] if booking['ref'] not in refs]
+
+    def _fake_queue_booking(self, booking):
+        """Simulate a guest booking on the OTA; it is imported by the next pull."""
+        self._fake_state()['bookings'].append(booking)
+
+    def action_sync_now(self):
+        self.env['hotel.channel.job']._enqueue_pull(self)
+        self.env.ref('custom_hotel_management.ir_cron_channel_jobs')._trigger()
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': 'Channel Manager',
+                'message': 'Synchronisation queued.',
+                'type': 'info',
+            },
+        }
+
+
+class HotelChannelJob(models.Model):
+    """Queue of channel-manager work, filled by front-desk transactions and drained by cron.
+
+    Enqueuing is a plain insert that never conflicts with other transactions;
+    coalescing happens in the worker, which merges every pending job of a
+    connector / room type into one push over the union of their windows.
+    """
+    _name = 'hotel.channel.job'
+    _description = 'Channel Manager Job'
+    _order = 'id desc'
+
+    connector_id = fields.Many2one('hotel.channel.connector', string="Connector", required=True, ondelete='cascade')
+    company_id = fields.Many2one(related='connector_id.company_id', store=True)
+    job_type = fields.Selection(CHANNEL_JOB_TYPES, string="Type", required=True)
+    room_type_id = fields.Many2one('hotel.room.type', string="Room Type", ondelete='cascade')
+    date_from = fields.Date(string="From")
+    date_to = fields.Date(string="To")
+    state = fields.Selection(
+        [('pending', 'Pending'), ('done', 'Done'), ('failed', 'Failed')],
+        string="State", required=True, default='pending')
+    attempts = fields.Integer(string="Attempts")
+    next_attempt = fields.Datetime(string="Next Attempt", required=True, default=fields.Datetime.now)
+    last_error = fields.Text(string="Last Error", readonly=True)
+
+    def init(self):
+        if not sql.index_exists(self.env.cr, 'hotel_channel_job_pending_idx'):
+            sql.create_index(
+                self.env.cr, 'hotel_channel_job_pending_idx', self._table,
+                ['next_attempt', 'id'], where="state = 'pending'")
+
+    @api.model
+    def _enqueue_push(self, windows):
+        """Queue availability pushes; ``windows`` maps (company_id, room_type_id) to (date_from, date_to)."""
+        vals_list = []
+        for (company_id, room_type_id), (date_from, date_to) in windows.items():
+            for connector_id in self.env['hotel.channel.connector']._get_connector_ids(company_id):
+                vals_list.append({
+                    'connector_id': connector_id,
+                    'job_type': 'push_availability',
+                    'room_type_id': room_type_id,
+                    'date_from': date_from,
+                    'date_to': date_to,
+                })
+        if vals_list:
+            self.sudo().create(vals_list)
+
+    @api.model
+    def _enqueue_pull(self, connectors):
+        self.sudo().create([{'connector_id': connector.id, 'job_type': 'pull_bookings'} for connector in connectors])
+
+    @api.model
+    def cron_process_jobs(self, batch_size=500, max_batches=20):
+        """Claim due jobs with SKIP LOCKED, coalesce them and run one call per group.
+
+        A failing group is retried with exponential back-off and given up
+        after MAX_JOB_ATTEMPTS. Every cron run also queues a booking pull per
+        connector, coalesced with any pull already waiting.
+        """
+        self._enqueue_pull(self.env['hotel.channel.connector'].search([]))
+        for _batch in range(max_batches):
+            self.flush_model()
+            self.env.cr.execute("""
+                SELECT id FROM hotel_channel_job
+                 WHERE state = 'pending' AND next_attempt <= (now() AT TIME ZONE 'UTC')
+                 ORDER BY next_attempt, id
+                 LIMIT %s
+                   FOR UPDATE SKIP LOCKED
+            """, [batch_size])
+            jobs = self.browse([row[0] for row in self.env.cr.fetchall()])
+            if not jobs:
+                break
+            groups = defaultdict(lambda: self.browse())
+            for job in jobs:
+                groups[job.connector_id, job.job_type, job.room_type_id] |= job
+            for (connector, job_type, room_type), group in groups.items():
+                group._run_group(connector, job_type, room_type)
+            if not self.env.registry.in_test_mode():
+                self.env.cr.commit()
+            self.env['ir.cron']._notify_progress(done=len(jobs), remaining=self.search_count(
+                [('state', '=', 'pending'), ('next_attempt', '<=', fields.Datetime.now())]))
+        self.search([('state', '=', 'done'), ('write_date', '<', fields.Datetime.now() - timedelta(days=7))]).unlink()
+
+    def _run_group(self, connector, job_type, room_type):
+        if not connector.active:
+            self.write({'state': 'failed', 'last_error': "Connector archived"})
+            return
+        try:
+            with self.env.cr.savepoint():
+                if job_type == 'push_availability':
+                    connector._push_availability(room_type, min(self.mapped('date_from')), max(self.mapped('date_to')))
+                else:
+                    connector._pull_bookings()
+        except Exception as e:
+            attempts = max(self.mapped('attempts')) + 1
+            _logger.warning("Channel job %s for %s failed (attempt %s): %s", job_type, connector.name, attempts, e)
+            self.write({
+                'attempts': attempts,
+                'last_error': str(e),
+                'state': 'failed' if attempts >= MAX_JOB_ATTEMPTS else 'pending',
+                'next_attempt': fields.Datetime.now() + timedelta(minutes=min(2 ** attempts, MAX_BACKOFF_MINUTES)),
+            })
+        else:
+            self.write({'state': 'done', 'last_error': False})
+
+    def action_retry(self):
+        self.write({'state': 'pending', 'attempts': 0, 'next_attempt': fields.Datetime.now()})
+
+
+class HotelChannelBooking(models.Model):
+    """Inbox of channel bookings that could not be imported (or were, after a retry).
+
+    The channel keeps handing out an unacknowledged booking, so every pull
+    retries it and updates its entry here; staff can also retry by hand once
+    a room was freed.
+    """
+    _name = 'hotel.channel.booking'
+    _description = 'Channel Booking'
+    _order = 'write_date desc, id desc'
+
+    connector_id = fields.Many2one('hotel.channel.connector', string="Connector", required=True, ondelete='cascade')
+    company_id = fields.Many2one(related='connector_id.company_id', store=True)
+    ref = fields.Char(string="Channel Reference", required=True, readonly=True)
+    room_type_id = fields.Many2one('hotel.room.type', string="Room Type", readonly=True)
+    check_in = fields.Datetime(string="Check In", readonly=True)
+    check_out = fields.Datetime(string="Check Out", readonly=True)
+    guest_name = fields.Char(string="Guest", readonly=True)
+    guest_email = fields.Char(string="Guest E-mail", readonly=True)
+    state = fields.Selection([
+        ('unplaced', 'No Room'),
+        ('failed', 'Failed'),
+        ('imported', 'Imported'),
+    ], string="State", required=True, readonly=True)
+    attempts = fields.Integer(string="Attempts", readonly=True)
+    last_error = fields.Text(string="Last Error", readonly=True)
+    reservation_id = fields.Many2one('hotel.reservation', string="Reservation", readonly=True, ondelete='set null')
+
+    _sql_constraints = [
+        ('connector_ref_uniq', 'unique(connector_id, ref)', "A channel booking is kept once per connector."),
+    ]
+
+    @api.model
+    def _record(self, connector, booking, state, error=False, reservation=None):
+        """Upsert the inbox entry of ``booking``; successful imports only update an existing entry."""
+        entry = self.search([('connector_id', '=', connector.id), ('ref', '=', booking['ref'])], limit=1)
+        if state == 'imported':
+            if entry:
+                entry.write({'state': state, 'last_error': False, 'reservation_id': reservation.id})
+            return entry
+        vals = {
+            'state': state,
+            'last_error': error,
+            'room_type_id': booking['room_type_id'],
+            'check_in': fields.Datetime.to_datetime(booking['check_in']),
+            'check_out': fields.Datetime.to_datetime(booking['check_out']),
+            'guest_name': booking['guest_name'],
+            'guest_email': booking.get('guest_email'),
+        }
+        if entry:
+            entry.write(dict(vals, attempts=entry.attempts + 1))
+            return entry
+        return self.create(dict(vals, connector_id=connector.id, ref=booking['ref'], attempts=1))
+
+    def _as_booking(self):
+        self.ensure_one()
+        return {
+            'ref': self.ref,
+            'room_type_id': self.room_type_id.id,
+            'check_in': self.check_in,
+            'check_out': self.check_out,
+            'guest_name': self.guest_name,
+            'guest_email': self.guest_email,
+        }
+
+    def action_retry(self):
+        for connector in self.connector_id:
+            entries = self.filtered(lambda entry: entry.connector_id == connector and entry.state != 'imported')
+            connector._ack_bookings(connector._import_channel_bookings([entry._as_booking() for entry in entries]))
+
+
+class HotelReservation(models.Model):
+    _inherit = 'hotel.reservation'
+
+    channel_connector_id = fields.Many2one(
+        'hotel.channel.connector', string="Channel", readonly=True, copy=False,
+        groups='custom_hotel_management.group_hotel_manager')
+    channel_ref = fields.Char(string="Channel Reference", readonly=True, copy=False, index='btree_not_null')
+
+    _CHANNEL_FIELDS = {'room_id', 'room_type_id', 'check_in', 'check_out', 'status'}
+
+    def _channel_windows(self):
+        """{(company_id, room_type_id): (first night, last check-out)} covered by these stays."""
+        windows = {}
+        for rec in self.sudo():
+            if not (rec.room_type_id and rec.check_in and rec.check_out):
+                continue
+            key = (rec.company_id.id, rec.room_type_id.id)
+            date_from, date_to = rec.check_in.date(), rec.check_out.date()
+            if key in windows:
+                date_from, date_to = min(date_from, windows[key][0]), max(date_to, windows[key][1])
+            windows[key] = (date_from, date_to)
+        return windows
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env['hotel.channel.job']._enqueue_push(records._channel_windows())
+        return records
+
+    def write(self, vals):
+        if not self._CHANNEL_FIELDS.intersection(vals):
+            return super().write(vals)
+        windows = self._channel_windows()
+        res = super().write(vals)
+        for key, (date_from, date_to) in self._channel_windows().items():
+            if key in windows:
+                date_from, date_to = min(date_from, windows[key][0]), max(date_to, windows[key][1])
+            windows[key] = (date_from, date_to)
+        self.env['hotel.channel.job']._enqueue_push(windows)
+        return res
@@ -0,0 +1,193 @@
+import time
+from datetime import datetime, time as dt_time, timedelta
+
+import pytz
+
+from odoo import models, fields, api
+
+# Front-desk snapshots, per worker: {(dbname, company_id, tz): (stamp, expires_at, counters)}
+_SNAPSHOTS = {}
+SNAPSHOT_TTL = 10  # seconds
+# Bumped after every commit that changes a counter; shared by all workers through the database.
+STAMP_SEQUENCE = 'hotel_dashboard_stamp_seq'
+
+
+class HotelDashboard(models.AbstractModel):
+    _name = 'hotel.dashboard'
+    _description = 'Front Desk Dashboard'
+
+    @api.model
+    def get_front_desk_snapshot(self, company_ids=None):
+        """All front-desk counters per branch in one round-trip.
+
+        Counters are computed with three grouped queries for every branch not
+        in the short-lived cache. Snapshots are keyed on a database stamp that
+        committed changes on reservations, rooms (recomputed statuses
+        included), housekeeping and maintenance tasks bump, so every worker
+        drops them at once and a rolled back change drops nothing.
+        """
+        companies = self.env.companies
+        if company_ids:
+            companies = companies.filtered(lambda c: c.id in company_ids)
+        tz = self.env.user.tz or 'UTC'
+        now = time.monotonic()
+        stamp = self._snapshot_stamp()
+        snapshots = {}
+        missing = []
+        for company in companies:
+            cached = _SNAPSHOTS.get((self.env.cr.dbname, company.id, tz))
+            if cached and cached[0] == stamp and cached[1] > now:
+                snapshots[company.id] = cached[2]
+            else:
+                missing.append(company.id)
+        if missing:
+            for company_id, counters in self._compute_snapshots(missing, tz).items():
+                _SNAPSHOTS[(self.env.cr.dbname, company_id, tz)] = (stamp, now + SNAPSHOT_TTL, counters)
+                snapshots[company_id] = counters
+        return [
+            dict(snapshots[company.id], company_id=company.id, company_name=company.name)
+            for company in companies
+        ]
+
+    @api.model
+    def _compute_snapshots(self, company_ids, tz):
+        # today's boundaries in the user's timezone, as naive UTC like the stored datetimes
+        local_tz = pytz.timezone(tz)
+        today = fields.Date.context_today(self.with_context(tz=tz))
+        day_start = local_tz.localize(datetime.combine(today, dt_time.min)).astimezone(pytz.utc).replace(tzinfo=None)
+        day_end = day_start + timedelta(days=1)
+
+        counters = {company_id: {
+            'arrivals': 0, 'departures': 0, 'in_house': 0,
+            'rooms_available': 0, 'rooms_occupied': 0, 'rooms_dirty': 0,
+            'rooms_cleaning': 0, 'rooms_maintenance': 0, 'housekeeping_open': 0,
+        } for company_id in company_ids}
+        ids = tuple(company_ids)
+        self.env['hotel.reservation'].flush_model(['company_id', 'status', 'check_in', 'check_out'])
+        self.env['hotel.room'].flush_model(['company_id', 'status'])
+        self.env['hotel.housekeeping.task'].flush_model(['company_id', 'status'])
+        cr = self.env.cr
+
+        cr.execute("""
+            SELECT company_id,
+                   count(*) FILTER (WHERE status = 'confirmed' AND check_in >= %(start)s AND check_in < %(end)s),
+                   count(*) FILTER (WHERE status IN ('confirmed', 'checked_in') AND check_out >= %(start)s AND check_out < %(end)s),
+                   count(*) FILTER (WHERE status = 'checked_in')
+              FROM hotel_reservation
+             WHERE company_id IN %(ids)s
+               AND status IN ('confirmed', 'checked_in')
+             GROUP BY company_id
+        """, {'start': day_start, 'end': day_end, 'ids': ids})
+        for company_id, arrivals, departures, in_house in cr.fetchall():
+            counters[company_id].update(arrivals=arrivals, departures=departures, in_house=in_house)
+
+        cr.execute("""
+            SELECT company_id, status, count(*)
+              FROM hotel_room
+             WHERE company_id IN %s AND status IS NOT NULL
+             GROUP BY company_id, status
+        """, [ids])
+        for company_id, status, count in cr.fetchall():
+            counters[company_id]['rooms_%s' % status] = count
+
+        cr.execute("""
+            SELECT company_id, count(*)
+              FROM hotel_housekeeping_task
+             WHERE company_id IN %s AND status IN ('pending', 'in_progress')
+             GROUP BY company_id
+        """, [ids])
+        for company_id, count in cr.fetchall():
+            counters[company_id]['housekeeping_open'] = count
+        return counters
+
+    def init(self):
+        self.env.cr.execute(f"CREATE SEQUENCE IF NOT EXISTS {STAMP_SEQUENCE}")
+
+    @api.model
+    def _snapshot_stamp(self):
+        # sequences are not transactional: a bump is seen by every worker as soon as it happens
+        self.env.cr.execute(f"SELECT last_value, is_called FROM {STAMP_SEQUENCE}")
+        return self.env.cr.fetchone()
+
+    @api.model
+    def _invalidate_snapshots(self):
+        """Bump the snapshot stamp once the current transaction commits."""
+        cr = self.env.cr
+        if cr.postcommit.data.get('hotel.dashboard.invalidate'):
+            return
+        cr.postcommit.data['hotel.dashboard.invalidate'] = True
+        registry = self.env.registry
+
+        @cr.postcommit.add
+        def bump_stamp():
+            with registry.cursor() as bump_cr:
+                bump_cr.execute(f"SELECT nextval('{STAMP_SEQUENCE}')")
+
+
+class HotelReservation(models.Model):
+    _inherit = 'hotel.reservation'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env['hotel.dashboard']._invalidate_snapshots()
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        if {'status', 'check_in', 'check_out', 'room_id'}.intersection(vals):
+            self.env['hotel.dashboard']._invalidate_snapshots()
+        return res
+
+
+class HotelHousekeepingTask(models.Model):
+    _inherit = 'hotel.housekeeping.task'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        tasks = super().create(vals_list)
+        self.env['hotel.dashboard']._invalidate_snapshots()
+        return tasks
+
+    def write(self, vals):
+        res = super().write(vals)
+        if 'status' in vals:
+            self.env['hotel.dashboard']._invalidate_snapshots()
+        return res
+
+
+class HotelMaintenanceTask(models.Model):
+    _inherit = 'hotel.maintenance.task'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        tasks = super().create(vals_list)
+        self.env['hotel.dashboard']._invalidate_snapshots()
+        return tasks
+
+    def write(self, vals):
+        res = super().write(vals)
+        if 'status' in vals:
+            self.env['hotel.dashboard']._invalidate_snapshots()
+        return res
+
+
+class HotelRoom(models.Model):
+    _inherit = 'hotel.room'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        rooms = super().create(vals_list)
+        self.env['hotel.dashboard']._invalidate_snapshots()
+        return rooms
+
+    def _compute_status(self):
+        # derived statuses are recomputed from reservations and tasks without going through write()
+        super()._compute_status()
+        self.env['hotel.dashboard']._invalidate_snapshots()
+
+    def write(self, vals):
+        res = super().write(vals)
+        if 'status' in vals:
+            self.env['hotel.dashboard']._invalidate_snapshots()
+        return res
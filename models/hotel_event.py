@@ -1,6 +1,12 @@
-from odoo import models, fields, api
+import logging
 from datetime import timedelta
-from odoo.exceptions import UserError
+
+from odoo import models, fields, api
+from odoo.tools import sql, split_every
+from odoo.exceptions import UserError, ValidationError
+
+_logger = logging.getLogger(__name__)
+
 class HotelEventAmenity(models.Model):
     _name = 'hotel.event.amenity'
     _description = 'Event Hall Amenity'
@@ -139,38 +145,89 @@ class HotelEventBooking(models.Model):
         required=True,
         default=lambda self: self.env.company.currency_id.id,
     )
-    @api.model
-    def create(self, vals):
-        rec = super().create(vals)
-        if rec.name in (False, "/"):
-            rec.name = self.env['ir.sequence'].next_by_code('hotel.reservation') or '/'
-        return rec
+    @api.model_create_multi
+    def create(self, vals_list):
+        unnamed = [vals for vals in vals_list if vals.get('name', '/') in (False, '/')]
+        names = self.env['ir.sequence']._next_by_code_batch('hotel.event.booking', len(unnamed))
+        for vals, name in zip(unnamed, names):
+            vals['name'] = name or '/'
+        return super().create(vals_list)
 
 
 class HotelEventBooking(models.Model):
     _inherit = "hotel.event.booking"
 
-    @api.constrains('hall_id', 'event_date', 'duration_hours')
-    def _check_overlap(self):
-        """Naive time overlap: [start, end) vs others on same hall."""
+    event_end = fields.Datetime(string='Event End', compute='_compute_event_end', store=True, index=True)
+
+    # checked before tsrange(event_date, event_end) is built for the hall range index
+    _sql_constraints = [
+        ('duration_positive', 'CHECK (duration_hours > 0)', "The event duration must be positive."),
+    ]
+
+    @api.model
+    def _check_duration_vals(self, vals_list):
+        # before the insert: tsrange(event_date, event_end) fails on an inverted range first
+        if any('duration_hours' in vals and (vals['duration_hours'] or 0) <= 0 for vals in vals_list):
+            raise ValidationError("The event duration must be positive.")
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        self._check_duration_vals(vals_list)
+        return super().create(vals_list)
+
+    def write(self, vals):
+        self._check_duration_vals([vals])
+        return super().write(vals)
+
+    @api.depends('event_date', 'duration_hours')
+    def _compute_event_end(self):
         for rec in self:
-            if not (rec.hall_id and rec.event_date and rec.duration_hours):
-                continue
-            start = rec.event_date
-            end = start + timedelta(hours=rec.duration_hours)
-
-            # quick shortlist: anything that starts before our end on the same hall
-            others = self.search([
-                ('id', '!=', rec.id),
-                ('hall_id', '=', rec.hall_id.id),
-                ('event_date', '<', end),
-            ])
-
-            for o in others:
-                o_end = (o.event_date or start) + timedelta(hours=o.duration_hours or 0)
-                # overlap if o.start < end AND start < o.end
-                if o.event_date and (o.event_date < end and start < o_end):
-                    raise models.ValidationError("Hall is already booked for that time window.")
+            if rec.event_date:
+                rec.event_end = rec.event_date + timedelta(hours=rec.duration_hours or 0.0)
+            else:
+                rec.event_end = False
+
+    def init(self):
+        """GiST range index backing the hall overlap check."""
+        cr = self.env.cr
+        index_name = 'hotel_event_booking_hall_range_idx'
+        if sql.index_exists(cr, index_name):
+            return
+        try:
+            with cr.savepoint(flush=False):
+                cr.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+        except Exception as e:
+            _logger.warning("Cannot create the btree_gist extension, %s not created: %s", index_name, e)
+            return
+        sql.create_index(
+            cr, index_name, self._table,
+            ['hall_id', 'tsrange(event_date, event_end)'],
+            method='gist', where="status <> 'cancelled'",
+        )
+
+    @api.constrains('hall_id', 'event_date', 'duration_hours', 'status')
+    def _check_overlap(self):
+        """[start, end) vs other live bookings on the same hall, one query per batch."""
+        self.flush_model(['hall_id', 'event_date', 'event_end', 'status'])
+        for batch in split_every(1000, self.ids):
+            self.env.cr.execute("""
+                SELECT b.id
+                  FROM hotel_event_booking b
+                 WHERE b.id IN %s
+                   AND b.status <> 'cancelled'
+                   AND b.duration_hours > 0
+                   AND EXISTS (
+                        SELECT 1
+                          FROM hotel_event_booking o
+                         WHERE o.hall_id = b.hall_id
+                           AND o.id <> b.id
+                           AND o.status <> 'cancelled'
+                           AND tsrange(o.event_date, o.event_end) && tsrange(b.event_date, b.event_end)
+                   )
+                 LIMIT 1
+            """, [tuple(batch)])
+            if self.env.cr.fetchone():
+                raise ValidationError("Hall is already booked for that time window.")
 
 class HotelEventHall(models.Model):
     _inherit = 'hotel.event.hall'
@@ -223,18 +280,25 @@ class HotelEventHall(models.Model):
         return res
 
 class HotelEventBooking(models.Model):
-    _inherit = 'hotel.event.booking'
+    _inherit = ['hotel.event.booking', 'hotel.invoice.mixin']
+    _hotel_invoice_link = 'hotel_event_booking_id'
 
     # link to account.move
     invoice_ids = fields.One2many('account.move', 'hotel_event_booking_id', string='Invoices')
     invoice_count = fields.Integer(compute='_compute_invoice_count', string='Invoices')
 
     def _compute_invoice_count(self):
-        for rec in self:
-            rec.invoice_count = self.env['account.move'].sudo().search_count([
-                ('hotel_event_booking_id', '=', rec.id),
+        # one grouped query for the whole page instead of a search_count per record
+        counts = dict(self.env['account.move'].sudo()._read_group(
+            domain=[
+                ('hotel_event_booking_id', 'in', self.ids),
                 ('move_type', 'in', ['out_invoice', 'out_refund']),
-            ])
+            ],
+            groupby=['hotel_event_booking_id'],
+            aggregates=['__count'],
+        ))
+        for rec in self:
+            rec.invoice_count = counts.get(rec, 0)
 
     def action_view_invoices(self):
         self.ensure_one()
@@ -249,22 +313,23 @@ class HotelEventBooking(models.Model):
         }
         return action
 
+    def _check_invoiceable(self):
+        errors = {}
+        for rec in self:
+            if not rec.customer_id:
+                errors[rec] = "Set a Customer before invoicing."
+        return errors
+
     def _get_sale_journal(self):
         self.ensure_one()
-        journal = self.env['account.journal'].search([
-            ('type', '=', 'sale'),
-            ('company_id', '=', self.company_id.id),
-            ('active', '=', True),
-        ], limit=1)
-        if not journal:
-            raise UserError(f"No Sales Journal found for company {self.company_id.display_name}.")
-        return journal
-
-    def _event_invoice_lines(self):
+        return self._invoice_journal(self.company_id)
+
+    def _event_invoice_lines(self, cache=None):
         """Build invoice lines:
         Priority: explicit total_amount > package price > hall price_per_hour * hours
         """
         self.ensure_one()
+        cache = {} if cache is None else cache
         # price logic
         if self.total_amount:
             unit_price = self.total_amount
@@ -280,12 +345,8 @@ class HotelEventBooking(models.Model):
             label = f"Hall {self.hall_id.display_name} — {qty:g} hour(s)"
 
         # optional product (helps taxes/fiscal position)
-        product = self.env['product.product'].search([('default_code', '=', 'EVENT_BOOKING')], limit=1)
-        partner = self.customer_id
-        taxes = product.taxes_id if product else self.env['account.tax']
-        taxes = taxes.filtered(lambda t: t.company_id == self.company_id)
-        if partner.property_account_position_id and taxes:
-            taxes = partner.property_account_position_id.map_tax(taxes)
+        product = self._invoice_product('EVENT_BOOKING', self.company_id)
+        taxes = self._invoice_taxes(cache, 'EVENT_BOOKING', self.company_id, self.customer_id)
 
         line_vals = {
             'name': label,
@@ -296,31 +357,25 @@ class HotelEventBooking(models.Model):
         }
         return [(0, 0, line_vals)]
 
-    def action_create_invoice(self):
+    def _prepare_invoice_vals(self, cache):
         self.ensure_one()
-        if not self.customer_id:
-            raise UserError("Set a Customer before invoicing.")
-        # block duplicates if a posted invoice already exists
-        exists = self.env['account.move'].search_count([
-            ('hotel_event_booking_id', '=', self.id),
-            ('move_type', '=', 'out_invoice'),
-            ('state', '=', 'posted'),
-        ])
-        if exists:
-            raise UserError("A posted invoice already exists for this event booking.")
-
-        move = self.env['account.move'].create({
+        return {
             'move_type': 'out_invoice',
             'partner_id': self.customer_id.id,
             'invoice_date': fields.Date.context_today(self),
             'invoice_origin': self.name,
-            'journal_id': self._get_sale_journal().id,
+            'journal_id': self._invoice_journal(self.company_id).id,
             'currency_id': self.currency_id.id,
             'company_id': self.company_id.id,
-            'invoice_line_ids': self._event_invoice_lines(),
+            'invoice_line_ids': self._event_invoice_lines(cache),
             'hotel_event_booking_id': self.id,
-        })
-        move.action_post()
+        }
+
+    def action_create_invoice(self):
+        self.ensure_one()
+        move, errors = self._create_invoices()
+        if errors:
+            raise UserError(errors[self])
         return {
             'type': 'ir.actions.act_window',
             'res_model': 'account.move',
@@ -0,0 +1,115 @@
+from odoo import models, fields, api
+from odoo.tools import sql
+
+
+class HotelEventHallSlot(models.Model):
+    """Hourly usage buckets of confirmed event bookings, kept in sync with the bookings."""
+    _name = 'hotel.event.hall.slot'
+    _description = 'Event Hall Hourly Usage'
+    _order = 'slot_start, hall_id'
+    _log_access = False
+
+    booking_id = fields.Many2one('hotel.event.booking', string="Booking", required=True, ondelete='cascade', index=True)
+    hall_id = fields.Many2one('hotel.event.hall', string="Hall", required=True, ondelete='cascade')
+    hall_type_id = fields.Many2one('hotel.event.hall.type', string="Hall Type", ondelete='set null')
+    company_id = fields.Many2one('res.company', string="Branch", required=True, ondelete='cascade')
+    slot_start = fields.Datetime(string="Hour", required=True)
+    booked_hours = fields.Float(string="Booked Hours")
+    revenue = fields.Float(string="Revenue")
+
+    def init(self):
+        cr = self.env.cr
+        if not sql.index_exists(cr, 'hotel_event_hall_slot_hall_start_idx'):
+            sql.create_index(cr, 'hotel_event_hall_slot_hall_start_idx', self._table, ['hall_id', 'slot_start'])
+        cr.execute("SELECT 1 FROM hotel_event_hall_slot LIMIT 1")
+        if not cr.fetchone():
+            cr.execute("SELECT id FROM hotel_event_booking WHERE status = 'confirmed'")
+            self._sync_bookings([row[0] for row in cr.fetchall()])
+
+    @api.model
+    def _sync_bookings(self, booking_ids):
+        """Rewrite the hourly buckets of the given bookings (set-based).
+
+        Booking revenue follows the invoicing priority (total amount > package
+        price > hall price per hour) and is spread pro rata over the hours.
+        """
+        if not booking_ids:
+            return
+        self.env['hotel.event.booking'].flush_model()
+        self.env['hotel.event.hall'].flush_model(['hall_type_id', 'price_per_hour'])
+        self.env['hotel.event.package'].flush_model(['price'])
+        ids = tuple(booking_ids)
+        self.env.cr.execute("DELETE FROM hotel_event_hall_slot WHERE booking_id IN %s", [ids])
+        self.env.cr.execute("""
+            INSERT INTO hotel_event_hall_slot
+                   (booking_id, hall_id, hall_type_id, company_id, slot_start, booked_hours, revenue)
+            SELECT b.id, b.hall_id, h.hall_type_id, b.company_id, s.slot, u.hours,
+                   rev.amount * u.hours / b.duration_hours
+              FROM hotel_event_booking b
+              JOIN hotel_event_hall h ON h.id = b.hall_id
+              LEFT JOIN hotel_event_package p ON p.id = b.package_id
+             CROSS JOIN LATERAL generate_series(
+                    date_trunc('hour', b.event_date),
+                    b.event_end - interval '1 microsecond',
+                    interval '1 hour'
+                ) AS s(slot)
+             CROSS JOIN LATERAL (
+                    SELECT EXTRACT(EPOCH FROM LEAST(b.event_end, s.slot + interval '1 hour')
+                                            - GREATEST(b.event_date, s.slot)) / 3600.0 AS hours
+                ) u
+             CROSS JOIN LATERAL (
+                    SELECT CASE
+                        WHEN b.total_amount > 0 THEN b.total_amount
+                        WHEN p.price > 0 THEN p.price
+                        ELSE COALESCE(h.price_per_hour, 0) * GREATEST(b.duration_hours, 1)
+                    END AS amount
+                ) rev
+             WHERE b.id IN %s
+               AND b.status = 'confirmed'
+               AND b.duration_hours > 0
+        """, [ids])
+        self.invalidate_model()
+
+
+class HotelEventBooking(models.Model):
+    _inherit = 'hotel.event.booking'
+
+    _HALL_SLOT_FIELDS = {'hall_id', 'event_date', 'duration_hours', 'status', 'total_amount', 'package_id'}
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        bookings = super().create(vals_list)
+        self.env['hotel.event.hall.slot']._sync_bookings(bookings.ids)
+        return bookings
+
+    def write(self, vals):
+        res = super().write(vals)
+        if self._HALL_SLOT_FIELDS.intersection(vals):
+            self.env['hotel.event.hall.slot']._sync_bookings(self.ids)
+        return res
+
+
+class HotelEventHall(models.Model):
+    _inherit = 'hotel.event.hall'
+
+    available_hours_per_day = fields.Float(
+        string="Bookable Hours / Day", default=24.0,
+        help="Hours per day the hall can be sold; denominator of the utilisation and revenue per available hour.")
+
+    def write(self, vals):
+        res = super().write(vals)
+        if {'hall_type_id', 'price_per_hour', 'company_id'}.intersection(vals):
+            bookings = self.env['hotel.event.booking'].sudo().search([('hall_id', 'in', self.ids), ('status', '=', 'confirmed')])
+            self.env['hotel.event.hall.slot']._sync_bookings(bookings.ids)
+        return res
+
+
+class HotelEventPackage(models.Model):
+    _inherit = 'hotel.event.package'
+
+    def write(self, vals):
+        res = super().write(vals)
+        if 'price' in vals:
+            bookings = self.env['hotel.event.booking'].sudo().search([('package_id', 'in', self.ids), ('status', '=', 'confirmed')])
+            self.env['hotel.event.hall.slot']._sync_bookings(bookings.ids)
+        return res
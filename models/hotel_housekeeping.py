@@ -1,4 +1,5 @@
 from odoo import models, fields,api
+from odoo.tools import sql
 from datetime import timedelta
 class HotelHousekeepingTask(models.Model):
     _name = 'hotel.housekeeping.task'
@@ -46,20 +47,10 @@ class HotelHousekeepingTask(models.Model):
         tracking=True
     )
     date_scheduled = fields.Datetime(string='Date Scheduled',index=True, tracking=True)
-class HotelHousekeepingTaskProgress(models.Model):
-    _inherit = 'hotel.housekeeping.task'
 
-    def write(self, vals):
-        res = super().write(vals)
-        if 'status' in vals:
-            for t in self:
-                room = t.room_id.sudo()
-                if not room:
-                    continue
-                if vals['status'] == 'in_progress':
-                    # Crew is in, mark room as cleaning
-                    room.write({'status': 'cleaning'})
-                elif vals['status'] == 'done':
-                    # All set — flip to available
-                    room.write({'status': 'available'})
-        return res
+    def init(self):
+        # open tasks of a room by schedule: the working set of the housekeeping board and crons
+        if not sql.index_exists(self.env.cr, 'hotel_housekeeping_task_open_room_idx'):
+            sql.create_index(
+                self.env.cr, 'hotel_housekeeping_task_open_room_idx', self._table,
+                ['room_id', 'date_scheduled'], where="status IN ('pending', 'in_progress')")
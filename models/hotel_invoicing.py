@@ -0,0 +1,255 @@
+import logging
+
+from odoo import models, api, tools
+from odoo.exceptions import UserError
+
+_logger = logging.getLogger(__name__)
+
+# Invoice line products: code -> (system parameter holding an external id, default external id).
+# Without the parameter, a product with that default_code is preferred over the shipped default,
+# so databases set up before the module shipped its products keep their own (taxed) products.
+INVOICE_PRODUCTS = {
+    'ROOM_NIGHT': ('custom_hotel_management.room_night_product', 'custom_hotel_management.product_room_night'),
+    'EVENT_BOOKING': ('custom_hotel_management.event_booking_product', 'custom_hotel_management.product_event_booking'),
+}
+
+
+class HotelInvoiceMixin(models.AbstractModel):
+    """Batch invoicing shared by reservations and event bookings.
+
+    Implementers provide ``_check_invoiceable`` and
+    ``_prepare_invoice_vals(cache)``. Journal and product/tax lookups are
+    cached in the registry per (company, code); fiscal position mappings go
+    through ``cache`` so a batch resolves each of them once.
+    """
+    _name = 'hotel.invoice.mixin'
+    _description = 'Hotel Batch Invoicing'
+
+    # account.move field linking an invoice back to its source record
+    _hotel_invoice_link = None
+
+    def _check_invoiceable(self):
+        """Return {record: error message} for records that cannot be invoiced."""
+        return {}
+
+    def _prepare_invoice_vals(self, cache):
+        raise NotImplementedError()
+
+    @api.model
+    @tools.ormcache('company_id')
+    def _get_sale_journal_id(self, company_id):
+        return self.env['account.journal'].sudo().search([
+            ('type', '=', 'sale'),
+            ('company_id', '=', company_id),
+            ('active', '=', True),
+        ], limit=1).id
+
+    @api.model
+    @tools.ormcache('company_id', 'code')
+    def _get_invoice_product_data(self, company_id, code):
+        """(product id, company tax ids) of the invoice product configured for ``code``."""
+        Product = self.env['product.product'].sudo()
+        param, default_xmlid = INVOICE_PRODUCTS[code]
+        xmlid = self.env['ir.config_parameter'].sudo().get_param(param)
+        product = self._invoice_product_by_xmlid(xmlid)
+        if not product:
+            # a product the operator set up (with its taxes) wins over the one shipped by the module
+            shipped = self._invoice_product_by_xmlid(default_xmlid)
+            product = Product.search([
+                ('default_code', '=', code),
+                ('company_id', 'in', [False, company_id]),
+                ('id', '!=', shipped.id),
+            ], limit=1) or shipped
+        product = product.sudo()
+        taxes = product.taxes_id.filtered(lambda t: t.company_id.id == company_id)
+        return product.id, tuple(taxes.ids)
+
+    @api.model
+    def _invoice_product_by_xmlid(self, xmlid):
+        record = self.env.ref(xmlid, raise_if_not_found=False) if xmlid else None
+        if record is None or record._name != 'product.product':
+            return self.env['product.product']
+        return record
+
+    @api.model
+    def _is_invoice_product(self, products):
+        """Whether any of ``products`` can be resolved as an invoice product, by code or external id."""
+        if any(product.default_code in INVOICE_PRODUCTS for product in products):
+            return True
+        get_param = self.env['ir.config_parameter'].sudo().get_param
+        for param, default_xmlid in INVOICE_PRODUCTS.values():
+            for xmlid in (get_param(param), default_xmlid):
+                if self._invoice_product_by_xmlid(xmlid) & products:
+                    return True
+        return False
+
+    def _invoice_journal(self, company):
+        journal = self.env['account.journal'].browse(self._get_sale_journal_id(company.id))
+        if not journal:
+            raise UserError("No Sales Journal found for company %s." % company.display_name)
+        return journal
+
+    def _invoice_product(self, code, company):
+        return self.env['product.product'].browse(self._get_invoice_product_data(company.id, code)[0])
+
+    def _invoice_taxes(self, cache, code, company, partner):
+        """Taxes of the ``code`` product for ``company``, mapped through the partner fiscal position."""
+        fpos = partner.property_account_position_id
+        taxes_cache = cache.setdefault('taxes', {})
+        key = (code, company.id, fpos.id)
+        if key not in taxes_cache:
+            taxes = self.env['account.tax'].browse(self._get_invoice_product_data(company.id, code)[1])
+            if fpos and taxes:
+                taxes = fpos.map_tax(taxes)
+            taxes_cache[key] = taxes
+        return taxes_cache[key]
+
+    def _hotel_invoiced(self):
+        """Records of ``self`` that already have a posted customer invoice."""
+        link = self._hotel_invoice_link
+        return self.browse(record.id for [record] in self.env['account.move'].sudo()._read_group(
+            domain=[
+                (link, 'in', self.ids),
+                ('move_type', '=', 'out_invoice'),
+                ('state', '=', 'posted'),
+            ],
+            groupby=[link],
+        ))
+
+    def _create_invoices(self, skip_invoiced=True):
+        """Create and post one invoice per record in batch.
+
+        Returns ``(moves, errors)`` where ``moves`` are the posted invoices and
+        ``errors`` maps each failed record to a message; one bad record never
+        aborts the rest of the batch. With ``skip_invoiced``, records that
+        already have a posted invoice are skipped, and an invoice that cannot
+        be posted is rolled back with its record, so re-running a batch never
+        duplicates an invoice.
+        """
+        invoiced = self._hotel_invoiced() if skip_invoiced else self.browse()
+        errors = dict.fromkeys(invoiced, "A posted invoice already exists for this record.")
+        errors.update((self - invoiced)._check_invoiceable())
+        cache = {}
+        vals_by_rec = {}
+        for rec in self:
+            if rec in errors:
+                continue
+            try:
+                vals_by_rec[rec] = rec._prepare_invoice_vals(cache)
+            except UserError as e:
+                errors[rec] = str(e)
+
+        Move = self.env['account.move']
+        posted = Move
+        try:
+            with self.env.cr.savepoint():
+                moves = Move.create(list(vals_by_rec.values()))
+                moves.action_post()
+                posted = moves
+        except Exception:
+            # isolate the failing records: each invoice is created and posted, or not at all
+            for rec, vals in vals_by_rec.items():
+                try:
+                    with self.env.cr.savepoint():
+                        move = Move.create(vals)
+                        move.action_post()
+                        posted |= move
+                except Exception as e:
+                    errors[rec] = str(e)
+
+        if errors:
+            _logger.info("Hotel invoicing: %s invoice(s) posted, %s record(s) failed", len(posted), len(errors))
+        return posted, errors
+
+    def action_create_invoices(self):
+        """Multi-record invoicing; reports failures without aborting the batch."""
+        moves, errors = self._create_invoices()
+        message = "%s invoice(s) posted." % len(moves)
+        if errors:
+            message += "\n" + "\n".join(
+                "%s: %s" % (rec.display_name, msg) for rec, msg in errors.items())
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': 'Invoicing',
+                'message': message,
+                'type': 'warning' if errors else 'success',
+                'sticky': bool(errors),
+                'next': {'type': 'ir.actions.act_window_close'},
+            },
+        }
+
+
+# Product and journal fields the cached invoice lookups depend on.
+INVOICE_PRODUCT_FIELDS = {'default_code', 'taxes_id', 'active', 'company_id'}
+SALE_JOURNAL_FIELDS = {'type', 'active', 'company_id', 'sequence'}
+
+
+class ProductTemplate(models.Model):
+    _inherit = 'product.template'
+
+    def write(self, vals):
+        if not INVOICE_PRODUCT_FIELDS.intersection(vals):
+            return super().write(vals)
+        Mixin = self.env['hotel.invoice.mixin']
+        variants = self.with_context(active_test=False).product_variant_ids
+        invoice_product = vals.get('default_code') in INVOICE_PRODUCTS or Mixin._is_invoice_product(variants)
+        res = super().write(vals)
+        if invoice_product:
+            self.env.registry.clear_cache()
+        return res
+
+
+class ProductProduct(models.Model):
+    _inherit = 'product.product'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        products = super().create(vals_list)
+        if any(vals.get('default_code') in INVOICE_PRODUCTS for vals in vals_list):
+            self.env.registry.clear_cache()
+        return products
+
+    def write(self, vals):
+        if not INVOICE_PRODUCT_FIELDS.intersection(vals):
+            return super().write(vals)
+        invoice_product = vals.get('default_code') in INVOICE_PRODUCTS \
+            or self.env['hotel.invoice.mixin']._is_invoice_product(self)
+        res = super().write(vals)
+        if invoice_product:
+            self.env.registry.clear_cache()
+        return res
+
+    def unlink(self):
+        invoice_product = self.env['hotel.invoice.mixin']._is_invoice_product(self)
+        res = super().unlink()
+        if invoice_product:
+            self.env.registry.clear_cache()
+        return res
+
+
+class AccountJournal(models.Model):
+    _inherit = 'account.journal'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        journals = super().create(vals_list)
+        if any(journal.type == 'sale' for journal in journals):
+            self.env.registry.clear_cache()
+        return journals
+
+    def write(self, vals):
+        sale_journal = SALE_JOURNAL_FIELDS.intersection(vals) and (
+            vals.get('type') == 'sale' or any(journal.type == 'sale' for journal in self))
+        res = super().write(vals)
+        if sale_journal:
+            self.env.registry.clear_cache()
+        return res
+
+    def unlink(self):
+        sale_journal = any(journal.type == 'sale' for journal in self)
+        res = super().unlink()
+        if sale_journal:
+            self.env.registry.clear_cache()
+        return res
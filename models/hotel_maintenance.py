@@ -1,6 +1,14 @@
-from odoo import models, fields, api
+import logging
 from datetime import timedelta
 
+from odoo import models, fields, api
+from odoo.tools import sql
+
+_logger = logging.getLogger(__name__)
+
+# Last hotel.room id handled by the periodic inspection cron (resumable pass).
+INSPECTION_CURSOR_PARAM = 'custom_hotel_management.inspection_cron_cursor'
+
 class HotelMaintenanceTask(models.Model):
     _name = 'hotel.maintenance.task'
     _description = 'Room Maintenance Task'
@@ -33,6 +41,14 @@ class HotelMaintenanceTask(models.Model):
     description = fields.Text(string="Description", tracking=True)
     housekeeping_task_id = fields.Many2one('hotel.housekeeping.task', string='From Housekeeping Task', ondelete='set null', tracking=True)
 
+    def init(self):
+        # open inspections / repairs per room, as read by the room status and inspection crons;
+        # room_id leads, so it also serves the room cascade
+        if not sql.index_exists(self.env.cr, 'hotel_maintenance_task_room_type_status_idx'):
+            sql.create_index(
+                self.env.cr, 'hotel_maintenance_task_room_type_status_idx', self._table,
+                ['room_id', 'task_type', 'status'])
+
     def name_get(self):
         res = []
         for rec in self:
@@ -41,49 +57,58 @@ class HotelMaintenanceTask(models.Model):
             res.append((rec.id, label))
         return res
 
-    # Room status sync for maintenance lifecycle
-    def write(self, vals):
-        res = super().write(vals)
-        if 'status' in vals:
-            for t in self:
-                room = t.room_id.sudo()
-                if not room:
-                    continue
-                if vals['status'] == 'in_progress':
-                    room.write({'status': 'maintenance'})
-                elif vals['status'] == 'done':
-                    HK = self.env['hotel.housekeeping.task'].sudo()
-                    has_open_hk = HK.search_count([('room_id','=',room.id), ('status','in',['pending','in_progress'])]) > 0
-                    if not has_open_hk and room.status == 'maintenance':
-                        room.write({'status': 'available'})
-        return res
-
     # Cron: periodic inspections every 30 days
     @api.model
-    def cron_generate_periodic_inspections(self, days=30):
-        Room = self.env['hotel.room'].sudo()
+    def cron_generate_periodic_inspections(self, days=30, batch_size=500, max_batches=20):
+        """Create inspections for rooms with no open inspection and none in the last ``days``.
+
+        Rooms are walked by id in chunks; each chunk is one grouped query, one
+        batched create and a commit of the cursor, so a killed run resumes where
+        it stopped. Large portfolios are spread over several cron runs.
+        """
+        ICP = self.env['ir.config_parameter'].sudo()
         Task = self.sudo()
         now = fields.Datetime.now()
         cutoff = now - timedelta(days=days)
-        rooms = Room.search([])
-        for room in rooms:
-            has_open = Task.search_count([
-                ('room_id','=',room.id),
-                ('task_type','=','inspection'),
-                ('status','in',['pending','in_progress'])
-            ]) > 0
-            if has_open:
-                continue
-            last = Task.search([('room_id','=',room.id), ('task_type','=','inspection')],
-                               order='date_scheduled desc, date_reported desc', limit=1)
-            last_when = (last.date_scheduled or last.date_reported) if last else None
-            if not last_when or last_when <= cutoff:
-                Task.create({
+        cursor = int(ICP.get_param(INSPECTION_CURSOR_PARAM, 0))
+        created = 0
+        for _i in range(max_batches):
+            self.flush_model(['room_id', 'task_type', 'status', 'date_scheduled', 'date_reported'])
+            self.env.cr.execute("""
+                SELECT r.id
+                  FROM hotel_room r
+                  LEFT JOIN hotel_maintenance_task t
+                    ON t.room_id = r.id AND t.task_type = 'inspection'
+                 WHERE r.id > %s
+                 GROUP BY r.id
+                HAVING NOT COALESCE(bool_or(t.status IN ('pending', 'in_progress')), false)
+                   AND COALESCE(MAX(COALESCE(t.date_scheduled, t.date_reported)) <= %s, true)
+                 ORDER BY r.id
+                 LIMIT %s
+            """, [cursor, cutoff, batch_size])
+            room_ids = [row[0] for row in self.env.cr.fetchall()]
+            if room_ids:
+                companies = self.env['hotel.room'].sudo().browse(room_ids).company_id
+                Task._hotel_system_writer(companies).create([{
                     'name': 'Periodic Inspection',
-                    'room_id': room.id,
+                    'room_id': room_id,
                     'task_type': 'inspection',
                     'source': 'inspection',
                     'status': 'pending',
                     'date_scheduled': now + timedelta(days=1),
                     'duration_hours': 1.0,
-                })
+                } for room_id in room_ids])
+                created += len(room_ids)
+            # a short chunk means every remaining room was scanned: the pass is complete
+            cursor = room_ids[-1] if len(room_ids) == batch_size else 0
+            ICP.set_param(INSPECTION_CURSOR_PARAM, cursor)
+            if not self.env.registry.in_test_mode():
+                self.env.cr.commit()
+            if not cursor:
+                break
+
+        remaining = self.env['hotel.room'].sudo().search_count([('id', '>', cursor)]) if cursor else 0
+        # with rooms remaining, the cron runner calls the job again right away
+        self.env['ir.cron']._notify_progress(done=created, remaining=remaining)
+        _logger.info("Periodic inspections: %s task(s) created, %s room(s) left in this pass", created, remaining)
+        return created
@@ -0,0 +1,148 @@
+from datetime import date
+
+from odoo import models, fields, api, tools
+from odoo.exceptions import AccessError
+from odoo.tools import sql
+
+from .hotel_room_night import stay_nights
+
+RATE_TYPES = [
+    ('standard', 'Standard'),
+    ('seasonal', 'Seasonal'),
+    ('corporate', 'Corporate'),
+]
+# Fields the cached price calendars depend on; other writes (names...) keep the caches.
+RATE_PLAN_PRICE_FIELDS = {'active', 'sequence', 'rate_type', 'company_id'}
+RATE_LINE_PRICE_FIELDS = {'plan_id', 'room_type_id', 'date', 'price'}
+
+
+class HotelRatePlan(models.Model):
+    _name = 'hotel.rate.plan'
+    _description = 'Room Rate Plan'
+    _order = 'sequence, id'
+    _check_company_auto = True
+
+    name = fields.Char(string="Rate Plan", required=True)
+    sequence = fields.Integer(default=10, help="When several plans price the same night, the lowest sequence wins.")
+    active = fields.Boolean(default=True)
+    company_id = fields.Many2one(
+        'res.company', string="Branch", required=True, index=True,
+        default=lambda self: self.env.company, ondelete='cascade')
+    rate_type = fields.Selection(RATE_TYPES, string='Rate Type', required=True, default='standard')
+    currency_id = fields.Many2one(related='company_id.currency_id')
+    line_ids = fields.One2many('hotel.rate.plan.line', 'plan_id', string="Nightly Rates", copy=True)
+
+    # plan creation needs no invalidation: a plan prices nothing until its lines are created
+    def write(self, vals):
+        res = super().write(vals)
+        if RATE_PLAN_PRICE_FIELDS.intersection(vals):
+            self.env.registry.clear_cache()
+        return res
+
+    def unlink(self):
+        priced = bool(self.with_context(active_test=False).line_ids)
+        res = super().unlink()
+        if priced:
+            self.env.registry.clear_cache()
+        return res
+
+    @api.model
+    @tools.ormcache('room_type_id', 'rate_type', 'company_id', 'year')
+    def _get_price_calendar(self, room_type_id, rate_type, company_id, year):
+        """Nightly prices of a room type for one year, as ((date, price), ...).
+
+        One indexed range query per (room type, rate type, branch, year); the
+        result lives in the registry LRU until a rate plan changes.
+        """
+        self.env['hotel.rate.plan.line'].flush_model()
+        self.flush_model(['active', 'sequence'])
+        self.env.cr.execute("""
+            SELECT DISTINCT ON (l.date) l.date, l.price
+              FROM hotel_rate_plan_line l
+              JOIN hotel_rate_plan p ON p.id = l.plan_id
+             WHERE l.room_type_id = %s
+               AND l.rate_type = %s
+               AND l.company_id = %s
+               AND l.date >= %s AND l.date < %s
+               AND p.active
+             ORDER BY l.date, p.sequence, p.id
+        """, [room_type_id, rate_type, company_id, date(year, 1, 1), date(year + 1, 1, 1)])
+        return tuple(self.env.cr.fetchall())
+
+    @api.model
+    def _resolve_nightly_prices(self, room_type_id, rate_type, company_id, nights):
+        """{night: price} for the nights that have a rate; missing nights are left out."""
+        prices = {}
+        for year in sorted({night.year for night in nights}):
+            prices.update(self._get_price_calendar(room_type_id, rate_type, company_id, year))
+        return {night: prices[night] for night in nights if night in prices}
+
+    @api.model
+    def get_stay_quotes(self, stays):
+        """Quote many stays at once for the booking engine.
+
+        ``stays`` is a list of dicts with ``room_type_id``, ``check_in``,
+        ``check_out`` and optional ``rate_type`` / ``company_id``. Nights with
+        no rate fall back to the room type base price.
+        """
+        RoomType = self.env['hotel.room.type']
+        allowed_company_ids = self.env.user.company_ids.ids
+        quotes = []
+        for stay in stays:
+            # calendars are read in SQL and cached: the rate plan record rule is enforced here
+            company_id = stay.get('company_id') or self.env.company.id
+            if company_id not in allowed_company_ids:
+                raise AccessError("You cannot query prices for branch %s." % company_id)
+            room_type = RoomType.browse(stay['room_type_id'])
+            nights = stay_nights(stay['check_in'], stay['check_out'])
+            prices = self._resolve_nightly_prices(
+                room_type.id, stay.get('rate_type') or 'standard', company_id, nights)
+            nightly = [(night, prices.get(night, room_type.default_price or 0.0)) for night in nights]
+            quotes.append({
+                'nights': [{'date': fields.Date.to_string(night), 'price': price} for night, price in nightly],
+                'total': sum(price for _night, price in nightly),
+            })
+        return quotes
+
+
+class HotelRatePlanLine(models.Model):
+    _name = 'hotel.rate.plan.line'
+    _description = 'Room Rate Plan Nightly Price'
+    _order = 'date, room_type_id'
+
+    plan_id = fields.Many2one('hotel.rate.plan', string="Rate Plan", required=True, ondelete='cascade', index=True)
+    room_type_id = fields.Many2one('hotel.room.type', string="Room Type", required=True, ondelete='cascade')
+    date = fields.Date(string="Night", required=True)
+    price = fields.Monetary(string="Price", currency_field='currency_id')
+    rate_type = fields.Selection(related='plan_id.rate_type', store=True)
+    company_id = fields.Many2one(related='plan_id.company_id', store=True)
+    currency_id = fields.Many2one(related='plan_id.currency_id')
+
+    _sql_constraints = [
+        ('plan_room_type_date_uniq', 'unique(plan_id, room_type_id, date)',
+         "A rate plan can only price a room type once per night."),
+    ]
+
+    def init(self):
+        if not sql.index_exists(self.env.cr, 'hotel_rate_plan_line_lookup_idx'):
+            sql.create_index(
+                self.env.cr, 'hotel_rate_plan_line_lookup_idx', self._table,
+                ['room_type_id', 'rate_type', 'company_id', 'date'],
+            )
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        lines = super().create(vals_list)
+        self.env.registry.clear_cache()
+        return lines
+
+    def write(self, vals):
+        res = super().write(vals)
+        if RATE_LINE_PRICE_FIELDS.intersection(vals):
+            self.env.registry.clear_cache()
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        self.env.registry.clear_cache()
+        return res
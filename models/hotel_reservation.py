@@ -1,6 +1,22 @@
+import logging
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+
+from psycopg2 import errors as pg_errors
+
 from odoo import models, fields, api
+from odoo.tools import sql
 from odoo.exceptions import ValidationError, UserError
 
+from .hotel_room_night import stay_nights
+
+_logger = logging.getLogger(__name__)
+
+# Exclusion constraint guarding against two live stays on the same room.
+ROOM_OVERLAP_CONSTRAINT = 'hotel_reservation_room_no_overlap'
+ROOM_DATES_CONSTRAINT = 'hotel_reservation_check_dates'
+
 class HotelReservation(models.Model):
     _name = 'hotel.reservation'
     _description = 'Hotel Reservation'
@@ -19,15 +35,18 @@ class HotelReservation(models.Model):
     room_id = fields.Many2one(
         string="Room ID",
         comodel_name='hotel.room',
-        required=True, 
         ondelete='restrict', 
-        tracking=True
+        tracking=True,
+        help="Leave empty to let the room assignment engine pick a room of the requested type."
         )
     company_id = fields.Many2one(
         string="Branch",
-        related='room_id.company_id',
+        comodel_name='res.company',
+        compute='_compute_company_id',
         store=True,
-        readonly=True
+        readonly=False,
+        precompute=True,
+        index=True,
     )
     
 
@@ -92,47 +111,88 @@ class HotelReservation(models.Model):
     # accounting links 
     invoice_ids = fields.One2many('account.move', 'hotel_reservation_id', string='Invoices')
 
+    # checked by PostgreSQL before the tsrange of the overlap guard is built from the row
+    _sql_constraints = [
+        ('check_dates', 'CHECK (check_out > check_in)', "Check-out must be after check-in."),
+    ]
+
+    def init(self):
+        """Enforce non-overlapping stays per room in the database itself.
+
+        A GiST exclusion constraint is atomic under concurrent transactions and
+        is checked through its index (O(log n)) instead of a Python scan.
+        Cancelled stays are ignored. The constraint is DEFERRABLE (initially
+        immediate) so batch room swaps can defer it to commit time.
+        A composite btree serves the room + status + dates lookups.
+        """
+        cr = self.env.cr
+        if not sql.index_exists(cr, 'hotel_reservation_room_status_dates_idx'):
+            sql.create_index(
+                cr, 'hotel_reservation_room_status_dates_idx', self._table,
+                ['room_id', 'status', 'check_in', 'check_out'])
+        if sql.constraint_definition(cr, self._table, ROOM_OVERLAP_CONSTRAINT):
+            return
+        try:
+            with cr.savepoint(flush=False):
+                cr.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+        except Exception as e:
+            _logger.warning("Cannot create the btree_gist extension, room overlap guard not installed: %s", e)
+            return
+        try:
+            sql.add_constraint(
+                cr, self._table, ROOM_OVERLAP_CONSTRAINT,
+                "EXCLUDE USING gist (room_id WITH =, tsrange(check_in, check_out) WITH &&) "
+                "WHERE (status <> 'cancelled') DEFERRABLE INITIALLY IMMEDIATE",
+            )
+        except Exception as e:
+            # existing overlapping data must be cleaned up before the guard can be added
+            _logger.warning("Room overlap guard not installed on %s: %s", self._table, e)
+
+    @contextmanager
+    def _map_room_overlap_error(self):
+        """Turn a violation of the room overlap or stay dates constraints into a ValidationError."""
+        try:
+            with self.env.cr.savepoint(flush=False):
+                yield
+        except pg_errors.ExclusionViolation as e:
+            if e.diag.constraint_name != ROOM_OVERLAP_CONSTRAINT:
+                raise
+            raise ValidationError("This room is already booked for an overlapping period.") from e
+        except pg_errors.CheckViolation as e:
+            if e.diag.constraint_name != ROOM_DATES_CONSTRAINT:
+                raise
+            raise ValidationError("Check-out must be after check-in.") from e
+
+    @api.depends('room_id')
+    def _compute_company_id(self):
+        for rec in self:
+            if rec.room_id:
+                rec.company_id = rec.room_id.company_id
+            elif not rec.company_id:
+                rec.company_id = self.env.company
+
     @api.constrains('check_in', 'check_out')
     def _check_dates(self):
         for rec in self:
             if rec.check_out and rec.check_in and rec.check_out <= rec.check_in:
                 raise ValidationError("Check-out must be after check-in.")
     
-    @api.model
-    def create(self, vals):
-        rec = super().create(vals)
-        if rec.name in (False, "/"):
-            rec.name = self.env['ir.sequence'].next_by_code('hotel.reservation') or '/'
-        return rec
-
-class HotelReservation(models.Model):
-    _inherit = "hotel.reservation"
-
-    def _set_room_status(self, room, status):
-        if room and status in ('available', 'occupied'):
-            room.status = status
-
-    @api.model
-    def create(self, vals):
-        rec = super().create(vals)
-        # if created already confirmed, mark occupied
-        try:
-            if rec.status == 'confirmed':
-                self._set_room_status(rec.room_id, 'occupied')
-        except Exception:
-            # don't block creation on a secondary write
-            pass
-        return rec
+    @api.model_create_multi
+    def create(self, vals_list):
+        # references are drawn up front so the batch is inserted without follow-up updates
+        unnamed = [vals for vals in vals_list if vals.get('name', '/') in (False, '/')]
+        names = self.env['ir.sequence']._next_by_code_batch('hotel.reservation', len(unnamed))
+        for vals, name in zip(unnamed, names):
+            vals['name'] = name or '/'
+        with self._map_room_overlap_error():
+            return super().create(vals_list)
 
     def write(self, vals):
-        res = super().write(vals)
-        # react only when status changes
-        if 'status' in vals:
-            for rec in self:
-                if vals['status'] == 'confirmed':
-                    self._set_room_status(rec.room_id, 'occupied')
-                elif vals['status'] in ('cancelled', 'checked_out'):
-                    self._set_room_status(rec.room_id, 'available')
+        if not {'room_id', 'check_in', 'check_out', 'status'}.intersection(vals):
+            return super().write(vals)
+        with self._map_room_overlap_error():
+            res = super().write(vals)
+            self.flush_recordset(['room_id', 'check_in', 'check_out', 'status'])
         return res
 
 class HotelReservationHousekeeping(models.Model):
@@ -140,7 +200,7 @@ class HotelReservationHousekeeping(models.Model):
 
     def _create_cleaning_task_for_room(self, room, when=None):
         """Ensure exactly one open cleaning task exists for this room at/after checkout."""
-        Task = self.env['hotel.housekeeping.task'].sudo()
+        Task = self.env['hotel.housekeeping.task'].sudo()._hotel_system_writer(room.company_id)
         when = when or fields.Datetime.now()
         existing = Task.search([
             ('room_id', '=', room.id),
@@ -158,49 +218,57 @@ class HotelReservationHousekeeping(models.Model):
 
     def write(self, vals):
         res = super().write(vals)
-        # When a reservation is checked out, mark the room dirty and queue housekeeping.
+        # When a reservation is checked out, queue housekeeping (the open task makes the room dirty).
         if 'status' in vals and vals['status'] == 'checked_out':
             for rec in self:
                 room = rec.room_id.sudo()
                 if not room:
                     continue
-                # Set room dirty 
-                if room.status != 'cleaning':  # don't override if crew already started
-                    room.write({'status': 'dirty'})
                 # Create cleaning task scheduled at checkout time (or now)
                 rec._create_cleaning_task_for_room(room, rec.check_out or fields.Datetime.now())
         return res
 
     @api.model
     def cron_generate_housekeeping_tasks(self):
-        """Backstop: periodically ensure checked-out rooms have a cleaning task."""
+        """Backstop: periodically ensure checked-out rooms have a cleaning task.
+
+        One anti-join finds the rooms whose latest recent checkout has no open
+        cleaning task scheduled at/after it, then the tasks are created in
+        batch (their rooms turn dirty through the derived room status).
+        Running it again finds nothing left to do.
+        """
+        started = time.monotonic()
         now = fields.Datetime.now()
         cutoff = now - timedelta(days=2)
-        to_process = self.sudo().search([
-            ('status', '=', 'checked_out'),
-            ('check_out', '>=', cutoff),
-            ('room_id', '!=', False),
-        ])
-        Task = self.env['hotel.housekeeping.task'].sudo()
-        for r in to_process:
-            room = r.room_id
-            if not room:
-                continue
-            has_open = Task.search([
-                ('room_id', '=', room.id),
-                ('status', 'in', ['pending', 'in_progress']),
-                ('date_scheduled', '>=', r.check_out or cutoff),
-            ], limit=1)
-            if not has_open:
-                Task.create({
-                    'room_id': room.id,
-                    'task_type': 'cleaning',
-                    'status': 'pending',
-                    'date_scheduled': r.check_out or now,
-                })
-                # Keep/mark dirty until housekeeping starts
-                if room.status != 'cleaning':
-                    room.status = 'dirty'
+        self.flush_model(['status', 'check_out', 'room_id'])
+        self.env['hotel.housekeeping.task'].flush_model(['room_id', 'status', 'date_scheduled'])
+        self.env.cr.execute("""
+            SELECT DISTINCT ON (r.room_id) r.room_id, r.check_out
+              FROM hotel_reservation r
+             WHERE r.status = 'checked_out'
+               AND r.check_out >= %s
+               AND r.room_id IS NOT NULL
+               AND NOT EXISTS (
+                    SELECT 1
+                      FROM hotel_housekeeping_task t
+                     WHERE t.room_id = r.room_id
+                       AND t.status IN ('pending', 'in_progress')
+                       AND t.date_scheduled >= r.check_out
+               )
+             ORDER BY r.room_id, r.check_out DESC
+        """, [cutoff])
+        missing = self.env.cr.fetchall()
+        if missing:
+            companies = self.env['hotel.room'].sudo().browse([room_id for room_id, _check_out in missing]).company_id
+            self.env['hotel.housekeeping.task'].sudo()._hotel_system_writer(companies).create([{
+                'room_id': room_id,
+                'task_type': 'cleaning',
+                'status': 'pending',
+                'date_scheduled': check_out or now,
+            } for room_id, check_out in missing])
+        _logger.info("Housekeeping backstop: %s cleaning task(s) created in %.2fs",
+                     len(missing), time.monotonic() - started)
+        return len(missing)
 
 # create the reverse FK on account.move
 class AccountMove(models.Model):
@@ -208,16 +276,23 @@ class AccountMove(models.Model):
     hotel_reservation_id = fields.Many2one('hotel.reservation', ondelete='set null')
 
 class HotelReservation(models.Model):
-    _inherit = 'hotel.reservation'
+    _inherit = ['hotel.reservation', 'hotel.invoice.mixin']
+    _hotel_invoice_link = 'hotel_reservation_id'
 
     invoice_count = fields.Integer(compute='_compute_invoice_count', string='Invoice Count')
 
     def _compute_invoice_count(self):
-        for rec in self:
-            rec.invoice_count = self.env['account.move'].sudo().search_count([
-                ('hotel_reservation_id', '=', rec.id),
+        # one grouped query for the whole page instead of a search_count per record
+        counts = dict(self.env['account.move'].sudo()._read_group(
+            domain=[
+                ('hotel_reservation_id', 'in', self.ids),
                 ('move_type', 'in', ['out_invoice', 'out_refund']),
-            ])
+            ],
+            groupby=['hotel_reservation_id'],
+            aggregates=['__count'],
+        ))
+        for rec in self:
+            rec.invoice_count = counts.get(rec, 0)
 
     def action_view_invoices(self):
         self.ensure_one()
@@ -231,56 +306,79 @@ class HotelReservation(models.Model):
         }
         return action
 
+    def _check_invoiceable(self):
+        errors = {}
+        for rec in self:
+            if not rec.guest_id:
+                errors[rec] = "Reservation must have a Guest (Customer) before invoicing."
+            elif rec.payment_status == 'paid':
+                errors[rec] = "This reservation is already marked Paid."
+        return errors
+
     def _get_sale_journal(self):
         self.ensure_one()
-        journal = self.env['account.journal'].search([
-            ('type', '=', 'sale'),
-            ('company_id', '=', self.company_id.id),
-            ('active', '=', True),
-        ], limit=1)
-        if not journal:
-            raise UserError("No Sales Journal found for company %s." % self.company_id.display_name)
-        return journal
+        return self._invoice_journal(self.company_id)
 
-    def _reservation_invoice_lines(self):
-        """Builds invoice_line_ids triples for the reservation."""
+    def _nightly_prices(self):
+        """[(night, price)] for the stay.
+
+        An explicit amount per night overrides everything; otherwise each night
+        comes from the rate plan calendar of the room type and rate type, with
+        the room price as fallback.
+        """
         self.ensure_one()
-        # Decide the price source. Prefer reservation.total_amount if set, else room.price.
-        unit_price = self.total_amount or self.room_id.price or 0.0
-        quantity = 1.0
-        # nights, compute from check-in/out
-        if self.check_in and self.check_out:
-            nights = max(1.0, (fields.Datetime.to_datetime(self.check_out) - fields.Datetime.to_datetime(self.check_in)).days or 1.0)
-            quantity = nights
+        if not (self.check_in and self.check_out):
+            return []
+        nights = stay_nights(self.check_in, self.check_out)
+        fallback = self.room_id.price or self.room_type_id.default_price or 0.0
+        if self.total_amount:
+            return [(night, self.total_amount) for night in nights]
+        prices = {}
+        if self.room_type_id:
+            prices = self.env['hotel.rate.plan'].sudo()._resolve_nightly_prices(
+                self.room_type_id.id, self.rate_type, self.company_id.id, nights)
+        return [(night, prices.get(night, fallback)) for night in nights]
 
-        # Try to pick a product. If you have a "Room Night" product, set its external ID and use it.
-        product = self.env['product.product'].search([('default_code', '=', 'ROOM_NIGHT')], limit=1) 
+    def _reservation_invoice_lines(self, cache=None):
+        """Builds invoice_line_ids triples for the reservation, one per run of equally priced nights."""
+        self.ensure_one()
+        cache = {} if cache is None else cache
+        # Room Night product, configurable through the custom_hotel_management.room_night_product parameter
+        product = self._invoice_product('ROOM_NIGHT', self.company_id)
 
         # Map taxes through fiscal position
-        partner = self.guest_id
-        taxes = product.taxes_id if product else self.env['account.tax']
-        taxes = taxes.filtered(lambda t: t.company_id == self.company_id)
-        if partner.property_account_position_id and taxes:
-            taxes = partner.property_account_position_id.map_tax(taxes)
-
-        line_vals = {
-            'name': product.display_name if product else (self.room_id.display_name or 'Room Charge'),
-            'quantity': quantity,
-            'price_unit': unit_price,
-            'product_id': product.id if product else False,
-            'tax_ids': [(6, 0, taxes.ids)] if taxes else False,
-        }
-        return [(0, 0, line_vals)]
+        taxes = self._invoice_taxes(cache, 'ROOM_NIGHT', self.company_id, self.guest_id)
+        label = product.display_name if product else (self.room_id.display_name or self.room_type_id.display_name or 'Room Charge')
 
-    def action_create_invoice(self):
-        self.ensure_one()
-        if not self.guest_id:
-            raise UserError("Reservation must have a Guest (Customer) before invoicing.")
-        if self.payment_status == 'paid':
-            raise UserError("This reservation is already marked Paid.")
+        # group consecutive nights sharing a price
+        runs = []
+        for night, price in self._nightly_prices():
+            if runs and runs[-1]['price'] == price:
+                runs[-1]['last'] = night
+                runs[-1]['count'] += 1
+            else:
+                runs.append({'first': night, 'last': night, 'price': price, 'count': 1})
+        if not runs:
+            runs = [{'first': False, 'last': False, 'price': self.total_amount or self.room_id.price or self.room_type_id.default_price or 0.0, 'count': 1}]
 
-        journal = self._get_sale_journal()
-        move_vals = {
+        lines = []
+        for run in runs:
+            name = label
+            if run['first']:
+                name = f"{label} ({run['first']} → {run['last']}, {run['count']} night(s))"
+            lines.append((0, 0, {
+                'name': name,
+                'quantity': run['count'],
+                'price_unit': run['price'],
+                'product_id': product.id if product else False,
+                'tax_ids': [(6, 0, taxes.ids)] if taxes else False,
+            }))
+        return lines
+
+    def _prepare_invoice_vals(self, cache):
+        self.ensure_one()
+        journal = self._invoice_journal(self.company_id)
+        return {
             'move_type': 'out_invoice',
             'partner_id': self.guest_id.id,
             'invoice_date': fields.Date.context_today(self),
@@ -288,15 +386,18 @@ class HotelReservation(models.Model):
             'invoice_payment_term_id': self.guest_id.property_payment_term_id.id or False,
             'journal_id': journal.id,
             'currency_id': self.currency_id.id,
-            'invoice_line_ids': self._reservation_invoice_lines(),
+            'invoice_line_ids': self._reservation_invoice_lines(cache),
             'hotel_reservation_id': self.id,  # <-- this links it back to O2M
             'invoice_user_id': self.env.user.id,
             'company_id': self.company_id.id,
         }
-        move = self.env['account.move'].create(move_vals)
 
-        # Post the invoice 
-        move.action_post()
+    def action_create_invoice(self):
+        self.ensure_one()
+        # a stay may be invoiced again by hand (extras, split bills)
+        move, errors = self._create_invoices(skip_invoiced=False)
+        if errors:
+            raise UserError(errors[self])
 
         return {
             'name': 'Customer Invoice',
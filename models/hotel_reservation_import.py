@@ -0,0 +1,178 @@
+import csv
+import json
+import logging
+import time
+
+from odoo import models, fields, api
+from odoo.tools import split_every
+
+from .hotel_room_night import stay_nights_bounds
+
+_logger = logging.getLogger(__name__)
+
+# Columns: name, guest_ref, guest_email, room, check_in, check_out, status, booking_source,
+# rate_type, total_amount, deposit_amount, payment_status. Guests match by ref, then e-mail.
+IMPORT_PASSTHROUGH = ('status', 'booking_source', 'rate_type', 'payment_status')
+IMPORT_AMOUNTS = ('total_amount', 'deposit_amount')
+MAX_REPORTED_REJECTS = 1000
+
+
+def iter_import_rows(stream, file_format):
+    """Yield one dict per row of a CSV or JSONL text stream, without loading the whole file."""
+    if file_format == 'jsonl':
+        for line in stream:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as e:
+                yield {'_error': "Invalid JSON: %s" % e}
+    else:
+        yield from csv.DictReader(stream)
+
+
+class HotelReservation(models.Model):
+    _inherit = 'hotel.reservation'
+
+    @api.model
+    def _import_reservation_file(self, path, file_format=None, company_id=None, chunk_size=1000, commit=False):
+        """Import a CSV/JSONL export of another PMS from a server-side file."""
+        file_format = file_format or ('jsonl' if path.endswith(('.jsonl', '.ndjson')) else 'csv')
+        with open(path, encoding='utf-8-sig', newline='') as stream:
+            return self._import_reservation_rows(
+                iter_import_rows(stream, file_format), company_id=company_id,
+                chunk_size=chunk_size, commit=commit)
+
+    @api.model
+    def _import_reservation_rows(self, rows, company_id=None, chunk_size=1000, commit=False):
+        """Bulk-create reservations from an iterable of row dicts, chunk by chunk.
+
+        Guests and rooms are resolved through lookup maps, each chunk goes
+        through one batched create() without mail tracking, and room statuses
+        are recomputed once at the end instead of after every row. A chunk
+        that fails is retried row by row so only the faulty rows are rejected.
+        Returns ``{'imported', 'rejected', 'seconds', 'rows_per_second', 'rejects'}``.
+        """
+        company = self.env['res.company'].browse(company_id) if company_id else self.env.company
+        Reservation = self.with_company(company).with_context(
+            tracking_disable=True, mail_create_nolog=True, mail_notrack=True,
+            hotel_defer_room_status=True, hotel_defer_inventory=True)
+        room_map = {
+            room.name: room.id
+            for room in self.env['hotel.room'].with_context(active_test=False).search_fetch(
+                [('company_id', '=', company.id)], ['name'])
+        }
+        stats = {'imported': 0, 'rejected': 0, 'rejects': []}
+        touched_room_ids = set()
+        # [first night, last night + 1) covered by the imported stays
+        span = [None, None]
+        started = time.monotonic()
+
+        def reject(line_no, reason):
+            stats['rejected'] += 1
+            if len(stats['rejects']) < MAX_REPORTED_REJECTS:
+                stats['rejects'].append((line_no, reason))
+
+        def cover(vals_list):
+            for vals in vals_list:
+                first, stop = stay_nights_bounds(vals['check_in'], vals['check_out'])
+                span[0] = first if span[0] is None else min(span[0], first)
+                span[1] = stop if span[1] is None else max(span[1], stop)
+
+        for chunk in split_every(chunk_size, enumerate(rows, start=1)):
+            guest_map = self._import_guest_map([row for _line_no, row in chunk])
+            batch = []
+            for line_no, row in chunk:
+                vals, error = self._import_prepare_vals(row, guest_map, room_map, company)
+                if error:
+                    reject(line_no, error)
+                else:
+                    batch.append((line_no, vals))
+            if batch:
+                try:
+                    self._import_create(Reservation, [vals for _line_no, vals in batch], touched_room_ids)
+                    cover(vals for _line_no, vals in batch)
+                    stats['imported'] += len(batch)
+                except Exception:
+                    for line_no, vals in batch:
+                        try:
+                            self._import_create(Reservation, [vals], touched_room_ids)
+                            cover([vals])
+                            stats['imported'] += 1
+                        except Exception as e:
+                            reject(line_no, str(e))
+            if commit and not self.env.registry.in_test_mode():
+                self.env.cr.commit()
+            self.env.invalidate_all()
+            _logger.info("Reservation import: %s rows imported, %s rejected", stats['imported'], stats['rejected'])
+
+        self.env['hotel.room']._rebuild_statuses(room_ids=list(touched_room_ids), commit=commit)
+        if span[0]:
+            # imported history bypassed the allotment: rebuild the counters of the nights it covers
+            room_types = self.env['hotel.room'].browse(touched_room_ids).room_type_id
+            self.env['hotel.room.inventory']._recount(span[0], span[1], [company.id], room_types.ids)
+        stats['seconds'] = time.monotonic() - started
+        stats['rows_per_second'] = (stats['imported'] + stats['rejected']) / stats['seconds'] if stats['seconds'] else 0.0
+        _logger.info(
+            "Reservation import done: %s imported, %s rejected in %.1fs (%.0f rows/s)",
+            stats['imported'], stats['rejected'], stats['seconds'], stats['rows_per_second'])
+        return stats
+
+    @api.model
+    def _import_create(self, Reservation, vals_list, touched_room_ids):
+        # room statuses are left out of the flush; they are rebuilt once the import is done
+        with self.env.cr.savepoint():
+            records = Reservation.create(vals_list)
+            self.env.remove_to_compute(self.env['hotel.room']._fields['status'], records.room_id)
+        touched_room_ids.update(records.room_id.ids)
+        return records
+
+    @api.model
+    def _import_guest_map(self, rows):
+        """{('ref'|'email', value): partner_id} for the guests referenced by a chunk."""
+        Partner = self.env['res.partner'].with_context(active_test=False)
+        refs = {row.get('guest_ref') for row in rows if row.get('guest_ref')}
+        emails = {row.get('guest_email').lower() for row in rows if row.get('guest_email')}
+        guest_map = {}
+        if refs:
+            for partner in Partner.search_fetch([('ref', 'in', list(refs))], ['ref']):
+                guest_map.setdefault(('ref', partner.ref), partner.id)
+        if emails:
+            for partner in Partner.search_fetch([('email', 'in', list(emails))], ['email']):
+                guest_map.setdefault(('email', partner.email.lower()), partner.id)
+        return guest_map
+
+    @api.model
+    def _import_prepare_vals(self, row, guest_map, room_map, company):
+        """Create values for one row, or (None, reason) when the row cannot be imported."""
+        if row.get('_error'):
+            return None, row['_error']
+        guest_id = guest_map.get(('ref', row.get('guest_ref'))) \
+            or guest_map.get(('email', (row.get('guest_email') or '').lower()))
+        if not guest_id:
+            return None, "Unknown guest %s" % (row.get('guest_ref') or row.get('guest_email') or '')
+        room_id = room_map.get(row.get('room'))
+        if not room_id:
+            return None, "Unknown room %s" % (row.get('room') or '')
+        try:
+            vals = {
+                'guest_id': guest_id,
+                'room_id': room_id,
+                'check_in': fields.Datetime.to_datetime(row.get('check_in')),
+                'check_out': fields.Datetime.to_datetime(row.get('check_out')),
+                'currency_id': company.currency_id.id,
+            }
+            for field_name in IMPORT_AMOUNTS:
+                if row.get(field_name) not in (None, ''):
+                    vals[field_name] = float(row[field_name])
+        except (TypeError, ValueError) as e:
+            return None, str(e)
+        if not (vals['check_in'] and vals['check_out']):
+            return None, "Missing check-in or check-out"
+        for field_name in IMPORT_PASSTHROUGH:
+            if row.get(field_name):
+                vals[field_name] = row[field_name]
+        if row.get('name'):
+            vals['name'] = row['name']
+        return vals, None
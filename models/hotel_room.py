@@ -1,4 +1,14 @@
 from odoo import models,fields,api
+from odoo.tools import split_every
+
+# When several sources imply a status for the same room, the highest priority wins.
+ROOM_STATUS_PRIORITY = {
+    'available': 0,
+    'occupied': 1,
+    'dirty': 2,
+    'cleaning': 3,
+    'maintenance': 4,
+}
 
 class HotelRoomType(models.Model):
     _name = 'hotel.room.type'
@@ -117,3 +127,84 @@ class HotelRoom(models.Model):
                 if updates:
                     super(HotelRoom, rec).write(updates)
         return res
+
+
+
+class HotelRoom(models.Model):
+    _inherit = 'hotel.room'
+
+    reservation_ids = fields.One2many('hotel.reservation', 'room_id', string="Reservations")
+    housekeeping_task_ids = fields.One2many('hotel.housekeeping.task', 'room_id', string="Housekeeping Tasks")
+    maintenance_task_ids = fields.One2many('hotel.maintenance.task', 'room_id', string="Maintenance Tasks")
+    # Derived from reservations, housekeeping and maintenance; staff may still override it
+    # until one of those changes again.
+    status = fields.Selection(compute='_compute_status', store=True, readonly=False)
+
+    @api.depends('reservation_ids.status',
+                 'housekeeping_task_ids.status', 'housekeeping_task_ids.task_type',
+                 'maintenance_task_ids.status')
+    def _compute_status(self):
+        """Only the rooms touched by a change are recomputed, with one grouped query per source."""
+        room_ids = self._origin.ids
+        occupied = set()
+        cleaning = set()
+        dirty = set()
+        maintenance = set()
+        if room_ids:
+            # only a guest in house occupies the room: future confirmed stays do not
+            for [room] in self.env['hotel.reservation'].sudo()._read_group(
+                    [('room_id', 'in', room_ids), ('status', '=', 'checked_in')],
+                    groupby=['room_id']):
+                occupied.add(room.id)
+            for room, status, task_type in self.env['hotel.housekeeping.task'].sudo()._read_group(
+                    [('room_id', 'in', room_ids), ('status', 'in', ['pending', 'in_progress'])],
+                    groupby=['room_id', 'status', 'task_type']):
+                if status == 'in_progress':
+                    cleaning.add(room.id)
+                elif task_type == 'cleaning':
+                    dirty.add(room.id)
+            for [room] in self.env['hotel.maintenance.task'].sudo()._read_group(
+                    [('room_id', 'in', room_ids), ('status', '=', 'in_progress')],
+                    groupby=['room_id']):
+                maintenance.add(room.id)
+
+        for room in self:
+            room_id = room._origin.id
+            candidates = ['available']
+            if room_id in occupied:
+                candidates.append('occupied')
+            if room_id in dirty:
+                candidates.append('dirty')
+            if room_id in cleaning:
+                candidates.append('cleaning')
+            if room_id in maintenance:
+                candidates.append('maintenance')
+            room.status = max(candidates, key=ROOM_STATUS_PRIORITY.get)
+
+    @api.model
+    def _rebuild_statuses(self, batch_size=1000, commit=False, room_ids=None):
+        """Recompute room statuses from scratch (all rooms by default), chunk by chunk."""
+        Room = self.sudo().with_context(active_test=False)
+        status_field = self._fields['status']
+        if room_ids is None:
+            room_ids = Room.search([]).ids
+        for batch in split_every(batch_size, room_ids):
+            rooms = Room.browse(batch)
+            self.env.add_to_compute(status_field, rooms)
+            rooms.flush_recordset(['status'])
+            if commit and not self.env.registry.in_test_mode():
+                self.env.cr.commit()
+            self.env.invalidate_all()
+
+    def action_rebuild_room_statuses(self):
+        """Rebuild in the background: the cron commits chunk by chunk."""
+        self.env.ref('custom_hotel_management.ir_cron_rebuild_room_statuses')._trigger()
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': 'Room Status',
+                'message': 'Room statuses will be rebuilt in the background.',
+                'type': 'info',
+            },
+        }
@@ -0,0 +1,273 @@
+import logging
+import time
+from bisect import bisect_right
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import timedelta
+
+from odoo import models, fields, api
+from odoo.tools import sql
+from odoo.exceptions import UserError, ValidationError
+
+from .hotel_reservation import ROOM_OVERLAP_CONSTRAINT
+
+_logger = logging.getLogger(__name__)
+
+# Gaps up to this many nights between two stays rarely sell: the planner avoids creating them.
+ORPHAN_GAP_NIGHTS = 1
+# Stays this far around the planned window are loaded to measure the gaps left next to them.
+GAP_LOOKAROUND = timedelta(days=7)
+OPEN_GAP = 10 ** 6
+
+
+class RoomTimeline:
+    """Sorted, non-overlapping stays of one room."""
+    __slots__ = ('starts', 'ends')
+
+    def __init__(self):
+        self.starts = []
+        self.ends = []
+
+    def add(self, start, end):
+        index = bisect_right(self.starts, start)
+        self.starts.insert(index, start)
+        self.ends.insert(index, end)
+
+    def fit(self, start, end):
+        """(nights free before, nights free after) if [start, end) fits, else None."""
+        index = bisect_right(self.starts, start)
+        if index and self.ends[index - 1] > start:
+            return None
+        if index < len(self.starts) and self.starts[index] < end:
+            return None
+        before = (start.date() - self.ends[index - 1].date()).days if index else OPEN_GAP
+        after = (self.starts[index].date() - end.date()).days if index < len(self.starts) else OPEN_GAP
+        return before, after
+
+
+def fit_score(gaps):
+    """Lower is better: first no orphan nights, then the tightest packing."""
+    before, after = gaps
+    orphans = sum(1 for gap in gaps if 0 < gap <= ORPHAN_GAP_NIGHTS)
+    return orphans, before, after
+
+
+def best_fit_room(timelines, room_ids, start, end):
+    best = None
+    empty_seen = False
+    for room_id in room_ids:
+        timeline = timelines[room_id]
+        if not timeline.starts:
+            # all empty rooms score alike, the first one stands for them
+            if empty_seen:
+                continue
+            empty_seen = True
+        gaps = timeline.fit(start, end)
+        if gaps is None:
+            continue
+        key = (fit_score(gaps), room_id)
+        if best is None or key < best:
+            best = key
+            if key[0][:2] == (0, 0):
+                break  # back to back with no orphan night: nothing fits tighter
+    return best and best[1]
+
+
+def plan_assignments(stays, rooms, timelines):
+    """Best-fit interval scheduling of ``stays`` on ``rooms``.
+
+    ``stays`` are (id, start, end, guests, amenity_ids) tuples, ``rooms`` maps
+    a room id to (capacity, amenity_ids) and ``timelines`` holds the stays
+    already fixed on each room; it is updated in place. Stays are placed in
+    check-in order, longest first, each on the eligible room where it leaves
+    no orphan night and the smallest gap. Returns ({stay id: room id}, [ids
+    that could not be placed]).
+    """
+    eligible = {}
+    plan, unplaced = {}, []
+    for stay_id, start, end, guests, amenity_ids in sorted(stays, key=lambda s: (s[1], s[1] - s[2], s[0])):
+        requirement = (guests, amenity_ids)
+        if requirement not in eligible:
+            eligible[requirement] = [
+                room_id for room_id, (capacity, room_amenities) in sorted(rooms.items())
+                if (not capacity or capacity >= guests) and amenity_ids <= room_amenities
+            ]
+        room_id = best_fit_room(timelines, eligible[requirement], start, end)
+        if room_id:
+            timelines[room_id].add(start, end)
+            plan[stay_id] = room_id
+        else:
+            unplaced.append(stay_id)
+    return plan, unplaced
+
+
+class HotelReservation(models.Model):
+    _inherit = 'hotel.reservation'
+
+    room_type_id = fields.Many2one(
+        'hotel.room.type', string="Room Type", compute='_compute_room_type_id',
+        store=True, readonly=False, precompute=True, index=True, tracking=True)
+    room_locked = fields.Boolean(
+        string="Room Locked", copy=False,
+        help="The assignment engine never moves this reservation to another room.")
+    required_amenity_ids = fields.Many2many(
+        'hotel.room.amenity', 'hotel_reservation_amenity_rel', 'reservation_id', 'amenity_id',
+        string="Required Amenities")
+    guest_count = fields.Integer(string="Guests", default=1)
+
+    @api.depends('room_id')
+    def _compute_room_type_id(self):
+        for rec in self:
+            if rec.room_id:
+                rec.room_type_id = rec.room_id.room_type_id
+
+    @api.constrains('room_id', 'status')
+    def _check_room_assigned(self):
+        for rec in self:
+            if not rec.room_id and rec.status in ('checked_in', 'checked_out'):
+                raise ValidationError("A room must be assigned before check-in.")
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        unassigned = records.filtered(lambda rec: not rec.room_id and rec.status != 'cancelled')
+        unplaced = unassigned._assign_rooms() if unassigned else unassigned
+        if unplaced:
+            raise UserError("No room is free for: %s." % ", ".join(
+                "%s (%s, %s - %s)" % (rec.name, rec.room_type_id.name or "any type", rec.check_in, rec.check_out)
+                for rec in unplaced))
+        return records
+
+    @contextmanager
+    def _defer_room_overlap_check(self):
+        """Check the room overlap constraint once, after a batch of room swaps."""
+        cr = self.env.cr
+        if not sql.constraint_definition(cr, self._table, ROOM_OVERLAP_CONSTRAINT):
+            yield
+            return
+        cr.execute(f"SET CONSTRAINTS {ROOM_OVERLAP_CONSTRAINT} DEFERRED")
+        try:
+            # a failing batch is rolled back with its pending checks, so restoring IMMEDIATE cannot fail on it
+            with cr.savepoint():
+                yield
+                self.flush_model(['room_id'])
+        finally:
+            with self._map_room_overlap_error():
+                cr.execute(f"SET CONSTRAINTS {ROOM_OVERLAP_CONSTRAINT} IMMEDIATE")
+
+    def _assign_rooms(self, reassign=False):
+        """Assign rooms to these reservations, per branch and room type.
+
+        Reservations without a room are always planned; with ``reassign``,
+        assigned ones that are neither locked nor in house are re-planned too.
+        A group whose re-plan cannot place every stay keeps its current rooms.
+        Returns the reservations left without a room.
+        """
+        movable = self.filtered(lambda rec: rec.status not in ('cancelled', 'checked_in', 'checked_out')
+                                and rec.check_in and rec.check_out
+                                and (not rec.room_id or (reassign and not rec.room_locked)))
+        groups = defaultdict(lambda: self.browse())
+        for rec in movable:
+            groups[rec.company_id, rec.room_type_id] |= rec
+        unplaced = self.browse()
+        for (company, room_type), group in groups.items():
+            unplaced |= group._assign_group(company, room_type)
+        return unplaced
+
+    def _assign_group(self, company, room_type):
+        Room = self.env['hotel.room'].sudo()
+        domain = [('company_id', '=', company.id)]
+        if room_type:
+            domain.append(('room_type_id', '=', room_type.id))
+        rooms = {
+            room.id: (room.capacity, frozenset(room.amenities_ids.ids))
+            for room in Room.search_fetch(domain, ['capacity', 'amenities_ids'])
+        }
+        if not rooms:
+            return self.filtered(lambda rec: not rec.room_id)
+
+        timelines = self._room_timelines(
+            list(rooms), min(self.mapped('check_in')), max(self.mapped('check_out')), exclude_ids=self.ids)
+        stays = [(rec.id, rec.check_in, rec.check_out, rec.guest_count or 1, frozenset(rec.required_amenity_ids.ids))
+                 for rec in self]
+        plan, unplaced_ids = plan_assignments(stays, rooms, timelines)
+        if any(rec.room_id for rec in self.browse(unplaced_ids)):
+            # a partial re-plan could strand assigned stays: keep them, only place the new ones
+            _logger.info("Room assignment: %s stay(s) of %s / %s cannot be re-planned, assignments kept",
+                         len(unplaced_ids), company.name, room_type.name or 'any type')
+            unassigned = self.filtered(lambda rec: not rec.room_id)
+            return unassigned._assign_group(company, room_type) if unassigned else unassigned
+
+        by_room = defaultdict(list)
+        for rec in self:
+            if rec.id in plan and rec.room_id.id != plan[rec.id]:
+                by_room[plan[rec.id]].append(rec.id)
+        with self._defer_room_overlap_check():
+            for room_id, ids in by_room.items():
+                self.browse(ids)._hotel_system_writer(company).write({'room_id': room_id})
+        return self.browse(unplaced_ids)
+
+    @api.model
+    def _room_timelines(self, room_ids, date_start, date_end, exclude_ids=()):
+        """{room id: RoomTimeline} of the live stays around [date_start, date_end)."""
+        self.flush_model(['room_id', 'check_in', 'check_out', 'status'])
+        self.env.cr.execute("""
+            SELECT room_id, check_in, check_out
+              FROM hotel_reservation
+             WHERE room_id IN %s
+               AND status <> 'cancelled'
+               AND check_out > %s AND check_in < %s
+               AND id NOT IN %s
+        """, [tuple(room_ids), date_start - GAP_LOOKAROUND, date_end + GAP_LOOKAROUND, tuple(exclude_ids) or (0,)])
+        timelines = {room_id: RoomTimeline() for room_id in room_ids}
+        for room_id, check_in, check_out in self.env.cr.fetchall():
+            timelines[room_id].add(check_in, check_out)
+        return timelines
+
+    @api.model
+    def _best_fit_room_id(self, room_ids, check_in, check_out):
+        """Among ``room_ids``, the free room a new stay fragments the least (False if none)."""
+        if not room_ids:
+            return False
+        timelines = self._room_timelines(room_ids, check_in, check_out)
+        return best_fit_room(timelines, sorted(room_ids), check_in, check_out) or False
+
+    @api.model
+    def _reoptimize_assignments(self, company_ids=None):
+        """Re-plan the room of every future, movable reservation of the given branches."""
+        started = time.monotonic()
+        domain = [
+            ('check_in', '>', fields.Datetime.now()),
+            ('status', 'in', ['draft', 'confirmed']),
+            ('room_locked', '=', False),
+        ]
+        if company_ids:
+            domain.append(('company_id', 'in', company_ids))
+        reservations = self.search(domain)
+        unplaced = reservations._assign_rooms(reassign=True)
+        _logger.info("Room assignment: %s future reservation(s) re-planned in %.2fs, %s left unassigned",
+                     len(reservations), time.monotonic() - started, len(unplaced))
+        return reservations, unplaced
+
+    def action_assign_rooms(self):
+        unplaced = self._assign_rooms()
+        return self._assignment_notification(self, unplaced)
+
+    def action_reoptimize_future_assignments(self):
+        reservations, unplaced = self._reoptimize_assignments(self.env.companies.ids)
+        return self._assignment_notification(reservations, unplaced)
+
+    @api.model
+    def _assignment_notification(self, reservations, unplaced):
+        message = "%s reservation(s) planned." % len(reservations)
+        if unplaced:
+            message += " No room found for: %s." % ", ".join(unplaced.mapped('name'))
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': 'Room Assignment',
+                'message': message,
+                'type': 'warning' if unplaced else 'success',
+            },
+        }
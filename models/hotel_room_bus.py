@@ -0,0 +1,103 @@
+from collections import defaultdict
+from contextlib import contextmanager
+
+from odoo import models, api
+
+ROOM_STATUS_NOTIFICATION = 'hotel.room_status'
+
+
+class HotelRoom(models.Model):
+    _inherit = 'hotel.room'
+
+    @contextmanager
+    def _publish_status_changes(self):
+        """Publish the status deltas of these rooms caused by the wrapped block.
+
+        One bus notification per branch lists every room whose status changed,
+        so room boards patch themselves instead of reloading.
+        """
+        if self.env.context.get('hotel_defer_room_status'):
+            # bulk imports rebuild the statuses once at the end
+            yield
+            return
+        rooms = self.sudo()
+        before = {room.id: room.status for room in rooms}
+        yield
+        changed = rooms.filtered(lambda room: room.status != before.get(room.id))
+        by_company = defaultdict(list)
+        for room in changed:
+            by_company[room.company_id].append({'id': room.id, 'name': room.name, 'status': room.status})
+        for company, deltas in by_company.items():
+            self.env['bus.bus']._sendone(company, ROOM_STATUS_NOTIFICATION, {'rooms': deltas})
+
+    def write(self, vals):
+        if 'status' not in vals:
+            return super().write(vals)
+        with self._publish_status_changes():
+            return super().write(vals)
+
+
+class HotelReservation(models.Model):
+    _inherit = 'hotel.reservation'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        rooms = self.env['hotel.room'].browse({vals['room_id'] for vals in vals_list if vals.get('room_id')})
+        with rooms._publish_status_changes():
+            return super().create(vals_list)
+
+    def write(self, vals):
+        if not {'status', 'room_id'}.intersection(vals):
+            return super().write(vals)
+        rooms = self.room_id
+        if vals.get('room_id'):
+            rooms |= self.env['hotel.room'].browse(vals['room_id'])
+        with rooms._publish_status_changes():
+            return super().write(vals)
+
+
+class HotelHousekeepingTask(models.Model):
+    _inherit = 'hotel.housekeeping.task'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        rooms = self.env['hotel.room'].browse({vals['room_id'] for vals in vals_list if vals.get('room_id')})
+        with rooms._publish_status_changes():
+            return super().create(vals_list)
+
+    def write(self, vals):
+        if not {'status', 'task_type', 'room_id'}.intersection(vals):
+            return super().write(vals)
+        rooms = self.room_id
+        if vals.get('room_id'):
+            rooms |= self.env['hotel.room'].browse(vals['room_id'])
+        with rooms._publish_status_changes():
+            return super().write(vals)
+
+
+class HotelMaintenanceTask(models.Model):
+    _inherit = 'hotel.maintenance.task'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        rooms = self.env['hotel.room'].browse({vals['room_id'] for vals in vals_list if vals.get('room_id')})
+        with rooms._publish_status_changes():
+            return super().create(vals_list)
+
+    def write(self, vals):
+        if 'status' not in vals:
+            return super().write(vals)
+        with self.room_id._publish_status_changes():
+            return super().write(vals)
+
+
+class IrWebsocket(models.AbstractModel):
+    _inherit = 'ir.websocket'
+
+    def _build_bus_channel_list(self, channels):
+        # hotel staff listen to the room status deltas of their branches
+        channels = super()._build_bus_channel_list(channels)
+        if self.env.uid and self.env.user._is_internal() \
+                and self.env.user.has_group('custom_hotel_management.group_hotel_user'):
+            channels = list(channels) + list(self.env.user.company_ids)
+        return channels
@@ -0,0 +1,322 @@
+import logging
+from collections import Counter
+from datetime import timedelta
+
+from odoo import models, fields, api
+from odoo.exceptions import ValidationError
+
+from .hotel_room_night import stay_nights_bounds
+
+_logger = logging.getLogger(__name__)
+
+INVENTORY_HORIZON_DAYS = 365
+
+# Counters of [%(first)s, %(stop)s) for the given branches and room types, straight from the source
+# tables: rooms (total), live reservations (sold), rooms under maintenance (out of order).
+RECOUNT_SQL = """
+    WITH keys AS (
+        SELECT company_id, room_type_id, count(*) AS total
+          FROM hotel_room
+         WHERE company_id IN %(company_ids)s AND room_type_id IN %(room_type_ids)s
+         GROUP BY company_id, room_type_id
+    ), sold AS (
+        SELECT r.company_id, r.room_type_id, n.date::date AS date, count(*) AS sold
+          FROM hotel_reservation r
+         CROSS JOIN LATERAL generate_series(
+                GREATEST(r.check_in::date, %(first)s::date),
+                LEAST(GREATEST(r.check_out::date - 1, r.check_in::date), %(stop)s::date - 1),
+                interval '1 day') AS n(date)
+         WHERE r.status <> 'cancelled'
+           AND r.company_id IN %(company_ids)s AND r.room_type_id IN %(room_type_ids)s
+           AND r.check_in < %(stop)s AND r.check_out >= %(first)s
+           AND r.id NOT IN %(exclude_ids)s
+         GROUP BY 1, 2, 3
+    ), out_of_order AS (
+        SELECT rm.company_id, rm.room_type_id, n.date::date AS date, count(DISTINCT t.room_id) AS out_of_order
+          FROM hotel_maintenance_task t
+          JOIN hotel_room rm ON rm.id = t.room_id
+         CROSS JOIN LATERAL (SELECT COALESCE(t.date_scheduled, t.date_reported) AS start) s
+         CROSS JOIN LATERAL generate_series(
+                GREATEST(s.start::date, %(first)s::date),
+                LEAST(GREATEST((s.start + COALESCE(t.duration_hours, 0) * interval '1 hour')::date, s.start::date),
+                      %(stop)s::date - 1),
+                interval '1 day') AS n(date)
+         WHERE t.status = 'in_progress'
+           AND rm.company_id IN %(company_ids)s AND rm.room_type_id IN %(room_type_ids)s
+         GROUP BY 1, 2, 3
+    )
+    INSERT INTO hotel_room_inventory (company_id, room_type_id, date, total, sold, out_of_order, overbooking_limit)
+    SELECT k.company_id, k.room_type_id, d.date::date, k.total,
+           COALESCE(s.sold, 0), COALESCE(o.out_of_order, 0), COALESCE(rt.overbooking_limit, 0)
+      FROM keys k
+      JOIN hotel_room_type rt ON rt.id = k.room_type_id
+     CROSS JOIN generate_series(%(first)s::date, %(stop)s::date - 1, interval '1 day') AS d(date)
+      LEFT JOIN sold s ON s.company_id = k.company_id AND s.room_type_id = k.room_type_id AND s.date = d.date
+      LEFT JOIN out_of_order o ON o.company_id = k.company_id AND o.room_type_id = k.room_type_id AND o.date = d.date
+"""
+
+
+class HotelRoomInventory(models.Model):
+    """Sellable inventory per branch, room type and night.
+
+    Bookings take and give back allotment with one checked UPDATE per batch,
+    so two agents selling the last room serialize on the inventory rows and
+    only one of them succeeds. Counters are derived data: rows missing for a
+    night are rebuilt from the source tables on first use, and a daily job
+    reconciles the sales horizon.
+    """
+    _name = 'hotel.room.inventory'
+    _description = 'Room Type Inventory'
+    _order = 'date, company_id, room_type_id'
+    _log_access = False
+
+    company_id = fields.Many2one('res.company', string="Branch", required=True, readonly=True, ondelete='cascade')
+    room_type_id = fields.Many2one('hotel.room.type', string="Room Type", required=True, readonly=True, ondelete='cascade')
+    date = fields.Date(string="Night", required=True, readonly=True)
+    total = fields.Integer(string="Rooms", readonly=True)
+    sold = fields.Integer(string="Sold", readonly=True)
+    out_of_order = fields.Integer(string="Out of Order", readonly=True)
+    overbooking_limit = fields.Integer(string="Overbooking Limit", readonly=True)
+    available = fields.Integer(string="Available", compute='_compute_available')
+
+    _sql_constraints = [
+        ('company_type_date_uniq', 'unique(company_id, room_type_id, date)',
+         "Inventory is kept once per branch, room type and night."),
+    ]
+
+    @api.depends('total', 'sold', 'out_of_order', 'overbooking_limit')
+    def _compute_available(self):
+        for row in self:
+            row.available = row.total + row.overbooking_limit - row.sold - row.out_of_order
+
+    @api.model
+    def _recount(self, first, stop, company_ids, room_type_ids, exclude_ids=(), missing_only=False):
+        """Rebuild the counters of [first, stop) from the source tables; returns the rows changed."""
+        if not (company_ids and room_type_ids) or first >= stop:
+            return 0
+        self.env['hotel.reservation'].flush_model(['company_id', 'room_type_id', 'check_in', 'check_out', 'status'])
+        self.env['hotel.maintenance.task'].flush_model(['room_id', 'status', 'date_scheduled', 'date_reported', 'duration_hours'])
+        self.env['hotel.room'].flush_model(['company_id', 'room_type_id'])
+        self.env['hotel.room.type'].flush_model(['overbooking_limit'])
+        conflict = "DO NOTHING" if missing_only else """
+            DO UPDATE SET total = EXCLUDED.total, sold = EXCLUDED.sold,
+                          out_of_order = EXCLUDED.out_of_order, overbooking_limit = EXCLUDED.overbooking_limit
+                    WHERE (hotel_room_inventory.total, hotel_room_inventory.sold,
+                           hotel_room_inventory.out_of_order, hotel_room_inventory.overbooking_limit)
+                          IS DISTINCT FROM
+                          (EXCLUDED.total, EXCLUDED.sold, EXCLUDED.out_of_order, EXCLUDED.overbooking_limit)
+        """
+        self.env.cr.execute(RECOUNT_SQL + " ON CONFLICT (company_id, room_type_id, date) " + conflict, {
+            'first': first, 'stop': stop,
+            'company_ids': tuple(company_ids), 'room_type_ids': tuple(room_type_ids),
+            'exclude_ids': tuple(exclude_ids) or (0,),
+        })
+        self.invalidate_model()
+        return self.env.cr.rowcount
+
+    @api.model
+    def _allot(self, stays, exclude_ids=()):
+        """Take one room per stay; ``stays`` are (company_id, room_type_id, first, stop) tuples.
+
+        All the stays are taken with a single UPDATE over their nights, then
+        checked once against the allotment (overbooking limit included). If
+        one night runs short, the whole batch is rolled back and refused.
+        """
+        stays = Counter(stays)
+        if not stays:
+            return
+        cr = self.env.cr
+        self._recount(
+            min(stay[2] for stay in stays), max(stay[3] for stay in stays),
+            list({stay[0] for stay in stays}), list({stay[1] for stay in stays}),
+            exclude_ids=exclude_ids, missing_only=True)
+        keys = list(stays)
+        with cr.savepoint(flush=False):
+            cr.execute("""
+                WITH nights AS (
+                    SELECT s.company_id, s.room_type_id, n.date::date AS date, SUM(s.qty) AS qty
+                      FROM unnest(%s::int[], %s::int[], %s::date[], %s::date[], %s::int[])
+                           AS s(company_id, room_type_id, first_night, stop_night, qty)
+                     CROSS JOIN LATERAL generate_series(
+                            s.first_night, s.stop_night - 1, interval '1 day') AS n(date)
+                     GROUP BY 1, 2, 3
+                ), taken AS (
+                    UPDATE hotel_room_inventory i
+                       SET sold = i.sold + n.qty
+                      FROM nights n
+                     WHERE i.company_id = n.company_id AND i.room_type_id = n.room_type_id AND i.date = n.date
+                 RETURNING i.company_id, i.room_type_id, i.date,
+                           i.sold + i.out_of_order > i.total + i.overbooking_limit AS short
+                )
+                SELECT n.room_type_id, n.date
+                  FROM nights n
+                  LEFT JOIN taken t
+                    ON t.company_id = n.company_id AND t.room_type_id = n.room_type_id AND t.date = n.date
+                 WHERE t.date IS NULL OR t.short
+                 ORDER BY n.date, n.room_type_id
+                 LIMIT 1
+            """, [[key[0] for key in keys], [key[1] for key in keys], [key[2] for key in keys],
+                  [key[3] for key in keys], [stays[key] for key in keys]])
+            short = cr.fetchone()
+            if short:
+                room_type = self.env['hotel.room.type'].browse(short[0])
+                raise ValidationError("No %s left on %s." % (room_type.display_name, short[1]))
+        self.invalidate_model()
+
+    @api.model
+    def _release(self, stays):
+        """Give back the allotment of stays; nights without a counter row have nothing to release."""
+        for (company_id, room_type_id, first, stop), qty in Counter(stays).items():
+            self.env.cr.execute("""
+                UPDATE hotel_room_inventory
+                   SET sold = GREATEST(sold - %s, 0)
+                 WHERE company_id = %s AND room_type_id = %s AND date >= %s AND date < %s
+            """, [qty, company_id, room_type_id, first, stop])
+        self.invalidate_model()
+
+    @api.model
+    def get_type_availability(self, company_id, date_start, date_end, room_type_ids=None):
+        """{room_type_id: rooms still sellable on every night of the window} with one range read."""
+        first, stop = stay_nights_bounds(date_start, date_end)
+        if room_type_ids is None:
+            room_type_ids = self.env['hotel.room'].search([('company_id', '=', company_id)]).room_type_id.ids
+        self._recount(first, stop, [company_id], room_type_ids, missing_only=True)
+        self.env.cr.execute("""
+            SELECT room_type_id, MIN(total + overbooking_limit - sold - out_of_order)
+              FROM hotel_room_inventory
+             WHERE company_id = %s AND room_type_id IN %s AND date >= %s AND date < %s
+             GROUP BY room_type_id
+        """, [company_id, tuple(room_type_ids) or (0,), first, stop])
+        return {room_type_id: max(available, 0) for room_type_id, available in self.env.cr.fetchall()}
+
+    @api.model
+    def cron_reconcile(self, horizon_days=INVENTORY_HORIZON_DAYS):
+        """Rebuild the counters of the sales horizon from reservations and maintenance."""
+        today = fields.Date.context_today(self)
+        self.env.cr.execute("SELECT DISTINCT company_id, room_type_id FROM hotel_room WHERE room_type_id IS NOT NULL")
+        keys = self.env.cr.fetchall()
+        fixed = self._recount(
+            today, today + timedelta(days=horizon_days),
+            list({key[0] for key in keys}), list({key[1] for key in keys}))
+        if fixed:
+            _logger.info("Room inventory: %s counter row(s) rebuilt", fixed)
+        return fixed
+
+    @api.model
+    def _recount_keys(self, keys):
+        """Refresh the counters of (company_id, room_type_id) pairs from today on."""
+        keys = {key for key in keys if key[0] and key[1]}
+        if keys:
+            today = fields.Date.context_today(self)
+            self._recount(today, today + timedelta(days=INVENTORY_HORIZON_DAYS),
+                          list({key[0] for key in keys}), list({key[1] for key in keys}))
+
+
+class HotelRoomType(models.Model):
+    _inherit = 'hotel.room.type'
+
+    overbooking_limit = fields.Integer(
+        string="Overbooking Limit", default=0,
+        help="Extra rooms of this type that may be sold per night beyond the physical inventory.")
+
+    def write(self, vals):
+        res = super().write(vals)
+        if 'overbooking_limit' in vals:
+            self.flush_recordset(['overbooking_limit'])
+            self.env.cr.execute("""
+                UPDATE hotel_room_inventory i
+                   SET overbooking_limit = t.overbooking_limit
+                  FROM hotel_room_type t
+                 WHERE t.id = i.room_type_id AND t.id IN %s AND i.date >= %s
+            """, [tuple(self.ids), fields.Date.context_today(self)])
+            self.env['hotel.room.inventory'].invalidate_model()
+        return res
+
+
+class HotelRoom(models.Model):
+    _inherit = 'hotel.room'
+
+    def _inventory_keys(self):
+        return {(room.company_id.id, room.room_type_id.id) for room in self}
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        rooms = super().create(vals_list)
+        self.env['hotel.room.inventory']._recount_keys(rooms._inventory_keys())
+        return rooms
+
+    def write(self, vals):
+        if not {'company_id', 'room_type_id'}.intersection(vals):
+            return super().write(vals)
+        keys = self._inventory_keys()
+        res = super().write(vals)
+        self.env['hotel.room.inventory']._recount_keys(keys | self._inventory_keys())
+        return res
+
+    def unlink(self):
+        keys = self._inventory_keys()
+        res = super().unlink()
+        self.env['hotel.room.inventory']._recount_keys(keys)
+        return res
+
+
+class HotelMaintenanceTask(models.Model):
+    _inherit = 'hotel.maintenance.task'
+
+    def _inventory_keys(self):
+        return {(task.room_id.company_id.id, task.room_id.room_type_id.id) for task in self.sudo()}
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        tasks = super().create(vals_list)
+        self.env['hotel.room.inventory']._recount_keys(tasks.filtered(lambda t: t.status == 'in_progress')._inventory_keys())
+        return tasks
+
+    def write(self, vals):
+        if not {'status', 'room_id', 'date_scheduled', 'date_reported', 'duration_hours'}.intersection(vals):
+            return super().write(vals)
+        keys = self._inventory_keys()
+        res = super().write(vals)
+        self.env['hotel.room.inventory']._recount_keys(keys | self._inventory_keys())
+        return res
+
+
+class HotelReservation(models.Model):
+    _inherit = 'hotel.reservation'
+
+    _INVENTORY_FIELDS = {'room_id', 'room_type_id', 'company_id', 'check_in', 'check_out', 'status'}
+
+    def _inventory_stays(self):
+        """(company_id, room_type_id, first night, stop night) held by these reservations."""
+        return sorted(
+            (rec.company_id.id, rec.room_type_id.id, *stay_nights_bounds(rec.check_in, rec.check_out))
+            for rec in self.sudo()
+            if rec.status != 'cancelled' and rec.room_type_id and rec.company_id and rec.check_in and rec.check_out
+        )
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        if self.env.context.get('hotel_defer_inventory'):
+            return super().create(vals_list)
+        # rooms auto-assigned during create must not allot on their own
+        records = super(HotelReservation, self.with_context(hotel_defer_inventory=True)).create(vals_list)
+        records = records.with_env(self.env)
+        self.env['hotel.room.inventory']._allot(records._inventory_stays(), exclude_ids=records.ids)
+        return records
+
+    def write(self, vals):
+        if self.env.context.get('hotel_defer_inventory') or not self._INVENTORY_FIELDS.intersection(vals):
+            return super().write(vals)
+        before = self._inventory_stays()
+        res = super().write(vals)
+        after = self._inventory_stays()
+        if before != after:
+            Inventory = self.env['hotel.room.inventory']
+            Inventory._release(before)
+            Inventory._allot(after, exclude_ids=self.ids)
+        return res
+
+    def unlink(self):
+        if not self.env.context.get('hotel_defer_inventory'):
+            self.env['hotel.room.inventory']._release(self._inventory_stays())
+        return super().unlink()
@@ -0,0 +1,140 @@
+import logging
+from datetime import timedelta
+
+from odoo import models, fields, api
+from odoo.tools import sql
+
+_logger = logging.getLogger(__name__)
+
+# Nights of a stay: every date from check-in up to (excluding) check-out, at least one.
+STAY_NIGHTS_SQL = """
+    generate_series(
+        r.check_in::date,
+        GREATEST(r.check_out::date - 1, r.check_in::date),
+        interval '1 day'
+    )::date
+"""
+
+LIVE_STAY_SQL = """
+    r.status <> 'cancelled'
+    AND r.room_id IS NOT NULL
+    AND r.check_in IS NOT NULL AND r.check_out IS NOT NULL
+"""
+
+
+def stay_nights_bounds(date_start, date_end):
+    """Return the [first night, last night + 1) date bounds of a stay window."""
+    first = fields.Datetime.to_datetime(date_start).date()
+    stop = fields.Datetime.to_datetime(date_end).date() if date_end else first
+    return first, max(stop, first + timedelta(days=1))
+
+
+def stay_nights(date_start, date_end):
+    """Dates of every night of a stay, as stored in hotel.room.night."""
+    first, stop = stay_nights_bounds(date_start, date_end)
+    return [first + timedelta(days=i) for i in range((stop - first).days)]
+
+
+class HotelRoomNight(models.Model):
+    _name = 'hotel.room.night'
+    _description = 'Room Night Occupancy'
+    _order = 'date, room_id'
+    _log_access = False
+
+    room_id = fields.Many2one('hotel.room', string='Room', required=True, ondelete='cascade', index=True)
+    date = fields.Date(string='Night', required=True)
+    reservation_id = fields.Many2one('hotel.reservation', string='Reservation', required=True, ondelete='cascade', index=True)
+    company_id = fields.Many2one('res.company', string='Branch', required=True, ondelete='cascade')
+
+    def init(self):
+        cr = self.env.cr
+        if not sql.index_exists(cr, 'hotel_room_night_date_room_idx'):
+            sql.create_index(cr, 'hotel_room_night_date_room_idx', self._table, ['date', 'room_id'])
+        cr.execute("SELECT 1 FROM hotel_room_night LIMIT 1")
+        if not cr.fetchone():
+            self._rebuild()
+
+    @api.model
+    def _occupied_room_ids(self, room_ids, date_start, date_end):
+        """Rooms among ``room_ids`` that have at least one night booked in the window."""
+        if not room_ids:
+            return set()
+        first, stop = stay_nights_bounds(date_start, date_end)
+        self.env.cr.execute("""
+            SELECT DISTINCT room_id
+              FROM hotel_room_night
+             WHERE date >= %s AND date < %s
+               AND room_id IN %s
+        """, [first, stop, tuple(room_ids)])
+        return {row[0] for row in self.env.cr.fetchall()}
+
+    @api.model
+    def _sync_reservations(self, reservation_ids):
+        """Recompute the nights of the given reservations (set-based)."""
+        if not reservation_ids:
+            return
+        self.env['hotel.reservation'].flush_model(['room_id', 'company_id', 'check_in', 'check_out', 'status'])
+        ids = tuple(reservation_ids)
+        self.env.cr.execute("DELETE FROM hotel_room_night WHERE reservation_id IN %s", [ids])
+        self._insert_nights("r.id IN %s", [ids])
+
+    def _insert_nights(self, where, params):
+        self.env.cr.execute(f"""
+            INSERT INTO hotel_room_night (room_id, date, reservation_id, company_id)
+            SELECT r.room_id, {STAY_NIGHTS_SQL}, r.id, r.company_id
+              FROM hotel_reservation r
+             WHERE {LIVE_STAY_SQL} AND {where}
+        """, params)
+        self.invalidate_model()
+
+    @api.model
+    def _find_inconsistent_reservation_ids(self):
+        """Reservations whose stored nights differ from what their dates imply."""
+        self.env['hotel.reservation'].flush_model()
+        self.env.cr.execute(f"""
+            WITH expected AS (
+                SELECT r.id AS reservation_id, r.room_id, {STAY_NIGHTS_SQL} AS date
+                  FROM hotel_reservation r
+                 WHERE {LIVE_STAY_SQL}
+            ), actual AS (
+                SELECT reservation_id, room_id, date FROM hotel_room_night
+            )
+            SELECT reservation_id FROM (
+                (SELECT * FROM expected EXCEPT SELECT * FROM actual)
+                UNION ALL
+                (SELECT * FROM actual EXCEPT SELECT * FROM expected)
+            ) diff
+            GROUP BY reservation_id
+        """)
+        return [row[0] for row in self.env.cr.fetchall()]
+
+    @api.model
+    def _rebuild(self):
+        self.env['hotel.reservation'].flush_model()
+        self.env.cr.execute("TRUNCATE hotel_room_night")
+        self._insert_nights("TRUE", [])
+
+    @api.model
+    def cron_check_consistency(self):
+        """Detect and repair drift between reservations and their room nights."""
+        reservation_ids = self._find_inconsistent_reservation_ids()
+        if reservation_ids:
+            _logger.warning("Room nights out of sync for %s reservation(s), repairing", len(reservation_ids))
+            self._sync_reservations(reservation_ids)
+        return reservation_ids
+
+
+class HotelReservation(models.Model):
+    _inherit = 'hotel.reservation'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env['hotel.room.night']._sync_reservations(records.ids)
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        if {'room_id', 'check_in', 'check_out', 'status'}.intersection(vals):
+            self.env['hotel.room.night']._sync_reservations(self.ids)
+        return res
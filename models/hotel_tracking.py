@@ -0,0 +1,144 @@
+import logging
+from datetime import timedelta
+
+from odoo import models, fields, api
+
+_logger = logging.getLogger(__name__)
+
+class ResCompany(models.Model):
+    _inherit = 'res.company'
+
+    hotel_light_tracking = fields.Boolean(
+        string="Lightweight Hotel Tracking",
+        help="Only track the key fields of reservations, event bookings and housekeeping / maintenance "
+             "tasks, and log nothing in the chatter for automatic changes (scheduled jobs, room sync).")
+
+
+class HotelTrackingMixin(models.AbstractModel):
+    """Curated mail tracking for high-churn hotel models.
+
+    Models list their key fields in ``_hotel_tracked_fields``. When every
+    branch of the records has lightweight tracking enabled, only those fields
+    are tracked. System-originated writes (crons, automatic syncs) go through
+    ``_hotel_system_writer``, which silences them with the standard
+    ``mail_notrack`` / ``mail_create_nolog`` keys on those branches: mail.thread
+    decides what to track once per transaction, so the decision cannot be
+    left to ``_track_get_fields``.
+    """
+    _name = 'hotel.tracking.mixin'
+    _description = 'Hotel Lightweight Tracking'
+    _inherit = ['mail.thread']
+
+    _hotel_tracked_fields = ()
+
+    def _hotel_light_tracking(self):
+        companies = self.sudo().company_id or self.env.company
+        return all(companies.mapped('hotel_light_tracking'))
+
+    def _track_get_fields(self):
+        tracked = super()._track_get_fields()
+        if not tracked or not self._hotel_light_tracking():
+            return tracked
+        return tracked & set(self._hotel_tracked_fields)
+
+    @api.model
+    def _hotel_system_writer(self, companies):
+        """This model, set up for an automatic write on records of ``companies``."""
+        if companies and all(companies.sudo().mapped('hotel_light_tracking')):
+            return self.with_context(mail_notrack=True, mail_create_nolog=True)
+        return self
+
+
+class HotelReservation(models.Model):
+    _inherit = ['hotel.reservation', 'hotel.tracking.mixin']
+
+    _hotel_tracked_fields = ('status', 'room_id', 'guest_id', 'check_in', 'check_out')
+
+
+class HotelEventBooking(models.Model):
+    _inherit = ['hotel.event.booking', 'hotel.tracking.mixin']
+
+    _hotel_tracked_fields = ('status', 'hall_id', 'customer_id', 'event_date', 'duration_hours')
+
+
+class HotelHousekeepingTask(models.Model):
+    _inherit = ['hotel.housekeeping.task', 'hotel.tracking.mixin']
+
+    _hotel_tracked_fields = ('status', 'assigned_to')
+
+
+class HotelMaintenanceTask(models.Model):
+    _inherit = ['hotel.maintenance.task', 'hotel.tracking.mixin']
+
+    _hotel_tracked_fields = ('status', 'assigned_user_id', 'priority')
+
+
+class MailMessage(models.Model):
+    _inherit = 'mail.message'
+
+    @api.model
+    def cron_prune_hotel_tracking(self, days=90, batch_size=5000, max_batches=50):
+        """Prune tracking noise older than ``days`` on branches using lightweight tracking.
+
+        Tracking values of fields outside the curated sets are deleted first,
+        then the notifications left with no body, tracking value or
+        attachment. Runs in batches with a commit after each one, so it can
+        chew through years of history without one huge transaction.
+        """
+        cutoff = fields.Datetime.now() - timedelta(days=days)
+        pruned = 0
+        for model_name in ('hotel.reservation', 'hotel.event.booking', 'hotel.housekeeping.task', 'hotel.maintenance.task'):
+            Model = self.env[model_name]
+            curated = [field_id for field_id in (
+                self.env['ir.model.fields']._get(model_name, fname).id for fname in Model._hotel_tracked_fields
+            ) if field_id]
+            for query in (self._prune_tracking_values_query(Model), self._prune_empty_messages_query(Model)):
+                for _batch in range(max_batches):
+                    self.env.cr.execute(query, {
+                        'model': model_name, 'cutoff': cutoff, 'curated': tuple(curated) or (0,), 'limit': batch_size,
+                    })
+                    count = self.env.cr.rowcount
+                    pruned += count
+                    if not self.env.registry.in_test_mode():
+                        self.env.cr.commit()
+                    if count < batch_size:
+                        break
+        self.env.invalidate_all()
+        _logger.info("Pruned %s hotel tracking rows older than %s", pruned, cutoff)
+        return pruned
+
+    @api.model
+    def _prune_tracking_values_query(self, Model):
+        return f"""
+            DELETE FROM mail_tracking_value
+             WHERE id IN (
+                SELECT v.id
+                  FROM mail_tracking_value v
+                  JOIN mail_message m ON m.id = v.mail_message_id
+                  JOIN {Model._table} r ON r.id = m.res_id
+                  JOIN res_company c ON c.id = r.company_id
+                 WHERE m.model = %(model)s
+                   AND m.create_date < %(cutoff)s
+                   AND c.hotel_light_tracking
+                   AND v.field_id NOT IN %(curated)s
+                 LIMIT %(limit)s)
+        """
+
+    @api.model
+    def _prune_empty_messages_query(self, Model):
+        return f"""
+            DELETE FROM mail_message
+             WHERE id IN (
+                SELECT m.id
+                  FROM mail_message m
+                  JOIN {Model._table} r ON r.id = m.res_id
+                  JOIN res_company c ON c.id = r.company_id
+                 WHERE m.model = %(model)s
+                   AND m.message_type = 'notification'
+                   AND m.create_date < %(cutoff)s
+                   AND c.hotel_light_tracking
+                   AND COALESCE(m.body, '') IN ('', '<p></p>')
+                   AND NOT EXISTS (SELECT 1 FROM mail_tracking_value v WHERE v.mail_message_id = m.id)
+                   AND NOT EXISTS (SELECT 1 FROM message_attachment_rel a WHERE a.message_id = m.id)
+                 LIMIT %(limit)s)
+        """
@@ -0,0 +1,23 @@
+from odoo import models, api
+
+
+class IrSequence(models.Model):
+    _inherit = 'ir.sequence'
+
+    @api.model
+    def _next_by_code_batch(self, code, count):
+        """``count`` consecutive values of the ``code`` sequence.
+
+        Standard sequences without date ranges draw all numbers with a single
+        nextval() statement; other sequences fall back to next_by_code().
+        """
+        if not count:
+            return []
+        sequence = self.sudo().search(
+            [('code', '=', code), ('company_id', 'in', [self.env.company.id, False])],
+            order='company_id', limit=1)
+        if not sequence or sequence.implementation != 'standard' or sequence.use_date_range:
+            return [self.sudo().next_by_code(code) for _i in range(count)]
+        self.env.cr.execute(
+            "SELECT nextval(%s) FROM generate_series(1, %s)", ['ir_sequence_%03d' % sequence.id, count])
+        return [sequence.get_next_char(number) for number, in self.env.cr.fetchall()]
@@ -0,0 +1,3 @@
+from . import hotel_materialized_report
+from . import hotel_occupancy_report
+from . import hotel_event_hall_utilization_report
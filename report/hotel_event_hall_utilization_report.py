@@ -0,0 +1,66 @@
+from odoo import models, fields
+
+# Ratio measures rolled up from the summed base measures: field -> (scale, numerator, denominator).
+RATIO_MEASURES = {
+    'utilization_rate': (100.0, 'booked_hours', 'available_hours'),
+    'revenue_per_available_hour': (1.0, 'revenue', 'available_hours'),
+}
+
+
+class HotelEventHallUtilizationReport(models.Model):
+    """Daily utilisation and revenue per available hour of every event hall.
+
+    Reads the hourly buckets maintained in hotel.event.hall.slot, so no
+    booking end time has to be computed in Python at report time. Backed by
+    a materialized view refreshed concurrently by cron, like the occupancy
+    report, so reads never aggregate the slot table.
+    """
+    _name = 'hotel.event.hall.utilization.report'
+    _inherit = 'hotel.materialized.report'
+    _description = 'Event Hall Utilisation Report'
+    _auto = False
+    _order = 'date desc'
+
+    # utilisation of a month is its booked hours over its available hours
+    _ratio_measures = RATIO_MEASURES
+    _refresh_models = ('hotel.event.hall.slot', 'hotel.event.hall')
+
+    date = fields.Date(string="Day", readonly=True)
+    hall_id = fields.Many2one('hotel.event.hall', string="Hall", readonly=True)
+    hall_type_id = fields.Many2one('hotel.event.hall.type', string="Hall Type", readonly=True)
+    company_id = fields.Many2one('res.company', string="Branch", readonly=True)
+    available_hours = fields.Float(string="Available Hours", readonly=True)
+    booked_hours = fields.Float(string="Booked Hours", readonly=True)
+    revenue = fields.Float(string="Revenue", readonly=True)
+    utilization_rate = fields.Float(string="Utilisation (%)", aggregator='avg', readonly=True)
+    revenue_per_available_hour = fields.Float(string="Revenue / Available Hour", aggregator='avg', readonly=True)
+
+    def _query(self):
+        return """
+            WITH calendar AS (
+                SELECT generate_series(
+                    (SELECT LEAST(MIN(slot_start)::date, CURRENT_DATE) FROM hotel_event_hall_slot),
+                    (SELECT GREATEST(MAX(slot_start)::date, CURRENT_DATE) FROM hotel_event_hall_slot),
+                    interval '1 day'
+                )::date AS date
+            ), usage AS (
+                SELECT hall_id, slot_start::date AS date,
+                       SUM(booked_hours) AS booked_hours,
+                       SUM(revenue) AS revenue
+                  FROM hotel_event_hall_slot
+                 GROUP BY hall_id, slot_start::date
+            )
+            SELECT h.id * 100000 + (c.date - DATE '2000-01-01') AS id,
+                   c.date,
+                   h.id AS hall_id,
+                   h.hall_type_id,
+                   h.company_id,
+                   COALESCE(NULLIF(h.available_hours_per_day, 0), 24) AS available_hours,
+                   COALESCE(u.booked_hours, 0) AS booked_hours,
+                   COALESCE(u.revenue, 0) AS revenue,
+                   100.0 * COALESCE(u.booked_hours, 0) / COALESCE(NULLIF(h.available_hours_per_day, 0), 24) AS utilization_rate,
+                   COALESCE(u.revenue, 0) / COALESCE(NULLIF(h.available_hours_per_day, 0), 24) AS revenue_per_available_hour
+              FROM calendar c
+             CROSS JOIN hotel_event_hall h
+              LEFT JOIN usage u ON u.hall_id = h.id AND u.date = c.date
+        """
@@ -0,0 +1,56 @@
+import logging
+
+from odoo import models, api
+from odoo.tools import SQL
+
+_logger = logging.getLogger(__name__)
+
+
+class HotelMaterializedReport(models.AbstractModel):
+    """Report backed by a materialized view, refreshed concurrently by cron.
+
+    Implementers provide ``_query()``, whose rows carry a stable unique
+    ``id``, a ``date`` and a ``company_id``; ``_refresh_models`` lists the
+    models to flush before a refresh. Measures listed in ``_ratio_measures``
+    (field -> (scale, numerator, denominator)) are grouped as the ratio of
+    the summed base measures, not as the mean of the row ratios.
+    """
+    _name = 'hotel.materialized.report'
+    _description = 'Hotel Materialized Report'
+    _auto = False
+
+    _ratio_measures = {}
+    _refresh_models = ()
+
+    def _query(self):
+        raise NotImplementedError()
+
+    def _read_group_select(self, aggregate_spec, query):
+        fname, __, func = aggregate_spec.partition(':')
+        if fname in self._ratio_measures and func == 'avg':
+            scale, numerator, denominator = self._ratio_measures[fname]
+            return SQL(
+                "COALESCE(%s * SUM(%s) / NULLIF(SUM(%s), 0), 0)",
+                scale,
+                self._field_to_sql(self._table, numerator, query),
+                self._field_to_sql(self._table, denominator, query),
+            )
+        return super()._read_group_select(aggregate_spec, query)
+
+    def init(self):
+        if self._abstract:
+            return
+        cr = self.env.cr
+        cr.execute(f"DROP MATERIALIZED VIEW IF EXISTS {self._table} CASCADE")
+        cr.execute(f"CREATE MATERIALIZED VIEW {self._table} AS ({self._query()})")
+        # a unique index is required by REFRESH ... CONCURRENTLY
+        cr.execute(f"CREATE UNIQUE INDEX {self._table}_id_idx ON {self._table} (id)")
+        cr.execute(f"CREATE INDEX {self._table}_date_company_idx ON {self._table} (date, company_id)")
+
+    @api.model
+    def cron_refresh(self):
+        for model_name in self._refresh_models:
+            self.env[model_name].flush_model()
+        self.env.cr.execute(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {self._table}")
+        self.invalidate_model()
+        _logger.info("%s refreshed", self._description)
@@ -0,0 +1,42 @@
+/** @odoo-module **/
+
+import { Component, onWillStart, onWillUnmount, useState } from "@odoo/owl";
+import { registry } from "@web/core/registry";
+import { useService } from "@web/core/utils/hooks";
+
+// The server caches snapshots for a few seconds, polling faster gains nothing.
+const REFRESH_INTERVAL = 10000;
+
+export class FrontDeskDashboard extends Component {
+    static template = "custom_hotel_management.FrontDeskDashboard";
+    static props = ["*"];
+
+    setup() {
+        this.orm = useService("orm");
+        this.state = useState({ branches: [], loading: true });
+        onWillStart(() => this.load());
+        const interval = setInterval(() => this.load(), REFRESH_INTERVAL);
+        onWillUnmount(() => clearInterval(interval));
+    }
+
+    async load() {
+        this.state.branches = await this.orm.call("hotel.dashboard", "get_front_desk_snapshot", []);
+        this.state.loading = false;
+    }
+
+    get tiles() {
+        return [
+            ["arrivals", "Arrivals"],
+            ["departures", "Departures"],
+            ["in_house", "In House"],
+            ["rooms_available", "Available Rooms"],
+            ["rooms_occupied", "Occupied Rooms"],
+            ["rooms_dirty", "Dirty Rooms"],
+            ["rooms_cleaning", "Being Cleaned"],
+            ["rooms_maintenance", "In Maintenance"],
+            ["housekeeping_open", "Open Housekeeping Tasks"],
+        ];
+    }
+}
+
+registry.category("actions").add("hotel_front_desk_dashboard", FrontDeskDashboard);
@@ -0,0 +1,59 @@
+/** @odoo-module **/
+
+import { Component, onWillStart, onWillUnmount, useState } from "@odoo/owl";
+import { registry } from "@web/core/registry";
+import { useBus, useService } from "@web/core/utils/hooks";
+
+const STATUS_LABELS = {
+    available: "Available",
+    occupied: "Occupied",
+    dirty: "Dirty",
+    cleaning: "Cleaning",
+    maintenance: "Maintenance",
+};
+
+export class RoomBoard extends Component {
+    static template = "custom_hotel_management.RoomBoard";
+    static props = ["*"];
+
+    setup() {
+        this.orm = useService("orm");
+        this.busService = this.env.services.bus_service;
+        this.state = useState({ rooms: {}, loading: true });
+        this.statusLabels = STATUS_LABELS;
+        onWillStart(() => this.load());
+        // the server publishes one delta per change, no polling needed
+        const onStatus = (payload) => this.applyDeltas(payload.rooms);
+        this.busService.subscribe("hotel.room_status", onStatus);
+        onWillUnmount(() => this.busService.unsubscribe("hotel.room_status", onStatus));
+        // reload once after a lost connection: deltas sent meanwhile are gone
+        useBus(this.busService, "reconnect", () => this.load());
+    }
+
+    async load() {
+        const rooms = await this.orm.searchRead(
+            "hotel.room", [], ["name", "status", "floor_number", "company_id"], { order: "floor_number, name" }
+        );
+        this.state.rooms = Object.fromEntries(rooms.map((room) => [room.id, room]));
+        this.state.loading = false;
+    }
+
+    applyDeltas(deltas) {
+        for (const delta of deltas) {
+            const room = this.state.rooms[delta.id];
+            if (room) {
+                room.status = delta.status;
+            }
+        }
+    }
+
+    get floors() {
+        const floors = {};
+        for (const room of Object.values(this.state.rooms)) {
+            (floors[room.floor_number] ||= []).push(room);
+        }
+        return Object.entries(floors).map(([floor, rooms]) => ({ floor, rooms }));
+    }
+}
+
+registry.category("actions").add("hotel_room_board", RoomBoard);
@@ -0,0 +1,15 @@
+from . import test_reservation_overlap
+from . import test_event_booking
+from . import test_housekeeping_cron
+from . import test_channel_manager
+from . import test_room_assignment
+from . import test_reservation_import
+from . import test_query_plans
+from . import test_invoicing
+from . import test_dashboard
+from . import test_rate_plan
+from . import test_tracking
+from . import test_room_inventory
+from . import test_batch_create
+from . import test_room_night
+from . import test_archive
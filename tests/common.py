@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta
+
+from odoo.tests import TransactionCase
+
+
+class HotelCommon(TransactionCase):
+    """A branch with a room type, a few rooms and a guest, plus SQL seeding helpers."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.env = cls.env(context=dict(cls.env.context, tracking_disable=True))
+        cls.company = cls.env.company
+        cls.room_type = cls.env['hotel.room.type'].create({'name': 'Test Double', 'capacity': 2, 'default_price': 100.0})
+        cls.rooms = cls.env['hotel.room'].create([
+            {'name': 'T%03d' % number, 'room_type_id': cls.room_type.id, 'company_id': cls.company.id}
+            for number in range(1, 4)
+        ])
+        cls.guest = cls.env['res.partner'].create({'name': 'Test Guest'})
+        cls.start = datetime(2031, 3, 2, 14, 0)
+
+    @classmethod
+    def _reservation_vals(cls, room, check_in, nights=2, **vals):
+        return dict({
+            'guest_id': cls.guest.id,
+            'room_id': room.id,
+            'check_in': check_in,
+            'check_out': check_in + timedelta(days=nights),
+            'status': 'confirmed',
+        }, **vals)
+
+    @classmethod
+    def _seed_rooms(cls, count):
+        """Insert ``count`` rooms of the test type with SQL; returns their ids."""
+        cls.env['hotel.room'].flush_model()
+        cls.env.cr.execute("""
+            INSERT INTO hotel_room (name, room_type_id, company_id, currency_id, status, capacity)
+            SELECT 'S' || n, %(type)s, %(company)s, %(currency)s, 'available', 2
+              FROM generate_series(1, %(count)s) AS n
+            RETURNING id
+        """, {'type': cls.room_type.id, 'company': cls.company.id,
+              'currency': cls.company.currency_id.id, 'count': count})
+        return [row[0] for row in cls.env.cr.fetchall()]
+
+    @classmethod
+    def _seed_reservations(cls, room_ids, count, first=None, status='checked_out'):
+        """Insert ``count`` non-overlapping two-night stays spread over ``room_ids`` with SQL.
+
+        Bypasses the ORM (no room nights, inventory or chatter): meant to grow
+        the tables for plans and timings, not to build consistent bookings.
+        """
+        cls.env['hotel.reservation'].flush_model()
+        cls.env.cr.execute("""
+            INSERT INTO hotel_reservation
+                   (name, guest_id, room_id, room_type_id, company_id, currency_id, check_in, check_out,
+                    status, payment_status, booking_source, rate_type, active)
+            SELECT 'SEED/' || n, %(guest)s, r.room_id, %(type)s, %(company)s, %(currency)s,
+                   %(first)s + (n / %(rooms)s) * interval '3 days',
+                   %(first)s + (n / %(rooms)s) * interval '3 days' + interval '2 days',
+                   %(status)s, 'paid', 'website', 'standard', true
+              FROM generate_series(0, %(count)s - 1) AS n
+             CROSS JOIN LATERAL (SELECT (%(room_ids)s::int[])[1 + n %% %(rooms)s] AS room_id) r
+        """, {
+            'guest': cls.guest.id, 'type': cls.room_type.id, 'company': cls.company.id,
+            'currency': cls.company.currency_id.id, 'first': first or datetime(2001, 1, 1, 14, 0),
+            'rooms': len(room_ids), 'room_ids': list(room_ids), 'count': count, 'status': status,
+        })
+
+    def _plan(self, query, params):
+        self.env.cr.execute("EXPLAIN " + query, params)
+        return "\n".join(row[0] for row in self.env.cr.fetchall())
@@ -0,0 +1,113 @@
+from datetime import datetime, timedelta
+
+from odoo import fields
+from odoo.tests import tagged
+
+from .common import HotelCommon
+
+
+@tagged('post_install', '-at_install')
+class TestArchiveHistory(HotelCommon):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.env['ir.config_parameter'].sudo().set_param('custom_hotel_management.archive_after_days', 365)
+        cls.old = datetime(2020, 3, 2, 14, 0)
+        cls.recent = fields.Datetime.now().replace(microsecond=0) + timedelta(days=30)
+
+    def _archived(self, records):
+        return records.with_context(active_test=False).filtered(lambda rec: not rec.active)
+
+    def test_archive_only_old_closed_rows(self):
+        Reservation = self.env['hotel.reservation']
+        room_a, room_b, room_c = self.rooms
+        stays = Reservation.create([
+            self._reservation_vals(room_a, self.old, status='cancelled'),
+            self._reservation_vals(room_b, self.old, status='checked_out', payment_status='paid'),
+            self._reservation_vals(room_c, self.old, status='checked_out', payment_status='unpaid'),
+            self._reservation_vals(room_a, self.old + timedelta(days=5), status='confirmed'),
+            self._reservation_vals(room_a, self.recent, status='cancelled'),
+        ])
+        housekeeping = self.env['hotel.housekeeping.task'].create([
+            {'room_id': room_a.id, 'status': 'done', 'date_scheduled': self.old},
+            {'room_id': room_a.id, 'status': 'pending', 'date_scheduled': self.old},
+            {'room_id': room_a.id, 'status': 'done', 'date_scheduled': self.recent},
+        ])
+        maintenance = self.env['hotel.maintenance.task'].create([
+            {'room_id': room_b.id, 'status': 'done', 'date_scheduled': self.old},
+            {'room_id': room_b.id, 'status': 'cancelled', 'date_scheduled': self.old},
+            {'room_id': room_b.id, 'status': 'pending', 'date_scheduled': self.old},
+            {'room_id': room_b.id, 'status': 'done', 'date_scheduled': self.recent},
+        ])
+
+        self.assertEqual(Reservation.cron_archive_history(), 5)
+        self.assertEqual(self._archived(stays), stays[:2])
+        self.assertEqual(self._archived(housekeeping), housekeeping[:1])
+        self.assertEqual(self._archived(maintenance), maintenance[:2])
+
+        # default searches leave the archived rows out, the "Archived" filter brings them back
+        self.assertEqual(Reservation.search([('id', 'in', stays.ids)]), stays[2:])
+        self.assertEqual(Reservation.search([('id', 'in', stays.ids), ('active', '=', False)]), stays[:2])
+        self.assertEqual(self.env['hotel.maintenance.task'].search([('id', 'in', maintenance.ids)]), maintenance[2:])
+
+        # a second run finds nothing left to archive
+        self.assertEqual(Reservation.cron_archive_history(), 0)
+
+    def test_archive_disabled(self):
+        Reservation = self.env['hotel.reservation']
+        stay = Reservation.create(self._reservation_vals(self.rooms[0], self.old, status='cancelled'))
+        self.env['ir.config_parameter'].sudo().set_param('custom_hotel_management.archive_after_days', 0)
+        self.assertEqual(Reservation.cron_archive_history(), 0)
+        self.assertTrue(stay.active)
+
+
+@tagged('post_install', '-at_install')
+class TestArchiveIndexes(HotelCommon):
+    """Default list searches walk the partial ``WHERE active`` indexes once history is archived."""
+    ROWS = 20_000
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cr = cls.env.cr
+        room_ids = cls._seed_rooms(200)
+        cls._seed_reservations(room_ids, cls.ROWS)
+        cls._seed_reservations(room_ids, 200, first=datetime(2031, 6, 1, 14, 0), status='confirmed')
+        cls.env['hotel.housekeeping.task'].flush_model()
+        cls.env['hotel.maintenance.task'].flush_model()
+        cr.execute("""
+            INSERT INTO hotel_housekeeping_task (room_id, company_id, task_type, status, date_scheduled, active)
+            SELECT (%(room_ids)s::int[])[1 + n %% 200], %(company)s, 'cleaning',
+                   CASE WHEN n %% 100 = 0 THEN 'pending' ELSE 'done' END, %(first)s + n * interval '1 hour', true
+              FROM generate_series(0, %(count)s - 1) AS n
+        """, {'room_ids': room_ids, 'company': cls.company.id, 'first': datetime(2001, 1, 1), 'count': cls.ROWS})
+        cr.execute("""
+            INSERT INTO hotel_maintenance_task
+                   (name, room_id, company_id, task_type, source, status, priority, date_reported, active)
+            SELECT 'Seed ' || n, (%(room_ids)s::int[])[1 + n %% 200], %(company)s, 'inspection', 'manual',
+                   CASE WHEN n %% 100 = 0 THEN 'pending' ELSE 'done' END, '1', %(first)s + n * interval '1 hour', true
+              FROM generate_series(0, %(count)s - 1) AS n
+        """, {'room_ids': room_ids, 'company': cls.company.id, 'first': datetime(2001, 1, 1), 'count': cls.ROWS})
+        cls.env.invalidate_all()
+        cls.archived = cls.env['hotel.reservation'].cron_archive_history(batch_size=cls.ROWS)
+        for table in ('hotel_reservation', 'hotel_housekeeping_task', 'hotel_maintenance_task'):
+            cr.execute(f"ANALYZE {table}")
+
+    def assertDefaultSearchUses(self, model_name, index_name):
+        query = self.env[model_name]._search([], limit=80)
+        sql = query.select()
+        plan = self._plan(sql.code, sql.params)
+        self.assertIn(index_name, plan, plan)
+
+    def test_history_archived(self):
+        self.assertGreaterEqual(self.archived, self.ROWS * 2)
+
+    def test_reservation_list_on_active_index(self):
+        self.assertDefaultSearchUses('hotel.reservation', 'hotel_reservation_active_check_in_idx')
+
+    def test_housekeeping_list_on_active_index(self):
+        self.assertDefaultSearchUses('hotel.housekeeping.task', 'hotel_housekeeping_task_active_scheduled_idx')
+
+    def test_maintenance_list_on_active_index(self):
+        self.assertDefaultSearchUses('hotel.maintenance.task', 'hotel_maintenance_task_active_priority_idx')
@@ -0,0 +1,55 @@
+from datetime import datetime, timedelta
+
+from odoo.tests import tagged
+
+from .common import HotelCommon
+
+
+@tagged('post_install', '-at_install')
+class TestBatchCreate(HotelCommon):
+    """Creating a batch costs the same statements whatever its size."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        hall_type = cls.env['hotel.event.hall.type'].create({'name': 'Test Hall Type'})
+        cls.hall = cls.env['hotel.event.hall'].create({
+            'name': 'Test Hall', 'hall_type_id': hall_type.id, 'capacity': 100,
+        })
+
+    def _create_queries(self, model_name, vals_list):
+        Model = self.env[model_name]
+        self.env.flush_all()
+        self.env.invalidate_all()
+        count = self.cr.sql_log_count
+        Model.create(vals_list)
+        self.env.flush_all()
+        return self.cr.sql_log_count - count
+
+    def _stays(self, offset, count):
+        return [
+            self._reservation_vals(self.rooms[0], self.start + timedelta(days=2 * (offset + i)))
+            for i in range(count)
+        ]
+
+    def _bookings(self, offset, count):
+        first = datetime(2031, 3, 2, 8, 0)
+        return [{
+            'hall_id': self.hall.id,
+            'customer_id': self.guest.id,
+            'event_date': first + timedelta(days=offset + i),
+            'duration_hours': 4,
+            'status': 'confirmed',
+        } for i in range(count)]
+
+    def test_reservation_create_queries(self):
+        self._create_queries('hotel.reservation', self._stays(0, 2))  # warm up the caches
+        few = self._create_queries('hotel.reservation', self._stays(10, 5))
+        many = self._create_queries('hotel.reservation', self._stays(100, 50))
+        self.assertLessEqual(many, few, "creating 50 reservations costs more statements than creating 5")
+
+    def test_event_booking_create_queries(self):
+        self._create_queries('hotel.event.booking', self._bookings(0, 2))
+        few = self._create_queries('hotel.event.booking', self._bookings(10, 5))
+        many = self._create_queries('hotel.event.booking', self._bookings(100, 50))
+        self.assertLessEqual(many, few, "creating 50 event bookings costs more statements than creating 5")
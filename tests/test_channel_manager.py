@@ -0,0 +1,123 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from odoo import fields
+from odoo.tests import tagged
+
+from ..models.hotel_channel_manager import MAX_JOB_ATTEMPTS
+from .common import HotelCommon
+
+
+@tagged('post_install', '-at_install')
+class TestChannelBookings(HotelCommon):
+
+    def setUp(self):
+        super().setUp()
+        self.connector = self.env['hotel.channel.connector'].create({'name': 'Test OTA', 'provider': 'fake'})
+        self.booking = {
+            'ref': 'OTA-1',
+            'room_type_id': self.room_type.id,
+            'check_in': self.start,
+            'check_out': self.start + timedelta(days=2),
+            'guest_name': 'Channel Guest',
+        }
+
+    def _channel_reservations(self):
+        return self.env['hotel.reservation'].search([('channel_connector_id', '=', self.connector.id)])
+
+    def test_unplaced_booking_kept_until_imported(self):
+        stays = self.env['hotel.reservation'].create([self._reservation_vals(room, self.start) for room in self.rooms])
+        self.connector._fake_queue_booking(self.booking)
+        self.connector._pull_bookings()
+
+        # no room: the channel still holds the booking and it waits for review
+        self.assertEqual(self.connector._fake_pull_bookings(), [self.booking])
+        entry = self.env['hotel.channel.booking'].search([('connector_id', '=', self.connector.id)])
+        self.assertRecordValues(entry, [{'ref': 'OTA-1', 'state': 'unplaced', 'attempts': 1}])
+        self.assertFalse(self._channel_reservations())
+
+        self.connector._pull_bookings()
+        self.assertEqual(entry.attempts, 2)
+
+        stays[0].status = 'cancelled'
+        self.connector._pull_bookings()
+        reservation = self._channel_reservations()
+        self.assertEqual(reservation.room_id, self.rooms[0])
+        self.assertRecordValues(entry, [{'state': 'imported', 'reservation_id': reservation.id}])
+        self.assertEqual(self.connector._fake_pull_bookings(), [])
+
+    def test_known_booking_acked_once(self):
+        self.connector._fake_queue_booking(self.booking)
+        self.connector._pull_bookings()
+        self.assertEqual(len(self._channel_reservations()), 1)
+        self.assertEqual(self.connector._fake_pull_bookings(), [])
+        self.assertFalse(self.env['hotel.channel.booking'].search([('connector_id', '=', self.connector.id)]))
+
+        # the channel hands it out again: acknowledged, not duplicated
+        self.connector._fake_queue_booking(self.booking)
+        self.connector._pull_bookings()
+        self.assertEqual(len(self._channel_reservations()), 1)
+        self.assertEqual(self.connector._fake_pull_bookings(), [])
+
+
+@tagged('post_install', '-at_install')
+class TestChannelQueue(HotelCommon):
+
+    def setUp(self):
+        super().setUp()
+        self.connector = self.env['hotel.channel.connector'].create({'name': 'Test OTA', 'provider': 'fake'})
+        self.Job = self.env['hotel.channel.job']
+        self.today = fields.Date.context_today(self.Job)
+
+    def _jobs(self, job_type='push_availability'):
+        return self.Job.search([('connector_id', '=', self.connector.id), ('job_type', '=', job_type)])
+
+    def _make_due(self):
+        # the worker compares with the transaction clock, which a test never moves past
+        self._jobs().write({'next_attempt': fields.Datetime.now() - timedelta(hours=1)})
+
+    def _enqueue(self, first_day, last_day):
+        self.Job._enqueue_push({(self.company.id, self.room_type.id): (
+            self.today + timedelta(days=first_day), self.today + timedelta(days=last_day))})
+
+    def test_pending_pushes_coalesced(self):
+        self._enqueue(1, 3)
+        self._enqueue(5, 8)
+        self._make_due()
+        with patch.object(type(self.connector), '_fake_push_availability', autospec=True) as push:
+            self.Job.cron_process_jobs()
+        push.assert_called_once()
+        dates = [row['date'] for row in push.call_args.args[2]]
+        self.assertEqual(dates[0], fields.Date.to_string(self.today + timedelta(days=1)))
+        self.assertEqual(dates[-1], fields.Date.to_string(self.today + timedelta(days=7)))
+        self.assertEqual(set(self._jobs().mapped('state')), {'done'})
+
+    def test_failed_push_backs_off_then_gives_up(self):
+        self._enqueue(1, 3)
+        self._make_due()
+        with patch.object(type(self.connector), '_fake_push_availability', side_effect=OSError("channel down")):
+            self.Job.cron_process_jobs()
+            job = self._jobs()
+            self.assertRecordValues(job, [{'state': 'pending', 'attempts': 1, 'last_error': "channel down"}])
+            self.assertGreater(job.next_attempt, fields.Datetime.now() + timedelta(minutes=1))
+
+            job.write({'attempts': MAX_JOB_ATTEMPTS - 1})
+            self._make_due()
+            self.Job.cron_process_jobs()
+        self.assertRecordValues(job, [{'state': 'failed', 'attempts': MAX_JOB_ATTEMPTS}])
+
+    def test_system_writes_enqueue_pushes(self):
+        self.company.hotel_light_tracking = True
+        reservation = self.env['hotel.reservation']._hotel_system_writer(self.company).create(
+            self._reservation_vals(self.rooms[0], self.start))
+        self.assertEqual(len(self._jobs()), 1)
+        reservation._hotel_system_writer(self.company).write({'room_id': self.rooms[1].id})
+        self.assertEqual(len(self._jobs()), 2)
+        self.assertEqual(set(self._jobs().mapped('room_type_id')), self.room_type)
+
+    def test_pull_keeps_caches(self):
+        with patch.object(type(self.env.registry), 'clear_cache') as clear_cache:
+            self.connector._pull_bookings()
+            clear_cache.assert_not_called()
+            self.connector.active = False
+            clear_cache.assert_called()
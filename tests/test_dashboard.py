@@ -0,0 +1,59 @@
+from datetime import datetime, time
+
+from odoo import fields
+from odoo.tests import tagged
+
+from ..models import hotel_dashboard
+from .common import HotelCommon
+
+
+@tagged('post_install', '-at_install')
+class TestFrontDeskDashboard(HotelCommon):
+
+    def setUp(self):
+        super().setUp()
+        self.env.user.tz = 'UTC'
+        self.patch(hotel_dashboard, '_SNAPSHOTS', {})
+        self.Dashboard = self.env['hotel.dashboard']
+        self.noon = datetime.combine(fields.Date.today(), time(12, 0))
+
+    def _snapshot(self):
+        [snapshot] = self.Dashboard.get_front_desk_snapshot([self.company.id])
+        return snapshot
+
+    def _commit(self):
+        # what a real commit triggers
+        self.env.cr.postcommit.run()
+
+    def test_counters(self):
+        self.env['hotel.reservation'].create([
+            self._reservation_vals(self.rooms[0], self.noon, nights=1),
+            self._reservation_vals(self.rooms[1], self.noon.replace(hour=1), nights=1, status='checked_in'),
+        ])
+        snapshot = self._snapshot()
+        self.assertEqual(snapshot['arrivals'], 1)
+        self.assertEqual(snapshot['in_house'], 1)
+        self.assertEqual(snapshot['rooms_occupied'], 1)
+
+    def test_snapshot_dropped_after_commit_only(self):
+        self.assertEqual(self._snapshot()['arrivals'], 0)
+        self.env['hotel.reservation'].create(self._reservation_vals(self.rooms[0], self.noon, nights=1))
+        # not committed yet: the cached snapshot is still served
+        self.assertEqual(self._snapshot()['arrivals'], 0)
+        self._commit()
+        self.assertEqual(self._snapshot()['arrivals'], 1)
+
+    def test_rolled_back_change_keeps_snapshot(self):
+        stamp = self.Dashboard._snapshot_stamp()
+        self.rooms[0].write({'status': 'dirty'})
+        self.env.cr.postcommit.clear()
+        self._commit()
+        self.assertEqual(self.Dashboard._snapshot_stamp(), stamp)
+
+    def test_stamp_bumped_on_commit(self):
+        stamp = self.Dashboard._snapshot_stamp()
+        self.rooms[0].write({'status': 'dirty'})
+        self.rooms[1].write({'status': 'dirty'})
+        self._commit()
+        self.assertNotEqual(self.Dashboard._snapshot_stamp(), stamp)
+        self.assertFalse(self.env.cr.postcommit.data)
@@ -0,0 +1,195 @@
+import logging
+import time
+from datetime import datetime, timedelta
+
+from odoo.exceptions import ValidationError
+from odoo.tests import TransactionCase, tagged
+
+_logger = logging.getLogger(__name__)
+
+
+@tagged('post_install', '-at_install')
+class TestEventBookingOverlap(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.env = cls.env(context=dict(cls.env.context, tracking_disable=True))
+        cls.hall_type = cls.env['hotel.event.hall.type'].create({'name': 'Test Ballroom Type'})
+        cls.hall = cls.env['hotel.event.hall'].create({
+            'name': 'Test Ballroom', 'hall_type_id': cls.hall_type.id, 'capacity': 200,
+        })
+        cls.customer = cls.env['res.partner'].create({'name': 'Test Customer'})
+        cls.start = datetime(2031, 3, 2, 10, 0)
+
+    def _booking_vals(self, event_date, duration_hours, **vals):
+        return dict({
+            'hall_id': self.hall.id,
+            'customer_id': self.customer.id,
+            'event_date': event_date,
+            'duration_hours': duration_hours,
+            'status': 'confirmed',
+        }, **vals)
+
+    def test_overlap_refused(self):
+        Booking = self.env['hotel.event.booking']
+        Booking.create(self._booking_vals(self.start, 4))
+        with self.assertRaises(ValidationError):
+            Booking.create(self._booking_vals(self.start.replace(hour=12), 4))
+        Booking.create(self._booking_vals(self.start.replace(hour=14), 2))
+
+    def test_non_positive_duration_refused(self):
+        Booking = self.env['hotel.event.booking']
+        with self.assertRaises(ValidationError):
+            Booking.create(self._booking_vals(self.start, 0))
+        with self.assertRaises(ValidationError):
+            Booking.create(self._booking_vals(self.start, -2))
+        booking = Booking.create(self._booking_vals(self.start, 2))
+        with self.assertRaises(ValidationError):
+            booking.write({'duration_hours': 0})
+
+    def test_free_slots_accept_strings(self):
+        self.env['hotel.event.booking'].create(self._booking_vals(self.start, 4))
+        slots = self.env['hotel.event.hall'].find_free_slots(
+            '2031-03-02 08:00:00', '2031-03-02 20:00:00', 2, hall_type_id=self.hall_type.id)
+        self.assertEqual(slots[0]['hall_id'], self.hall.id)
+        self.assertEqual(slots[0]['start'], datetime(2031, 3, 2, 8, 0))
+        self.assertTrue(all(slot['end'] <= self.start or slot['start'] >= self.start.replace(hour=14)
+                            for slot in slots))
+
+    def test_free_slots_keep_setup_and_teardown(self):
+        self.env['hotel.event.booking'].create(self._booking_vals(self.start, 4))
+        Hall = self.env['hotel.event.hall']
+        window = (self.start.replace(hour=8), self.start.replace(hour=20))
+        slots = Hall.find_free_slots(*window, 2, hall_type_id=self.hall_type.id)
+        self.assertEqual([(slot['start'].hour, slot['end'].hour, slot['gap_end'].hour) for slot in slots],
+                         [(8, 10, 10), (14, 16, 20)])
+        # with 30 minutes on each side the morning gap is too short and the afternoon starts later
+        slots = Hall.find_free_slots(*window, 2, setup_minutes=30, teardown_minutes=30, hall_type_id=self.hall_type.id)
+        self.assertEqual(slots, [{
+            'hall_id': self.hall.id,
+            'start': self.start.replace(hour=14, minute=30),
+            'end': self.start.replace(hour=16, minute=30),
+            'gap_end': self.start.replace(hour=20),
+        }])
+
+    def test_free_slots_filters_and_limit(self):
+        other_type = self.env['hotel.event.hall.type'].create({'name': 'Test Meeting Room Type'})
+        small = self.env['hotel.event.hall'].create({
+            'name': 'Test Meeting Room', 'hall_type_id': other_type.id, 'capacity': 20,
+        })
+        large = self.env['hotel.event.hall'].create({
+            'name': 'Test Large Meeting Room', 'hall_type_id': other_type.id, 'capacity': 300,
+        })
+        Hall = self.env['hotel.event.hall']
+        window = (self.start.replace(hour=8), self.start.replace(hour=20))
+        halls = {slot['hall_id'] for slot in Hall.find_free_slots(*window, 2, hall_type_id=other_type.id)}
+        self.assertEqual(halls, {small.id, large.id})
+        halls = {slot['hall_id'] for slot in Hall.find_free_slots(*window, 2, capacity_min=100)}
+        self.assertEqual(halls & {self.hall.id, small.id, large.id}, {self.hall.id, large.id})
+
+        # one opening per hall and per gap, the earliest first
+        self.env['hotel.event.booking'].create([
+            self._booking_vals(self.start.replace(hour=12), 2, hall_id=hall.id) for hall in (small, large)
+        ])
+        slots = Hall.find_free_slots(*window, 2, limit=3, hall_type_id=other_type.id)
+        self.assertEqual([(slot['hall_id'], slot['start'].hour) for slot in slots],
+                         [(small.id, 8), (large.id, 8), (small.id, 14)])
+
+
+def legacy_check_overlap(bookings):
+    """The per-record overlap check the range query replaced, kept as the benchmark baseline."""
+    for rec in bookings:
+        start = rec.event_date
+        end = start + timedelta(hours=rec.duration_hours)
+        others = bookings.search([
+            ('id', '!=', rec.id),
+            ('hall_id', '=', rec.hall_id.id),
+            ('event_date', '<', end),
+        ])
+        for other in others:
+            other_end = other.event_date + timedelta(hours=other.duration_hours or 0)
+            if other.event_date < end and start < other_end:
+                raise ValidationError("Hall is already booked for that time window.")
+
+
+@tagged('post_install', '-at_install', '-standard', 'hotel_benchmark')
+class TestEventBookingImportBenchmark(TransactionCase):
+    """Overlap check of a bulk booking import, per-record searches vs one range query.
+
+    Not part of the standard run: ``--test-tags hotel_benchmark``.
+    """
+    HALLS = 20
+    BOOKINGS = 2000
+
+    def test_bulk_import_check(self):
+        env = self.env(context=dict(self.env.context, tracking_disable=True))
+        hall_type = env['hotel.event.hall.type'].create({'name': 'Benchmark Hall Type'})
+        halls = env['hotel.event.hall'].create([
+            {'name': 'Benchmark Hall %s' % n, 'hall_type_id': hall_type.id, 'capacity': 100}
+            for n in range(self.HALLS)
+        ])
+        customer = env['res.partner'].create({'name': 'Benchmark Customer'})
+        first = datetime(2031, 1, 1, 8, 0)
+        started = time.perf_counter()
+        bookings = env['hotel.event.booking'].create([{
+            'hall_id': halls[n % self.HALLS].id,
+            'customer_id': customer.id,
+            'event_date': first + timedelta(hours=6 * (n // self.HALLS)),
+            'duration_hours': 4,
+            'status': 'confirmed',
+        } for n in range(self.BOOKINGS)])
+        import_time = time.perf_counter() - started
+
+        env.invalidate_all()
+        started = time.perf_counter()
+        bookings._check_overlap()
+        new = time.perf_counter() - started
+        env.invalidate_all()
+        started = time.perf_counter()
+        legacy_check_overlap(bookings)
+        old = time.perf_counter() - started
+        _logger.info("Event booking import: %s bookings in %.2fs, overlap check %.3fs (per-record: %.3fs)",
+                     self.BOOKINGS, import_time, new, old)
+        self.assertLess(new, old)
+
+
+@tagged('post_install', '-at_install', '-standard', 'hotel_benchmark')
+class TestFreeSlotsBenchmark(TransactionCase):
+    """Slot search over 50 halls booked for a quarter.
+
+    Not part of the standard run: ``--test-tags hotel_benchmark``.
+    """
+    HALLS = 50
+    DAYS = 91
+    SAMPLE = 20
+
+    def test_find_free_slots_latency(self):
+        env = self.env(context=dict(self.env.context, tracking_disable=True))
+        hall_type = env['hotel.event.hall.type'].create({'name': 'Benchmark Slot Hall Type'})
+        halls = env['hotel.event.hall'].create([
+            {'name': 'Benchmark Slot Hall %s' % n, 'hall_type_id': hall_type.id, 'capacity': 100}
+            for n in range(self.HALLS)
+        ])
+        customer = env['res.partner'].create({'name': 'Benchmark Customer'})
+        first = datetime(2031, 1, 1)
+        # a morning, an afternoon and an evening event a day, staggered per hall
+        env['hotel.event.booking'].create([{
+            'hall_id': hall.id,
+            'customer_id': customer.id,
+            'event_date': first + timedelta(days=day, hours=hour + index % 3),
+            'duration_hours': 3,
+            'status': 'confirmed',
+        } for index, hall in enumerate(halls) for day in range(self.DAYS) for hour in (8, 13, 18)])
+        env.cr.execute("ANALYZE hotel_event_booking")
+
+        Hall = env['hotel.event.hall']
+        started = time.perf_counter()
+        for n in range(self.SAMPLE):
+            slots = Hall.find_free_slots(
+                first + timedelta(days=n), first + timedelta(days=self.DAYS), 2,
+                setup_minutes=30, teardown_minutes=30, hall_type_id=hall_type.id)
+            self.assertEqual(len(slots), 10)
+        latency = (time.perf_counter() - started) / self.SAMPLE
+        _logger.info("Free slots: %s halls over %s days, %.1f ms per search", self.HALLS, self.DAYS, latency * 1000)
+        self.assertLess(latency, 0.1)
@@ -0,0 +1,30 @@
+from datetime import timedelta
+
+from odoo import fields
+from odoo.tests import tagged
+
+from .common import HotelCommon
+
+
+@tagged('post_install', '-at_install')
+class TestHousekeepingCron(HotelCommon):
+
+    def test_backstop_idempotent(self):
+        now = fields.Datetime.now()
+        reservations = self.env['hotel.reservation'].create([
+            self._reservation_vals(room, now - timedelta(days=2), status='checked_out')
+            for room in self.rooms
+        ])
+        reservations.write({'check_out': now - timedelta(hours=1)})
+        Task = self.env['hotel.housekeeping.task']
+        # start from rooms left without a cleaning task
+        Task.search([('room_id', 'in', self.rooms.ids)]).unlink()
+
+        Reservation = self.env['hotel.reservation']
+        self.assertEqual(Reservation.cron_generate_housekeeping_tasks(), len(self.rooms))
+        tasks = Task.search([('room_id', 'in', self.rooms.ids)])
+        self.assertEqual(tasks.room_id, self.rooms)
+        self.assertEqual(set(tasks.mapped('status')), {'pending'})
+
+        self.assertEqual(Reservation.cron_generate_housekeeping_tasks(), 0)
+        self.assertEqual(Task.search([('room_id', 'in', self.rooms.ids)]), tasks)
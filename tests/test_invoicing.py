@@ -0,0 +1,126 @@
+import logging
+import time
+from datetime import timedelta
+from unittest.mock import patch
+
+from odoo.addons.account.tests.common import AccountTestInvoicingCommon
+from odoo.exceptions import UserError
+from odoo.tests import tagged
+
+from .common import HotelCommon
+
+_logger = logging.getLogger(__name__)
+
+
+class HotelInvoicingCommon(HotelCommon, AccountTestInvoicingCommon):
+    """Hotel fixtures on a company with a chart of accounts."""
+
+    @classmethod
+    def _stays(cls, count, **vals):
+        Reservation = cls.env['hotel.reservation']
+        return Reservation.create([
+            cls._reservation_vals(cls.rooms[n % len(cls.rooms)], cls.start + timedelta(days=3 * (n // len(cls.rooms))), **vals)
+            for n in range(count)
+        ])
+
+    def _invoices(self, reservations):
+        return self.env['account.move'].search([('hotel_reservation_id', 'in', reservations.ids)])
+
+
+@tagged('post_install', '-at_install')
+class TestBatchInvoicing(HotelInvoicingCommon):
+
+    def test_batch_reports_failures_per_record(self):
+        stays = self._stays(3)
+        stays[2].payment_status = 'paid'
+        moves, errors = stays._create_invoices()
+        self.assertEqual(moves.hotel_reservation_id, stays[:2])
+        self.assertEqual(set(moves.mapped('state')), {'posted'})
+        self.assertEqual(list(errors), [stays[2]])
+
+    def test_failed_post_leaves_no_draft(self):
+        stays = self._stays(3)
+        Move = self.env['account.move']
+        action_post = type(Move).action_post
+
+        def failing_post(moves):
+            if stays[1] in moves.hotel_reservation_id:
+                raise UserError("Posting refused")
+            return action_post(moves)
+
+        with patch.object(type(Move), 'action_post', failing_post):
+            moves, errors = stays._create_invoices()
+        self.assertEqual(moves.hotel_reservation_id, stays[0] | stays[2])
+        self.assertEqual(errors, {stays[1]: "Posting refused"})
+        self.assertEqual(self._invoices(stays), moves)
+
+    def test_batch_rerun_skips_posted_only(self):
+        stays = self._stays(2)
+        first, __ = stays[0]._create_invoices()
+        # a stray draft does not count as invoiced
+        self.env['account.move'].create(stays[1]._prepare_invoice_vals({}))
+        moves, errors = stays._create_invoices()
+        self.assertEqual(moves.hotel_reservation_id, stays[1])
+        self.assertEqual(list(errors), [stays[0]])
+        self.assertEqual(len(self._invoices(stays[0])), 1)
+
+    def test_single_invoice_can_be_repeated(self):
+        stay = self._stays(1)
+        stay.action_create_invoice()
+        stay.action_create_invoice()
+        self.assertEqual(self._invoices(stay).mapped('state'), ['posted', 'posted'])
+
+
+@tagged('post_install', '-at_install')
+class TestInvoiceLookupCache(HotelInvoicingCommon):
+
+    def _vat(self, amount):
+        return self.env['account.tax'].create({
+            'name': 'Hotel VAT %s' % amount, 'amount': amount, 'type_tax_use': 'sale', 'company_id': self.company.id,
+        })
+
+    def test_invoice_product_tax_change_picked_up(self):
+        Mixin = self.env['hotel.invoice.mixin']
+        product_id, taxes = Mixin._get_invoice_product_data(self.company.id, 'ROOM_NIGHT')
+        vat = self._vat(7)
+        self.env['product.product'].browse(product_id).taxes_id = vat
+        self.assertEqual(Mixin._get_invoice_product_data(self.company.id, 'ROOM_NIGHT'), (product_id, tuple(vat.ids)))
+
+    def test_unrelated_writes_keep_caches(self):
+        product = self.env['product.product'].create({'name': 'Minibar Soda', 'default_code': 'SODA'})
+        journal = self.env['account.journal'].create({
+            'name': 'Hotel Misc', 'code': 'HMSC', 'type': 'general', 'company_id': self.company.id})
+        with patch.object(type(self.env.registry), 'clear_cache') as clear_cache:
+            product.taxes_id = self._vat(5)
+            product.product_tmpl_id.active = False
+            journal.sequence = 99
+            clear_cache.assert_not_called()
+            product.default_code = 'ROOM_NIGHT'
+            clear_cache.assert_called()
+
+
+@tagged('post_install', '-at_install', '-standard', 'hotel_benchmark')
+class TestBatchInvoicingBenchmark(HotelInvoicingCommon):
+    """Batch invoicing against one action_create_invoice per record.
+
+    Not part of the standard run: ``--test-tags hotel_benchmark``.
+    """
+    STAYS = 300
+
+    def test_batch_against_one_by_one(self):
+        stays = self._stays(2 * self.STAYS)
+        one_by_one, batch = stays[:self.STAYS], stays[self.STAYS:]
+
+        started = time.perf_counter()
+        for stay in one_by_one:
+            stay.action_create_invoice()
+        single_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        moves, errors = batch._create_invoices()
+        batch_seconds = time.perf_counter() - started
+
+        _logger.info("Invoicing %s stays: %.2fs one by one, %.2fs in batch", self.STAYS, single_seconds, batch_seconds)
+        self.assertFalse(errors)
+        self.assertEqual(len(moves), self.STAYS)
+        self.assertLess(batch_seconds, single_seconds)
@@ -0,0 +1,72 @@
+from datetime import datetime
+
+from odoo.tests import tagged
+
+from .common import HotelCommon
+
+
+@tagged('post_install', '-at_install')
+class TestQueryPlans(HotelCommon):
+    """The hot lookups stay on their indexes once the tables hold realistic volumes."""
+    ROOMS = 500
+    ROWS = 50_000
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.room_ids = cls._seed_rooms(cls.ROOMS)
+        cls._seed_reservations(cls.room_ids, cls.ROWS)
+        cr = cls.env.cr
+        cls.env['hotel.housekeeping.task'].flush_model()
+        cls.env['hotel.maintenance.task'].flush_model()
+        # mostly closed history, one open task in fifty
+        cr.execute("""
+            INSERT INTO hotel_housekeeping_task (room_id, company_id, task_type, status, date_scheduled, active)
+            SELECT (%(room_ids)s::int[])[1 + n %% %(rooms)s], %(company)s, 'cleaning',
+                   CASE WHEN n %% 50 = 0 THEN 'pending' ELSE 'done' END,
+                   %(first)s + n * interval '1 hour', true
+              FROM generate_series(0, %(count)s - 1) AS n
+        """, {'room_ids': cls.room_ids, 'rooms': cls.ROOMS, 'company': cls.company.id,
+              'first': datetime(2001, 1, 1), 'count': cls.ROWS})
+        cr.execute("""
+            INSERT INTO hotel_maintenance_task
+                   (name, room_id, company_id, task_type, source, status, priority, date_reported, active)
+            SELECT 'Seed ' || n, (%(room_ids)s::int[])[1 + n %% %(rooms)s], %(company)s,
+                   CASE WHEN n %% 3 = 0 THEN 'repair' ELSE 'inspection' END, 'manual',
+                   CASE WHEN n %% 20 = 0 THEN 'pending' ELSE 'done' END, '1',
+                   %(first)s + n * interval '1 hour', true
+              FROM generate_series(0, %(count)s - 1) AS n
+        """, {'room_ids': cls.room_ids, 'rooms': cls.ROOMS, 'company': cls.company.id,
+              'first': datetime(2001, 1, 1), 'count': cls.ROWS})
+        cr.execute("ANALYZE hotel_reservation")
+        cr.execute("ANALYZE hotel_housekeeping_task")
+        cr.execute("ANALYZE hotel_maintenance_task")
+
+    def assertNoSeqScan(self, model_name, domain):
+        """The query the ORM runs for ``domain``: active filter and default order included."""
+        query = self.env[model_name]._search(domain)
+        sql = query.select()
+        plan = self._plan(sql.code, sql.params)
+        self.assertNotIn("Seq Scan", plan, plan)
+
+    def test_reservation_room_overlap(self):
+        self.assertNoSeqScan('hotel.reservation', [
+            ('room_id', '=', self.room_ids[7]),
+            ('status', 'in', ['confirmed', 'checked_in']),
+            ('check_in', '<', datetime(2010, 6, 3)),
+            ('check_out', '>', datetime(2010, 6, 1)),
+        ])
+
+    def test_housekeeping_open_tasks_of_room(self):
+        self.assertNoSeqScan('hotel.housekeeping.task', [
+            ('room_id', '=', self.room_ids[7]),
+            ('status', 'in', ['pending', 'in_progress']),
+            ('date_scheduled', '>=', datetime(2002, 1, 1)),
+        ])
+
+    def test_maintenance_tasks_of_room(self):
+        self.assertNoSeqScan('hotel.maintenance.task', [
+            ('room_id', '=', self.room_ids[7]),
+            ('task_type', '=', 'repair'),
+            ('status', '=', 'pending'),
+        ])
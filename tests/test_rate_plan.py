@@ -0,0 +1,55 @@
+from datetime import date, datetime
+from unittest.mock import patch
+
+from odoo.exceptions import AccessError
+from odoo.tests import tagged
+
+from .common import HotelCommon
+
+
+@tagged('post_install', '-at_install')
+class TestRatePlan(HotelCommon):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        Plan = cls.env['hotel.rate.plan']
+        cls.summer = Plan.create({'name': 'Summer', 'sequence': 20, 'line_ids': [
+            (0, 0, {'room_type_id': cls.room_type.id, 'date': date(2031, 7, day), 'price': 150.0})
+            for day in (1, 2, 3)
+        ]})
+        cls.promo = Plan.create({'name': 'Promo', 'sequence': 10, 'line_ids': [
+            (0, 0, {'room_type_id': cls.room_type.id, 'date': date(2031, 7, 2), 'price': 90.0}),
+        ]})
+
+    def _quote(self, **stay):
+        [quote] = self.env['hotel.rate.plan'].get_stay_quotes([dict({
+            'room_type_id': self.room_type.id,
+            'check_in': datetime(2031, 6, 30, 14, 0),
+            'check_out': datetime(2031, 7, 3, 11, 0),
+        }, **stay)])
+        return quote
+
+    def test_nightly_prices(self):
+        quote = self._quote()
+        # no rate on June 30: base price; the lower sequence wins on July 2
+        self.assertEqual([night['price'] for night in quote['nights']], [100.0, 150.0, 90.0])
+        self.assertEqual(quote['total'], 340.0)
+
+    def test_price_changes_picked_up(self):
+        self._quote()
+        self.promo.line_ids.price = 80.0
+        self.assertEqual(self._quote()['nights'][2]['price'], 80.0)
+        self.promo.active = False
+        self.assertEqual(self._quote()['nights'][2]['price'], 150.0)
+
+    def test_renaming_keeps_calendars(self):
+        with patch.object(type(self.env.registry), 'clear_cache') as clear_cache:
+            self.summer.name = 'High Summer'
+            clear_cache.assert_not_called()
+
+    def test_other_branch_refused(self):
+        other = self.env['res.company'].create({'name': 'Other Branch'})
+        self.env.user.company_ids -= other
+        with self.assertRaises(AccessError):
+            self._quote(company_id=other.id)
@@ -0,0 +1,89 @@
+import base64
+from datetime import date
+
+from odoo.tests import tagged
+
+from .common import HotelCommon
+
+
+@tagged('post_install', '-at_install')
+class TestReservationImport(HotelCommon):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.guest.write({'ref': 'G-IMPORT', 'email': 'import.guest@example.com'})
+        cls.Reservation = cls.env['hotel.reservation']
+
+    def test_batch_import(self):
+        rows = [
+            {'name': 'OLD/1', 'guest_ref': 'G-IMPORT', 'room': 'T001', 'status': 'checked_out',
+             'check_in': '2031-05-10 14:00:00', 'check_out': '2031-05-12 11:00:00', 'total_amount': '80'},
+            {'name': 'OLD/2', 'guest_email': 'Import.Guest@example.com', 'room': 'T002', 'status': 'confirmed',
+             'check_in': '2031-05-11 14:00:00', 'check_out': '2031-05-14 11:00:00'},
+            {'name': 'OLD/3', 'guest_ref': 'G-IMPORT', 'room': 'T003', 'status': 'confirmed',
+             'check_in': '2031-05-20 14:00:00', 'check_out': '2031-05-21 11:00:00'},
+        ]
+        stats = self.Reservation._import_reservation_rows(rows, chunk_size=2)
+        self.assertEqual((stats['imported'], stats['rejected']), (3, 0))
+        imported = self.Reservation.search([('name', 'in', ['OLD/1', 'OLD/2', 'OLD/3'])], order='name')
+        self.assertRecordValues(imported, [
+            {'room_id': self.rooms[0].id, 'guest_id': self.guest.id, 'status': 'checked_out', 'total_amount': 80.0},
+            {'room_id': self.rooms[1].id, 'guest_id': self.guest.id, 'status': 'confirmed', 'total_amount': 0.0},
+            {'room_id': self.rooms[2].id, 'guest_id': self.guest.id, 'status': 'confirmed', 'total_amount': 0.0},
+        ])
+        inventory = self.env['hotel.room.inventory'].search([
+            ('company_id', '=', self.company.id),
+            ('room_type_id', '=', self.room_type.id),
+            ('date', '>=', date(2031, 5, 10)), ('date', '<=', date(2031, 5, 20)),
+        ])
+        sold = {row.date: row.sold for row in inventory}
+        self.assertEqual(sold[date(2031, 5, 11)], 2)
+        self.assertEqual(sold[date(2031, 5, 20)], 1)
+
+    def test_rejected_rows(self):
+        rows = [
+            {'guest_ref': 'NOBODY', 'room': 'T001', 'check_in': '2031-05-10 14:00:00', 'check_out': '2031-05-12 11:00:00'},
+            {'guest_ref': 'G-IMPORT', 'room': 'X999', 'check_in': '2031-05-10 14:00:00', 'check_out': '2031-05-12 11:00:00'},
+            {'guest_ref': 'G-IMPORT', 'room': 'T001', 'check_in': 'someday', 'check_out': '2031-05-12 11:00:00'},
+            {'guest_ref': 'G-IMPORT', 'room': 'T001', 'check_in': '2031-05-10 14:00:00', 'check_out': ''},
+            {'_error': "Invalid JSON: broken line"},
+            {'guest_ref': 'G-IMPORT', 'room': 'T001', 'check_in': '2031-05-10 14:00:00', 'check_out': '2031-05-12 11:00:00'},
+        ]
+        stats = self.Reservation._import_reservation_rows(rows)
+        self.assertEqual((stats['imported'], stats['rejected']), (1, 5))
+        self.assertEqual([line_no for line_no, _reason in stats['rejects']], [1, 2, 3, 4, 5])
+        self.assertEqual(stats['rejects'][0][1], "Unknown guest NOBODY")
+        self.assertEqual(stats['rejects'][1][1], "Unknown room X999")
+
+    def test_wizard_streams_upload(self):
+        csv_file = (
+            "name,guest_ref,room,check_in,check_out,status\n"
+            "CSV/1,G-IMPORT,T001,2031-06-01 14:00:00,2031-06-03 11:00:00,confirmed\n"
+            "CSV/2,NOBODY,T002,2031-06-01 14:00:00,2031-06-03 11:00:00,confirmed\n"
+        )
+        wizard = self.env['hotel.reservation.import.wizard'].create({
+            'import_file': base64.b64encode(csv_file.encode()),
+            'filename': 'history.csv',
+        })
+        wizard.action_import()
+        self.assertRecordValues(wizard, [{'state': 'done', 'imported_count': 1, 'rejected_count': 1}])
+        self.assertTrue(self.Reservation.search([('name', '=', 'CSV/1')]))
+
+    def test_row_fallback_recounts_inventory(self):
+        row = {'guest_ref': 'G-IMPORT', 'room': 'T001', 'status': 'confirmed'}
+        rows = [
+            dict(row, check_in='2031-05-10 14:00:00', check_out='2031-05-12 11:00:00'),
+            # overlaps the first row: the chunk fails and is retried row by row
+            dict(row, check_in='2031-05-11 14:00:00', check_out='2031-05-13 11:00:00'),
+        ]
+        stats = self.env['hotel.reservation']._import_reservation_rows(rows)
+        self.assertEqual((stats['imported'], stats['rejected']), (1, 1))
+        self.assertEqual(stats['rejects'][0][0], 2)
+
+        inventory = self.env['hotel.room.inventory'].search([
+            ('company_id', '=', self.company.id),
+            ('room_type_id', '=', self.room_type.id),
+            ('date', 'in', [date(2031, 5, 10), date(2031, 5, 11)]),
+        ])
+        self.assertEqual(inventory.mapped('sold'), [1, 1])
@@ -0,0 +1,74 @@
+import logging
+import time
+from datetime import datetime, timedelta
+
+from odoo.exceptions import ValidationError
+from odoo.tests import tagged
+
+from .common import HotelCommon
+
+_logger = logging.getLogger(__name__)
+
+
+@tagged('post_install', '-at_install')
+class TestReservationOverlap(HotelCommon):
+
+    def test_overlapping_stay_refused(self):
+        Reservation = self.env['hotel.reservation']
+        Reservation.create(self._reservation_vals(self.rooms[0], self.start))
+        with self.assertRaises(ValidationError):
+            Reservation.create(self._reservation_vals(self.rooms[0], self.start + timedelta(days=1)))
+        # back to back and cancelled stays do not overlap
+        Reservation.create(self._reservation_vals(self.rooms[0], self.start + timedelta(days=2)))
+        Reservation.create(self._reservation_vals(self.rooms[0], self.start, status='cancelled'))
+
+    def test_inverted_dates_refused(self):
+        vals = self._reservation_vals(self.rooms[1], self.start)
+        vals['check_out'] = self.start - timedelta(days=1)
+        with self.assertRaises(ValidationError):
+            self.env['hotel.reservation'].create(vals)
+        reservation = self.env['hotel.reservation'].create(self._reservation_vals(self.rooms[1], self.start))
+        with self.assertRaises(ValidationError):
+            reservation.write({'check_out': self.start - timedelta(hours=1)})
+
+
+@tagged('post_install', '-at_install', '-standard', 'hotel_benchmark')
+class TestReservationOverlapBenchmark(HotelCommon):
+    """Insert latency under the overlap guard as the table grows.
+
+    Not part of the standard run: ``--test-tags hotel_benchmark``.
+    """
+    SIZES = (10_000, 100_000, 1_000_000)
+    ROOMS = 1000
+    SAMPLE = 500
+
+    def test_insert_latency_flat(self):
+        cr = self.env.cr
+        room_ids = self._seed_rooms(self.ROOMS)
+        seeded = 0
+        first = datetime(1950, 1, 1, 14, 0)
+        latencies = []
+        for size in self.SIZES:
+            chunk = size - seeded
+            self._seed_reservations(room_ids, chunk, first=first)
+            first += timedelta(days=3 * (chunk // self.ROOMS + 1))
+            seeded = size
+            cr.execute("ANALYZE hotel_reservation")
+
+            # single-row inserts on fresh nights, each one checked by the exclusion constraint
+            started = time.perf_counter()
+            for n in range(self.SAMPLE):
+                check_in = first + timedelta(days=3 * (n // self.ROOMS))
+                cr.execute("""
+                    INSERT INTO hotel_reservation
+                           (guest_id, room_id, company_id, currency_id, check_in, check_out,
+                            status, payment_status, booking_source, rate_type, active)
+                    VALUES (%s, %s, %s, %s, %s, %s, 'confirmed', 'unpaid', 'website', 'standard', true)
+                """, [self.guest.id, room_ids[n % self.ROOMS], self.company.id, self.company.currency_id.id,
+                      check_in, check_in + timedelta(days=2)])
+            latencies.append((time.perf_counter() - started) / self.SAMPLE)
+            first += timedelta(days=3 * (self.SAMPLE // self.ROOMS + 1))
+            _logger.info("Overlap guard: %s rows, %.3f ms per insert", size, latencies[-1] * 1000)
+
+        # O(log n) index checks: a hundredfold larger table costs at most a few times more per insert
+        self.assertLess(latencies[-1], latencies[0] * 3)
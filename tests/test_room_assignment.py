@@ -0,0 +1,92 @@
+import logging
+import random
+import time
+from datetime import datetime, timedelta
+
+from odoo.exceptions import UserError
+from odoo.tests import tagged
+
+from ..models.hotel_room_assignment import RoomTimeline, plan_assignments
+from .common import HotelCommon
+
+_logger = logging.getLogger(__name__)
+
+
+def orphan_nights(timelines):
+    """One-night gaps left between consecutive stays of the same room."""
+    return sum(
+        1
+        for timeline in timelines.values()
+        for end, start in zip(timeline.ends, timeline.starts[1:])
+        if (start.date() - end.date()).days == 1
+    )
+
+
+@tagged('post_install', '-at_install')
+class TestRoomAssignment(HotelCommon):
+
+    def test_plan_avoids_orphan_nights(self):
+        day = self.start
+        timelines = {1: RoomTimeline(), 2: RoomTimeline()}
+        timelines[1].add(day, day + timedelta(days=1))
+        timelines[2].add(day, day + timedelta(days=2))
+        rooms = {1: (2, frozenset()), 2: (2, frozenset())}
+        stays = [
+            (10, day + timedelta(days=2), day + timedelta(days=4), 2, frozenset()),
+            (11, day, day + timedelta(days=2), 3, frozenset()),
+        ]
+        plan, unplaced = plan_assignments(stays, rooms, timelines)
+        # room 1 would leave a one-night gap, room 2 takes the stay back to back
+        self.assertEqual(plan, {10: 2})
+        self.assertEqual(unplaced, [11])
+
+    def test_create_places_or_refuses(self):
+        Reservation = self.env['hotel.reservation']
+        vals = dict(self._reservation_vals(self.rooms[0], self.start), room_id=False, room_type_id=self.room_type.id)
+        reservations = Reservation.create([vals] * len(self.rooms))
+        self.assertEqual(reservations.room_id, self.rooms)
+        with self.assertRaises(UserError):
+            Reservation.create(vals)
+
+
+@tagged('post_install', '-at_install', '-standard', 'hotel_benchmark')
+class TestRoomAssignmentBenchmark(HotelCommon):
+    """Planning time and orphan nights on synthetic demand, against first-fit.
+
+    Not part of the standard run: ``--test-tags hotel_benchmark``.
+    """
+    ROOMS = 1000
+    DAYS = 90
+    STAYS = 30_000
+
+    def _demand(self):
+        rng = random.Random(42)
+        first = datetime(2031, 1, 1, 14, 0)
+        stays = []
+        for stay_id in range(self.STAYS):
+            start = first + timedelta(days=rng.randrange(self.DAYS))
+            stays.append((stay_id, start, start + timedelta(days=rng.choice((1, 1, 2, 2, 3, 4, 7))), 2, frozenset()))
+        return stays
+
+    def test_best_fit_against_first_fit(self):
+        stays = self._demand()
+        rooms = {room_id: (2, frozenset()) for room_id in range(1, self.ROOMS + 1)}
+
+        started = time.perf_counter()
+        best_fit = {room_id: RoomTimeline() for room_id in rooms}
+        plan, __ = plan_assignments(stays, rooms, best_fit)
+        elapsed = time.perf_counter() - started
+
+        first_fit = {room_id: RoomTimeline() for room_id in rooms}
+        placed = 0
+        for __, start, end, __, __ in sorted(stays, key=lambda s: (s[1], s[1] - s[2], s[0])):
+            room_id = next((room_id for room_id in sorted(rooms) if first_fit[room_id].fit(start, end)), None)
+            if room_id:
+                first_fit[room_id].add(start, end)
+                placed += 1
+
+        _logger.info(
+            "Room assignment: %s stays on %s rooms planned in %.2fs, %s placed with %s orphan nights"
+            " (first-fit: %s placed, %s orphan nights)",
+            len(stays), len(rooms), elapsed, len(plan), orphan_nights(best_fit), placed, orphan_nights(first_fit))
+        self.assertLess(orphan_nights(best_fit), orphan_nights(first_fit))
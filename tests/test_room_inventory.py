@@ -0,0 +1,61 @@
+from datetime import date, timedelta
+
+from odoo.exceptions import ValidationError
+from odoo.tests import tagged
+
+from .common import HotelCommon
+
+
+@tagged('post_install', '-at_install')
+class TestRoomInventory(HotelCommon):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.Inventory = cls.env['hotel.room.inventory']
+        cls.first = date(2031, 7, 1)
+
+    def _stay(self, offset=0, nights=2):
+        first = self.first + timedelta(days=offset)
+        return (self.company.id, self.room_type.id, first, first + timedelta(days=nights))
+
+    def _sold(self, nights=4):
+        rows = self.Inventory.search([
+            ('company_id', '=', self.company.id), ('room_type_id', '=', self.room_type.id),
+            ('date', '>=', self.first), ('date', '<', self.first + timedelta(days=nights)),
+        ])
+        sold = {row.date: row.sold for row in rows}
+        return [sold.get(self.first + timedelta(days=night), 0) for night in range(nights)]
+
+    def test_allot_batch(self):
+        self.Inventory._allot([self._stay(), self._stay(), self._stay(1)])
+        self.assertEqual(self._sold(), [2, 3, 1, 0])
+
+    def test_allot_batch_is_atomic(self):
+        self.Inventory._allot([self._stay(1, nights=1)])
+        # the second night of the batch runs short: none of its stays is taken
+        with self.assertRaises(ValidationError):
+            self.Inventory._allot([self._stay(3), self._stay(), self._stay(), self._stay()])
+        self.assertEqual(self._sold(), [0, 1, 0, 0])
+
+    def test_overbooking_limit(self):
+        with self.assertRaises(ValidationError):
+            self.Inventory._allot([self._stay()] * 4)
+        self.room_type.overbooking_limit = 1
+        self.Inventory._allot([self._stay()] * 4)
+        self.assertEqual(self._sold(), [4, 4, 0, 0])
+        with self.assertRaises(ValidationError):
+            self.Inventory._allot([self._stay(1, nights=1)])
+
+    def test_reservations_take_and_release(self):
+        check_in = self.start.replace(year=2031, month=7, day=1)
+        reservations = self.env['hotel.reservation'].create([
+            self._reservation_vals(room, check_in) for room in self.rooms
+        ])
+        self.assertEqual(self._sold(), [3, 3, 0, 0])
+        reservations[0].status = 'cancelled'
+        self.assertEqual(self._sold(), [2, 2, 0, 0])
+        reservations[1].check_out = check_in + timedelta(days=3)
+        self.assertEqual(self._sold(), [2, 2, 1, 0])
+        reservations[1:].unlink()
+        self.assertEqual(self._sold(), [0, 0, 0, 0])
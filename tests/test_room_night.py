@@ -0,0 +1,100 @@
+import logging
+import time
+from datetime import date, datetime, timedelta
+
+from odoo.tests import tagged
+
+from .common import HotelCommon
+
+_logger = logging.getLogger(__name__)
+
+
+@tagged('post_install', '-at_install')
+class TestRoomNight(HotelCommon):
+
+    def _nights(self, reservation):
+        nights = self.env['hotel.room.night'].search([('reservation_id', '=', reservation.id)])
+        return [(night.room_id, night.date) for night in nights]
+
+    def test_sync_follows_the_stay(self):
+        reservation = self.env['hotel.reservation'].create(self._reservation_vals(self.rooms[0], self.start))
+        self.assertEqual(self._nights(reservation), [
+            (self.rooms[0], date(2031, 3, 2)), (self.rooms[0], date(2031, 3, 3)),
+        ])
+        reservation.write({'room_id': self.rooms[1].id, 'check_out': self.start + timedelta(days=3)})
+        self.assertEqual(self._nights(reservation), [
+            (self.rooms[1], date(2031, 3, 2)), (self.rooms[1], date(2031, 3, 3)), (self.rooms[1], date(2031, 3, 4)),
+        ])
+        self.assertEqual(
+            self.env['hotel.room.night']._occupied_room_ids(self.rooms.ids, self.start, self.start + timedelta(days=1)),
+            {self.rooms[1].id})
+        reservation.status = 'cancelled'
+        self.assertEqual(self._nights(reservation), [])
+
+    def test_consistency_cron_repairs_drift(self):
+        Night = self.env['hotel.room.night']
+        reservations = self.env['hotel.reservation'].create([
+            self._reservation_vals(room, self.start) for room in self.rooms
+        ])
+        self.assertEqual(Night.cron_check_consistency(), [])
+
+        # one night lost, one night pointing at the wrong room
+        self.env.cr.execute("DELETE FROM hotel_room_night WHERE reservation_id = %s AND date = %s",
+                            [reservations[0].id, date(2031, 3, 3)])
+        self.env.cr.execute("UPDATE hotel_room_night SET room_id = %s WHERE reservation_id = %s",
+                            [self.rooms[0].id, reservations[1].id])
+        Night.invalidate_model()
+        self.assertCountEqual(Night.cron_check_consistency(), reservations[:2].ids)
+        self.assertEqual(self._nights(reservations[0]), [
+            (self.rooms[0], date(2031, 3, 2)), (self.rooms[0], date(2031, 3, 3)),
+        ])
+        self.assertEqual({room for room, _date in self._nights(reservations[1])}, {self.rooms[1]})
+        self.assertEqual(Night.cron_check_consistency(), [])
+
+
+@tagged('post_install', '-at_install', '-standard', 'hotel_benchmark')
+class TestRoomNightBenchmark(HotelCommon):
+    """Availability lookups on 1,000 rooms booked over three years.
+
+    Not part of the standard run: ``--test-tags hotel_benchmark``.
+    """
+    ROOMS = 1000
+    YEARS = 3
+    SAMPLE = 200
+
+    def test_occupied_rooms_lookup(self):
+        cr = self.env.cr
+        Night = self.env['hotel.room.night']
+        room_ids = self._seed_rooms(self.ROOMS)
+        first = datetime(2031, 1, 1, 14, 0)
+        # two-night stays every three days on every room
+        self._seed_reservations(room_ids, self.ROOMS * 365 * self.YEARS // 3, first=first, status='confirmed')
+        started = time.perf_counter()
+        Night._rebuild()
+        rebuild = time.perf_counter() - started
+        cr.execute("ANALYZE hotel_room_night")
+        cr.execute("ANALYZE hotel_reservation")
+        cr.execute("SELECT count(*) FROM hotel_room_night")
+        nights = cr.fetchone()[0]
+
+        new = old = 0.0
+        for n in range(self.SAMPLE):
+            check_in = first + timedelta(days=(n * 5) % (365 * self.YEARS))
+            check_out = check_in + timedelta(days=3)
+            started = time.perf_counter()
+            occupied = Night._occupied_room_ids(room_ids, check_in, check_out)
+            new += time.perf_counter() - started
+            # the overlap scan over reservations the night table replaced
+            started = time.perf_counter()
+            cr.execute("""
+                SELECT DISTINCT room_id
+                  FROM hotel_reservation
+                 WHERE room_id IN %s AND status <> 'cancelled'
+                   AND check_in < %s AND check_out > %s
+            """, [tuple(room_ids), check_out, check_in])
+            overlapping = {row[0] for row in cr.fetchall()}
+            old += time.perf_counter() - started
+            self.assertEqual(occupied, overlapping)
+        _logger.info("Room nights: %s rows rebuilt in %.1fs, lookup %.2f ms (reservation scan %.2f ms)",
+                     nights, rebuild, new / self.SAMPLE * 1000, old / self.SAMPLE * 1000)
+        self.assertLess(new / self.SAMPLE, 0.1)
@@ -0,0 +1,73 @@
+from datetime import timedelta
+
+from odoo import fields
+from odoo.tests import tagged
+
+from .common import HotelCommon
+
+
+@tagged('post_install', '-at_install')
+class TestLightTracking(HotelCommon):
+
+    def setUp(self):
+        super().setUp()
+        # HotelCommon disables tracking: this class is about it
+        self.env = self.env(context=dict(self.env.context, tracking_disable=False))
+        self.company.hotel_light_tracking = True
+        self.reservations = self.env['hotel.reservation'].create([
+            self._reservation_vals(self.rooms[0], self.start),
+            self._reservation_vals(self.rooms[1], self.start),
+        ])
+        self.flush_tracking()
+        self.setup_messages = self.reservations.message_ids
+
+    def flush_tracking(self):
+        self.env.flush_all()
+        self.env.cr.precommit.run()
+
+    def _tracked_fields(self, record):
+        """Fields tracked on ``record`` since setUp."""
+        messages = record.message_ids - self.setup_messages
+        return set(messages.tracking_value_ids.field_id.mapped('name'))
+
+    def test_curated_fields_only(self):
+        self.reservations[0].write({'status': 'checked_in', 'deposit_amount': 50.0})
+        self.flush_tracking()
+        self.assertEqual(self._tracked_fields(self.reservations[0]), {'status'})
+
+        self.company.hotel_light_tracking = False
+        self.reservations[1].write({'deposit_amount': 50.0})
+        self.flush_tracking()
+        self.assertEqual(self._tracked_fields(self.reservations[1]), {'deposit_amount'})
+
+    def test_system_write_silent_next_to_user_write(self):
+        user_stay, system_stay = self.reservations
+        messages = system_stay.message_ids
+        # a system write after a user write in the same transaction stays silent, and vice versa
+        user_stay.write({'status': 'checked_in'})
+        system_stay._hotel_system_writer(self.company).write({'status': 'checked_in'})
+        self.flush_tracking()
+        self.assertEqual(self._tracked_fields(user_stay), {'status'})
+        self.assertEqual(system_stay.message_ids, messages)
+
+        task = self.env['hotel.housekeeping.task']._hotel_system_writer(self.company).create({
+            'room_id': self.rooms[2].id, 'task_type': 'cleaning'})
+        self.flush_tracking()
+        self.assertFalse(task.message_ids)
+
+    def test_prune_old_noise(self):
+        self.company.hotel_light_tracking = False
+        stay = self.reservations[0]
+        stay.write({'deposit_amount': 50.0})
+        self.flush_tracking()
+        stay.write({'status': 'checked_in', 'total_amount': 120.0})
+        self.flush_tracking()
+        self.company.hotel_light_tracking = True
+        self.env.cr.execute("UPDATE mail_message SET create_date = %s WHERE model = 'hotel.reservation' AND res_id = %s",
+                            [fields.Datetime.now() - timedelta(days=200), stay.id])
+
+        self.assertGreater(self.env['mail.message'].cron_prune_hotel_tracking(days=90), 0)
+        stay.invalidate_recordset(['message_ids'])
+        # the deposit-only message is gone, the status change stays with its curated value only
+        self.assertEqual(self._tracked_fields(stay), {'status'})
+        self.assertEqual(len((stay.message_ids - self.setup_messages).filtered('tracking_value_ids')), 1)
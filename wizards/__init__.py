@@ -1,2 +1,3 @@
 from . import hotel_availability_wizard
-from . import hotel_event_availability_wizard
\ No newline at end of file
+from . import hotel_event_availability_wizard
+from . import hotel_reservation_import_wizard
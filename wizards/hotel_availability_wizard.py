@@ -25,42 +25,23 @@ class HotelAvailabilityWizard(models.TransientModel):
         for wiz in self:
             wiz.result_room_ids = [(6, 0, wiz._find_available_room_ids())]
 
-    def _active_reservation_domain(self, date_start, date_end):
-        # overlap: start < check_out AND end > check_in
-        return [
-            ('check_in', '<', date_end),
-            ('check_out', '>', date_start),
-            ('status', 'not in', ['cancelled']),
-        ]
+    def _availability_query(self):
+        self.ensure_one()
+        return {
+            'date_start': self.date_start,
+            'date_end': self.date_end,
+            'company_id': self.company_id.id,
+            'room_type_id': self.room_type_id.id,
+            'capacity_min': self.capacity_min,
+            'amenity_ids': self.amenity_ids.ids,
+            'max_price': self.max_price,
+        }
 
     def _find_available_room_ids(self):
         self.ensure_one()
-        domain = [('company_id', '=', self.company_id.id)]
-        if self.room_type_id:
-            domain += [('room_type_id', '=', self.room_type_id.id)]
-        if self.capacity_min:
-            domain += [('room_type_id.capacity', '>=', self.capacity_min)]
-        if self.max_price:
-            domain += ['|', ('price', '!=', False), ('price', '=', False)]
-            domain += ['|', ('price', '<=', self.max_price), ('room_type_id.default_price', '<=', self.max_price)]
-        if self.amenity_ids:
-            for amenity in self.amenity_ids:
-                domain += [('amenities_ids', 'in', amenity.id)]
-
-        rooms = self.env['hotel.room'].sudo().search(domain)
-        if not rooms:
+        if not (self.date_start and self.date_end):
             return []
-
-        # exclude rooms with overlapping reservations
-        res_domain = self._active_reservation_domain(self.date_start, self.date_end)
-        res_by_room = self.env['hotel.reservation'].sudo().read_group(
-            domain=res_domain + [('room_id', 'in', rooms.ids)],
-            fields=['room_id'],
-            groupby=['room_id']
-        )
-        occupied_room_ids = set([r['room_id'][0] for r in res_by_room if r.get('room_id')])
-        available_room_ids = [r.id for r in rooms if r.id not in occupied_room_ids]
-        return available_room_ids
+        return self.env['hotel.room'].get_availability_batch([self._availability_query()])[0]['room_ids']
 
     def action_open_results(self):
         self.ensure_one()
@@ -79,16 +60,19 @@ class HotelAvailabilityWizard(models.TransientModel):
     def action_create_reservation(self):
         self.ensure_one()
         # If exactly one room selected, create a draft reservation
+        Reservation = self.env['hotel.reservation']
         room_id = self.env.context.get('active_id')
         if not room_id:
-            # Fallback: pick the first available room
-            ids = self._find_available_room_ids()
-            room_id = ids and ids[0]
+            # Fallback: the available room this stay fragments the least
+            room_id = Reservation._best_fit_room_id(self._find_available_room_ids(), self.date_start, self.date_end)
         if not room_id:
             return False
-        res = self.env['hotel.reservation'].create({
+        res = Reservation.create({
             'guest_id': self.env.context.get('default_guest_id') or False,
             'room_id': room_id,
+            'company_id': self.company_id.id,
+            'guest_count': self.capacity_min or 1,
+            'required_amenity_ids': [(6, 0, self.amenity_ids.ids)],
             'check_in': self.date_start,
             'check_out': self.date_end,
             'status': 'draft',
@@ -1,4 +1,4 @@
-from odoo import models, fields, api
+from odoo import models, fields, api, Command
 from datetime import timedelta
 
 class HotelEventAvailabilityWizard(models.TransientModel):
@@ -8,7 +8,16 @@ class HotelEventAvailabilityWizard(models.TransientModel):
     company_id = fields.Many2one(
         'res.company', string="Branch",
         default=lambda self: self.env.company, required=True)
+    search_mode = fields.Selection([
+        ('fixed', 'At a Given Time'),
+        ('slots', 'Next Openings'),
+    ], string="Search", default='fixed', required=True)
     date_start = fields.Datetime(string="Event Start", required=True)
+    window_end = fields.Datetime(string="Search Until")
+    slot_limit = fields.Integer(string="Openings", default=10)
+    setup_minutes = fields.Integer(string="Setup (minutes)")
+    teardown_minutes = fields.Integer(string="Teardown (minutes)")
+    slot_ids = fields.One2many('hotel.event.availability.slot', 'wizard_id', string="Openings Found")
     duration_hours = fields.Float(string="Duration (hours)", required=True, default=4.0)
     date_end = fields.Datetime(string="Event End", compute="_compute_date_end", store=False)
     hall_type_id = fields.Many2one('hotel.event.hall.type', string="Hall Type")
@@ -47,10 +56,6 @@ class HotelEventAvailabilityWizard(models.TransientModel):
                 domain += [('amenities_ids', 'in', amenity.id)]
         return domain
 
-    def _overlap(self, start_a, end_a, start_b, end_b):
-        # Overlap if a.start < b.end AND b.start < a.end
-        return (start_a < end_b) and (start_b < end_a)
-
     def _find_available_hall_ids(self):
         self.ensure_one()
         if not (self.date_start and self.duration_hours):
@@ -64,22 +69,44 @@ class HotelEventAvailabilityWizard(models.TransientModel):
         if not halls:
             return []
 
-        # pull bookings on those halls that could overlap
-        bookings = self.env['hotel.event.booking'].sudo().search([
+        # only live bookings intersecting [start, end)
+        bookings = self.env['hotel.event.booking'].sudo().search_fetch([
             ('hall_id', 'in', halls.ids),
             ('status', '!=', 'cancelled'),
             ('event_date', '<', end),
-        ])
-
-        occupied = set()
-        for b in bookings:
-            b_end = (b.event_date or start) + timedelta(hours=b.duration_hours or 0.0)
-            if b.event_date and self._overlap(start, end, b.event_date, b_end):
-                occupied.add(b.hall_id.id)
+            ('event_end', '>', start),
+        ], ['hall_id'])
+        occupied = set(bookings.hall_id.ids)
 
         available_ids = [h.id for h in halls if h.id not in occupied]
         return available_ids
 
+    def action_find_slots(self):
+        self.ensure_one()
+        window_end = self.window_end or self.date_start + timedelta(days=30)
+        slots = self.env['hotel.event.hall'].find_free_slots(
+            self.date_start, window_end, self.duration_hours,
+            limit=self.slot_limit or 10,
+            setup_minutes=self.setup_minutes,
+            teardown_minutes=self.teardown_minutes,
+            company_id=self.company_id.id,
+            domain=self._candidate_hall_domain(),
+        )
+        self.slot_ids = [Command.clear()] + [Command.create({
+            'hall_id': slot['hall_id'],
+            'date_start': slot['start'],
+            'date_end': slot['end'],
+            'gap_end': slot['gap_end'],
+        }) for slot in slots]
+        return {
+            'name': 'Search Event Hall Availability',
+            'type': 'ir.actions.act_window',
+            'res_model': self._name,
+            'view_mode': 'form',
+            'res_id': self.id,
+            'target': 'new',
+        }
+
     def action_open_results(self):
         self.ensure_one()
         return {
@@ -102,11 +129,13 @@ class HotelEventAvailabilityWizard(models.TransientModel):
             hall_id = ids and ids[0]
         if not hall_id:
             return False
+        return self._create_booking(hall_id, self.date_start)
 
+    def _create_booking(self, hall_id, event_date):
         booking = self.env['hotel.event.booking'].create({
             'customer_id': self.env.context.get('default_customer_id') or False,
             'hall_id': hall_id,
-            'event_date': self.date_start,
+            'event_date': event_date,
             'duration_hours': self.duration_hours,
             'status': 'draft',
             'currency_id': self.currency_id.id,
@@ -119,3 +148,19 @@ class HotelEventAvailabilityWizard(models.TransientModel):
             'res_id': booking.id,
             'target': 'current',
         }
+
+
+class HotelEventAvailabilitySlot(models.TransientModel):
+    _name = "hotel.event.availability.slot"
+    _description = "Event Hall Opening"
+    _order = 'date_start, hall_id'
+
+    wizard_id = fields.Many2one('hotel.event.availability.wizard', required=True, ondelete='cascade')
+    hall_id = fields.Many2one('hotel.event.hall', string="Hall", required=True)
+    date_start = fields.Datetime(string="Start")
+    date_end = fields.Datetime(string="End")
+    gap_end = fields.Datetime(string="Free Until")
+
+    def action_book(self):
+        self.ensure_one()
+        return self.wizard_id._create_booking(self.hall_id.id, self.date_start)
@@ -0,0 +1,67 @@
+import io
+
+from odoo import models, fields
+from odoo.exceptions import UserError
+
+from ..models.hotel_reservation_import import iter_import_rows
+
+
+class HotelReservationImportWizard(models.TransientModel):
+    _name = "hotel.reservation.import.wizard"
+    _description = "Import Reservations"
+
+    company_id = fields.Many2one(
+        'res.company', string="Branch",
+        default=lambda self: self.env.company, required=True)
+    # kept as an attachment so the import streams it from the filestore
+    import_file = fields.Binary(string="File", required=True)
+    filename = fields.Char(string="File Name")
+    file_format = fields.Selection(
+        [('csv', 'CSV'), ('jsonl', 'JSON Lines')], string="Format", default='csv', required=True)
+    chunk_size = fields.Integer(string="Rows per Batch", default=1000)
+
+    state = fields.Selection([('draft', 'Draft'), ('done', 'Done')], default='draft')
+    imported_count = fields.Integer(string="Imported", readonly=True)
+    rejected_count = fields.Integer(string="Rejected", readonly=True)
+    duration = fields.Float(string="Duration (s)", readonly=True)
+    rows_per_second = fields.Float(string="Rows / s", readonly=True)
+    reject_log = fields.Text(string="Rejected Rows", readonly=True)
+
+    def action_import(self):
+        self.ensure_one()
+        if self.chunk_size <= 0:
+            raise UserError("Rows per batch must be positive.")
+        file_format = self.file_format
+        if self.filename and self.filename.endswith(('.jsonl', '.ndjson')):
+            file_format = 'jsonl'
+        Reservation = self.env['hotel.reservation']
+        attachment = self.env['ir.attachment'].sudo().search([
+            ('res_model', '=', self._name), ('res_field', '=', 'import_file'), ('res_id', '=', self.id),
+        ], limit=1)
+        if attachment.store_fname:
+            stats = Reservation._import_reservation_file(
+                attachment._full_path(attachment.store_fname), file_format=file_format,
+                company_id=self.company_id.id, chunk_size=self.chunk_size)
+        else:
+            # database-stored attachment
+            stream = io.TextIOWrapper(io.BytesIO(attachment.raw), encoding='utf-8-sig', newline='')
+            stats = Reservation._import_reservation_rows(
+                iter_import_rows(stream, file_format),
+                company_id=self.company_id.id, chunk_size=self.chunk_size)
+        self.write({
+            'state': 'done',
+            'import_file': False,
+            'imported_count': stats['imported'],
+            'rejected_count': stats['rejected'],
+            'duration': stats['seconds'],
+            'rows_per_second': stats['rows_per_second'],
+            'reject_log': "\n".join("Row %s: %s" % reject for reject in stats['rejects']),
+        })
+        return {
+            'name': 'Import Reservations',
+            'type': 'ir.actions.act_window',
+            'res_model': self._name,
+            'res_id': self.id,
+            'view_mode': 'form',
+            'target': 'new',
+        }